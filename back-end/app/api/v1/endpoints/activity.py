@@ -1,14 +1,30 @@
+from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.db.database import get_session
+from app.core.dependencies import check_path_user_etag
+from app.db.database import get_read_session
 from app.repositories.activity_repository import get_activities_by_user_id
 from app.schemas.activity_schema import ActivityOut
-from typing import List
+from app.utils.pagination import decode_cursor, set_next_cursor
+from app.utils.serialization import json_response
+from typing import List, Optional
 
 router = APIRouter()
 
-@router.get("/activities/user/{user_id}", response_model=List[ActivityOut])
-async def get_activities_for_user(user_id: int, db: AsyncSession = Depends(get_session)):
-    activities = await get_activities_by_user_id(user_id, db)
-    # Return empty list if no activities found (not an error)
-    return activities if activities else []
+@router.get(
+    "/activities/user/{user_id}",
+    response_model=List[ActivityOut],
+    dependencies=[Depends(check_path_user_etag)],
+    responses={304: {"description": "Not modified since the given ETag"}},
+)
+async def get_activities_for_user(
+    user_id: int,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_session),
+):
+    after = decode_cursor(cursor, datetime, int) if cursor else None
+    activities = await get_activities_by_user_id(user_id, db, limit=limit, after=after)
+    result = json_response(List[ActivityOut], activities)
+    set_next_cursor(result, activities, limit, lambda a: (a.created_at, a.id))
+    return result
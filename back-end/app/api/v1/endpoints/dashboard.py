@@ -0,0 +1,41 @@
+"""
+Dashboard endpoint for the overview screen
+"""
+
+from datetime import datetime, timezone
+from fastapi import APIRouter, Depends, Request, Response, status
+
+from app.schemas.dashboard_schema import DashboardResponse
+from app.services.dashboard_service import DashboardService
+from app.core.dependencies import get_current_principal, get_dashboard_service
+from app.core.principal_cache import Principal
+from app.utils.etag import etag_matches
+
+router = APIRouter()
+
+
+@router.get(
+    "",
+    response_model=DashboardResponse,
+    responses={304: {"description": "Dashboard unchanged since the given ETag"}},
+)
+async def get_dashboard(
+    request: Request,
+    response: Response,
+    dashboard_service: DashboardService = Depends(get_dashboard_service),
+    current_user: Principal = Depends(get_current_principal),
+):
+    """
+    Get everything the overview screen shows in one request
+
+    Send the previous response's ETag as If-None-Match; when nothing changed
+    the server answers 304 after a single aggregate query.
+    """
+    now = datetime.now(timezone.utc)
+    etag = await dashboard_service.get_etag(current_user.id, now)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return await dashboard_service.get_dashboard(current_user.id, now)
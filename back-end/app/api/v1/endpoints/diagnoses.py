@@ -2,65 +2,96 @@
 Diagnosis management endpoints
 """
 
-from typing import List
-from fastapi import APIRouter, Depends, status, HTTPException
-
-from app.schemas.diagnosis_schema import DiagnosisCreate, DiagnosisUpdate, DiagnosisResponse
+from datetime import datetime
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Query, status, HTTPException
+
+from app.schemas.diagnosis_schema import (
+    DiagnosisCreate,
+    DiagnosisUpdate,
+    DiagnosisResponse,
+    PlantHealthTrendResponse,
+)
 from app.services.diagnosis_service import DiagnosisService
-from app.core.dependencies import get_diagnosis_service, get_current_user
-from app.models.user import User
+from app.core.dependencies import (
+    check_current_user_etag,
+    get_current_principal,
+    get_diagnosis_service,
+    get_read_diagnosis_service,
+)
+from app.core.principal_cache import Principal
+from app.read_models.base import RowsResponse
+from app.utils.pagination import decode_cursor, set_next_cursor
 
 router = APIRouter()
 
 
-@router.get("/", response_model=List[DiagnosisResponse])
+@router.get(
+    "/",
+    response_model=List[DiagnosisResponse],
+    dependencies=[Depends(check_current_user_etag)],
+    responses={304: {"description": "Not modified since the given ETag"}},
+)
 async def get_all_diagnoses(
     skip: int = 0,
     limit: int = 100,
-    diagnosis_service: DiagnosisService = Depends(get_diagnosis_service),
-    current_user: User = Depends(get_current_user),
+    cursor: Optional[str] = None,
+    diagnosis_service: DiagnosisService = Depends(get_read_diagnosis_service),
+    current_user: Principal = Depends(get_current_principal),
 ):
     """
     Get all diagnoses for the current authenticated user
     Returns diagnoses for all plants owned by the user
+    Pass the X-Next-Cursor header of the previous page as ``cursor`` to page by keyset
     """
+    after = decode_cursor(cursor, datetime, int) if cursor else None
     diagnoses = await diagnosis_service.get_diagnoses_by_user(
-        user_id=current_user.id, skip=skip, limit=limit
+        user_id=current_user.id, skip=skip, limit=limit, after=after
     )
-    
-    # Add plant_name to each diagnosis
-    result = []
-    for diagnosis in diagnoses:
-        diag_dict = diagnosis.__dict__.copy()
-        if diagnosis.plant:
-            # Plant-linked diagnosis: use plant nickname from user's garden
-            diag_dict['plant_name'] = diagnosis.plant.plant_name
-        elif diagnosis.plant_common_name:
-            # Standalone diagnosis: use AI-identified common name
-            diag_dict['plant_name'] = diagnosis.plant_common_name
-        else:
-            # Fallback for old diagnoses without plant_common_name
-            diag_dict['plant_name'] = "Standalone Diagnosis"
-        result.append(diag_dict)
-    
+    result = RowsResponse(diagnoses)
+    set_next_cursor(result, diagnoses, limit, lambda d: (d.created_at, d.id))
     return result
 
 
-@router.get("/plant/{plant_id}", response_model=List[DiagnosisResponse])
+@router.get(
+    "/plant/{plant_id}",
+    response_model=List[DiagnosisResponse],
+    dependencies=[Depends(check_current_user_etag)],
+    responses={304: {"description": "Not modified since the given ETag"}},
+)
 async def get_diagnoses_by_plant(
     plant_id: int,
     skip: int = 0,
     limit: int = 100,
-    diagnosis_service: DiagnosisService = Depends(get_diagnosis_service),
-    current_user: User = Depends(get_current_user),
+    diagnosis_service: DiagnosisService = Depends(get_read_diagnosis_service),
+    current_user: Principal = Depends(get_current_principal),
 ):
     """
     Get all diagnoses for a specific plant
     Plant must belong to the current user
     """
-    return await diagnosis_service.get_diagnoses_by_plant(
+    diagnoses = await diagnosis_service.get_diagnoses_by_plant(
         plant_id=plant_id, user_id=current_user.id, skip=skip, limit=limit
     )
+    return RowsResponse(diagnoses)
+
+
+@router.get("/plant/{plant_id}/trend", response_model=PlantHealthTrendResponse)
+async def get_plant_health_trend(
+    plant_id: int,
+    limit: int = Query(30, ge=1, le=200),
+    diagnosis_service: DiagnosisService = Depends(get_read_diagnosis_service),
+    current_user: Principal = Depends(get_current_principal),
+):
+    """
+    Get whether a plant is recovering: a summary of its diagnosis history
+    and its latest ``limit`` diagnoses (oldest first) with severity changes
+    and a moving average of the confidence
+    Plant must belong to the current user
+    """
+    return await diagnosis_service.get_health_trend(
+        plant_id=plant_id, user_id=current_user.id, limit=limit
+    )
 
 
 @router.get("/user/{user_id}", response_model=List[DiagnosisResponse])
@@ -68,8 +99,9 @@ async def get_diagnoses_by_user_id(
     user_id: int,
     skip: int = 0,
     limit: int = 100,
-    diagnosis_service: DiagnosisService = Depends(get_diagnosis_service),
-    current_user: User = Depends(get_current_user),
+    cursor: Optional[str] = None,
+    diagnosis_service: DiagnosisService = Depends(get_read_diagnosis_service),
+    current_user: Principal = Depends(get_current_principal),
 ):
     """
     Get all diagnoses for a specific user
@@ -82,16 +114,20 @@ async def get_diagnoses_by_user_id(
             detail="Not authorized to access these diagnoses",
         )
 
-    return await diagnosis_service.get_diagnoses_by_user(
-        user_id=user_id, skip=skip, limit=limit
+    after = decode_cursor(cursor, datetime, int) if cursor else None
+    diagnoses = await diagnosis_service.get_diagnoses_by_user(
+        user_id=user_id, skip=skip, limit=limit, after=after
     )
+    result = RowsResponse(diagnoses)
+    set_next_cursor(result, diagnoses, limit, lambda d: (d.created_at, d.id))
+    return result
 
 
 @router.post("/", response_model=DiagnosisResponse, status_code=status.HTTP_201_CREATED)
 async def create_diagnosis(
     diagnosis_data: DiagnosisCreate,
     diagnosis_service: DiagnosisService = Depends(get_diagnosis_service),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     """
     Create a new diagnosis for a plant
@@ -102,35 +138,27 @@ async def create_diagnosis(
     )
 
 
-@router.get("/{diagnosis_id}", response_model=DiagnosisResponse)
+@router.get(
+    "/{diagnosis_id}",
+    response_model=DiagnosisResponse,
+    dependencies=[Depends(check_current_user_etag)],
+    responses={304: {"description": "Not modified since the given ETag"}},
+)
 async def get_diagnosis(
     diagnosis_id: int,
-    diagnosis_service: DiagnosisService = Depends(get_diagnosis_service),
-    current_user: User = Depends(get_current_user),
+    diagnosis_service: DiagnosisService = Depends(get_read_diagnosis_service),
+    current_user: Principal = Depends(get_current_principal),
 ):
     """
     Get a single diagnosis by ID
     Diagnosis must belong to a plant owned by the current user
     """
-    diagnosis = await diagnosis_service.get_diagnosis_by_id(
+    diagnosis = await diagnosis_service.get_diagnosis_row(
         diagnosis_id=diagnosis_id, user_id=current_user.id
     )
     if not diagnosis:
         raise HTTPException(status_code=404, detail="Diagnosis not found")
-    
-    # Add plant_name
-    diag_dict = diagnosis.__dict__.copy()
-    if diagnosis.plant:
-        # Plant-linked diagnosis: use plant nickname from user's garden
-        diag_dict['plant_name'] = diagnosis.plant.plant_name
-    elif diagnosis.plant_common_name:
-        # Standalone diagnosis: use AI-identified common name
-        diag_dict['plant_name'] = diagnosis.plant_common_name
-    else:
-        # Fallback for old diagnoses without plant_common_name
-        diag_dict['plant_name'] = "Standalone Diagnosis"
-    
-    return diag_dict
+    return RowsResponse(diagnosis)
 
 
 @router.put("/{diagnosis_id}", response_model=DiagnosisResponse)
@@ -138,7 +166,7 @@ async def update_diagnosis(
     diagnosis_id: int,
     diagnosis_data: DiagnosisUpdate,
     diagnosis_service: DiagnosisService = Depends(get_diagnosis_service),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     """
     Update a diagnosis
@@ -156,7 +184,7 @@ async def update_diagnosis(
 async def delete_diagnosis(
     diagnosis_id: int,
     diagnosis_service: DiagnosisService = Depends(get_diagnosis_service),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     """
     Delete a diagnosis
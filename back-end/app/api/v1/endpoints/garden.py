@@ -0,0 +1,51 @@
+"""
+Garden export and import endpoints
+"""
+
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
+
+from app.schemas.garden_transfer_schema import GardenImportResponse
+from app.services.garden_transfer_service import GardenExportService, GardenImportService
+from app.core.dependencies import (
+    get_current_principal,
+    get_garden_export_service,
+    get_garden_import_service,
+)
+from app.core.principal_cache import Principal
+from app.utils.ndjson import NDJSON_MEDIA_TYPE
+
+router = APIRouter()
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_garden(
+    export_service: GardenExportService = Depends(get_garden_export_service),
+    current_user: Principal = Depends(get_current_principal),
+):
+    """
+    Stream the current user's plants, diagnoses and activities as NDJSON
+
+    The response can be sent back unchanged to ``POST /garden/import``.
+    """
+    return StreamingResponse(
+        export_service.export_lines(current_user.id),
+        media_type=NDJSON_MEDIA_TYPE,
+        headers={"Content-Disposition": 'attachment; filename="garden.ndjson"'},
+    )
+
+
+@router.post("/import", response_model=GardenImportResponse)
+async def import_garden(
+    request: Request,
+    import_service: GardenImportService = Depends(get_garden_import_service),
+    current_user: Principal = Depends(get_current_principal),
+):
+    """
+    Import an NDJSON garden export into the current user's account
+
+    The body is read as a stream, so large exports are never held in memory.
+    All records are imported in one transaction; a bad line rejects the
+    import with 400 and the line number.
+    """
+    return await import_service.import_lines(current_user.id, request.stream())
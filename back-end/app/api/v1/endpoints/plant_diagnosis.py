@@ -4,8 +4,8 @@ Plant diagnosis endpoints using AI
 
 import base64
 from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, status
-from app.models.user import User
-from app.core.dependencies import get_current_user, get_diagnosis_service, get_profile_service
+from app.core.principal_cache import Principal
+from app.core.dependencies import get_current_principal, get_diagnosis_service, get_profile_service
 from app.services.diagnosis_ai_service import diagnosis_ai_service
 from app.services.diagnosis_service import DiagnosisService
 from app.services.profile_service import ProfileService
@@ -20,7 +20,7 @@ router = APIRouter(tags=["AI Plant Diagnosis"])
 @router.post("/diagnose", response_model=DiagnosisResponse, status_code=status.HTTP_201_CREATED)
 async def diagnose_plant(
     file: UploadFile = File(...),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     diagnosis_service: DiagnosisService = Depends(get_diagnosis_service),
     profile_service: ProfileService = Depends(get_profile_service),
 ):
@@ -4,8 +4,8 @@ Plant identification endpoints using AI
 
 import base64
 from fastapi import APIRouter, Depends, UploadFile, File, HTTPException
-from app.models.user import User
-from app.core.dependencies import get_current_user, get_plant_species_service
+from app.core.principal_cache import Principal
+from app.core.dependencies import get_current_principal, get_plant_species_service
 from app.services.ai_service import ai_service
 from app.services.plant_species_service import PlantSpeciesService
 from app.schemas.plant_species_schema import PlantSpeciesCreate
@@ -25,7 +25,7 @@ class PlantIdentificationResponse(BaseModel):
 @router.post("/identify", response_model=PlantIdentificationResponse)
 async def identify_plant(
     file: UploadFile = File(...),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     plant_species_service: PlantSpeciesService = Depends(get_plant_species_service),
 ):
     """
@@ -2,35 +2,66 @@
 Plant management endpoints
 """
 
-from typing import List
-from fastapi import APIRouter, Depends, status, HTTPException
-
-from app.schemas.plant_schema import PlantCreate, PlantUpdate, PlantResponse
+from datetime import datetime
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Query, status, HTTPException
+
+from app.schemas.plant_schema import (
+    GardenHealthResponse,
+    PlantCreate,
+    PlantUpdate,
+    PlantResponse,
+    WaterPlantsRequest,
+    WateredPlantResponse,
+)
 from app.services.plant_service import PlantService
-from app.core.dependencies import get_plant_service, get_current_user
-from app.models.user import User
+from app.core.dependencies import (
+    check_current_user_etag,
+    get_current_principal,
+    get_plant_service,
+    get_read_plant_service,
+)
+from app.core.principal_cache import Principal
+from app.read_models.base import RowsResponse
+from app.utils.pagination import decode_cursor, set_next_cursor
 
 router = APIRouter()
 
 
-@router.get("", response_model=List[PlantResponse])
+@router.get(
+    "",
+    response_model=List[PlantResponse],
+    dependencies=[Depends(check_current_user_etag)],
+    responses={304: {"description": "Not modified since the given ETag"}},
+)
 async def list_my_plants(
     skip: int = 0,
     limit: int = 100,
-    plant_service: PlantService = Depends(get_plant_service),
-    current_user: User = Depends(get_current_user),
+    cursor: Optional[str] = None,
+    plant_service: PlantService = Depends(get_read_plant_service),
+    current_user: Principal = Depends(get_current_principal),
 ):
     """
     Get all plants for the current authenticated user
+
+    Pass the X-Next-Cursor header of the previous page as ``cursor`` to
+    page with a keyset instead of ``skip``. Rows are serialized directly
+    from read-model rows; response_model only documents the shape.
     """
-    return await plant_service.get_user_plants(user_id=current_user.id, skip=skip, limit=limit)
+    after = decode_cursor(cursor, int) if cursor else None
+    plants = await plant_service.get_user_plants(
+        user_id=current_user.id, skip=skip, limit=limit, after=after
+    )
+    result = RowsResponse(plants)
+    set_next_cursor(result, plants, limit, lambda plant: (plant.id,))
+    return result
 
 
 @router.post("", response_model=PlantResponse, status_code=status.HTTP_201_CREATED)
 async def create_plant(
     plant_data: PlantCreate,
     plant_service: PlantService = Depends(get_plant_service),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     """
     Create a new plant for the current user
@@ -38,11 +69,82 @@ async def create_plant(
     return await plant_service.create_plant(user_id=current_user.id, data=plant_data)
 
 
-@router.get("/{plant_id}", response_model=PlantResponse)
+@router.post("/water", response_model=List[WateredPlantResponse])
+async def water_plants(
+    data: WaterPlantsRequest,
+    plant_service: PlantService = Depends(get_plant_service),
+    current_user: Principal = Depends(get_current_principal),
+):
+    """
+    Mark several plants as watered at once
+
+    All plants must belong to the current user; otherwise nothing is
+    watered and 404 is returned.
+    """
+    return await plant_service.water_plants(data.plant_ids, current_user.id)
+
+
+@router.get("/due", response_model=List[PlantResponse])
+async def list_due_plants(
+    within_hours: int = Query(24, ge=0, le=24 * 30),
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    plant_service: PlantService = Depends(get_read_plant_service),
+    current_user: Principal = Depends(get_current_principal),
+):
+    """
+    Get the current user's plants due for water within ``within_hours``
+
+    Overdue plants come first, then the soonest due. Plants whose species
+    has no watering interval are never listed. Page with the X-Next-Cursor
+    header like the plant list.
+    """
+    after = decode_cursor(cursor, datetime, int) if cursor else None
+    plants = await plant_service.get_due_plants(
+        user_id=current_user.id, within_hours=within_hours, limit=limit, after=after
+    )
+    result = RowsResponse(plants)
+    set_next_cursor(result, plants, limit, lambda plant: (plant.next_water_at, plant.id))
+    return result
+
+
+@router.get("/health", response_model=GardenHealthResponse)
+async def get_garden_health(
+    plant_service: PlantService = Depends(get_read_plant_service),
+    current_user: Principal = Depends(get_current_principal),
+):
+    """
+    Count the current user's plants by watering state (on time, overdue, never watered)
+    """
+    return await plant_service.get_garden_health(current_user.id)
+
+
+@router.get("/health/users", response_model=List[GardenHealthResponse])
+async def get_garden_health_for_users(
+    user_ids: List[int] = Query(..., alias="user_id", max_length=1000),
+    plant_service: PlantService = Depends(get_read_plant_service),
+    current_user: Principal = Depends(get_current_principal),
+):
+    """
+    Garden health for many users in one query (superusers only)
+
+    Pass ``user_id`` once per user, e.g. ``?user_id=1&user_id=2``.
+    """
+    if not current_user.is_superuser:
+        raise HTTPException(status_code=403, detail="Not authorized to view other users' gardens")
+    return await plant_service.get_garden_health_for_users(user_ids)
+
+
+@router.get(
+    "/{plant_id}",
+    response_model=PlantResponse,
+    dependencies=[Depends(check_current_user_etag)],
+    responses={304: {"description": "Not modified since the given ETag"}},
+)
 async def get_plant(
     plant_id: int,
-    plant_service: PlantService = Depends(get_plant_service),
-    current_user: User = Depends(get_current_user),
+    plant_service: PlantService = Depends(get_read_plant_service),
+    current_user: Principal = Depends(get_current_principal),
 ):
     """
     Get a single plant by ID (must belong to the current user)
@@ -58,7 +160,7 @@ async def update_plant(
     plant_id: int,
     plant_data: PlantUpdate,
     plant_service: PlantService = Depends(get_plant_service),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     """
     Update a plant (must belong to the current user)
@@ -75,7 +177,7 @@ async def update_plant(
 async def delete_plant(
     plant_id: int,
     plant_service: PlantService = Depends(get_plant_service),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     """
     Delete a plant (must belong to the current user)
@@ -90,7 +192,7 @@ async def delete_plant(
 async def water_plant(
     plant_id: int,
     plant_service: PlantService = Depends(get_plant_service),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     """
     Mark a plant as watered (updates last_watered to now and creates activity log)
@@ -1,15 +1,22 @@
 """
 PlantSpecies management endpoints
 """
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from app.schemas.plant_species_schema import (
-    PlantSpeciesCreate, PlantSpeciesUpdate, PlantSpeciesResponse
+    PlantSpeciesCreate, PlantSpeciesUpdate, PlantSpeciesResponse, SpeciesSearchResult
 )
 from app.services.plant_species_service import PlantSpeciesService
-from app.core.dependencies import get_current_user, get_plant_species_service
-from app.models.user import User
+from app.core.dependencies import (
+    get_current_principal,
+    get_plant_species_service,
+    get_read_plant_species_service,
+)
+from app.core.principal_cache import Principal
+from app.read_models.base import RowsResponse
+from app.utils.pagination import decode_cursor, set_next_cursor
+from app.utils.serialization import json_response
 
 router = APIRouter()
 
@@ -17,36 +24,54 @@ router = APIRouter()
 async def list_species(
     skip: int = 0,
     limit: int = 100,
-    svc: PlantSpeciesService = Depends(get_plant_species_service),
-    _: User = Depends(get_current_user),  # require auth; remove if you want public
+    cursor: Optional[str] = None,
+    svc: PlantSpeciesService = Depends(get_read_plant_species_service),
+    _: Principal = Depends(get_current_principal),  # require auth; remove if you want public
 ):
-    return await svc.list(skip=skip, limit=limit)
+    after = decode_cursor(cursor, str, int) if cursor else None
+    species = await svc.list(skip=skip, limit=limit, after=after)
+    result = RowsResponse(species)
+    set_next_cursor(result, species, limit, lambda s: (s.common_name, s.id))
+    return result
+
+@router.get("/search", response_model=List[SpeciesSearchResult])
+async def search_species(
+    q: str = Query(..., min_length=2, max_length=100),
+    limit: int = Query(20, ge=1, le=50),
+    svc: PlantSpeciesService = Depends(get_read_plant_species_service),
+    _: Principal = Depends(get_current_principal),
+):
+    """
+    Typo-tolerant species search by common or scientific name, best match first
+    """
+    results = await svc.search(q, limit=limit)
+    return json_response(List[SpeciesSearchResult], results)
 
 @router.post("/", response_model=PlantSpeciesResponse, status_code=status.HTTP_201_CREATED)
 async def create_species(
     payload: PlantSpeciesCreate,
     svc: PlantSpeciesService = Depends(get_plant_species_service),
-    _: User = Depends(get_current_user),
+    _: Principal = Depends(get_current_principal),
 ):
     return await svc.create(payload)
 
 @router.get("/{species_id}", response_model=PlantSpeciesResponse)
 async def get_species(
     species_id: int,
-    svc: PlantSpeciesService = Depends(get_plant_species_service),
-    _: User = Depends(get_current_user),
+    svc: PlantSpeciesService = Depends(get_read_plant_species_service),
+    _: Principal = Depends(get_current_principal),
 ):
     obj = await svc.get_by_id(species_id)
     if not obj:
         raise HTTPException(status_code=404, detail="Species not found")
-    return obj
+    return RowsResponse(obj)
 
 @router.put("/{species_id}", response_model=PlantSpeciesResponse)
 async def update_species(
     species_id: int,
     payload: PlantSpeciesUpdate,
     svc: PlantSpeciesService = Depends(get_plant_species_service),
-    _: User = Depends(get_current_user),
+    _: Principal = Depends(get_current_principal),
 ):
     return await svc.update(species_id, payload)
 
@@ -54,7 +79,7 @@ async def update_species(
 async def delete_species(
     species_id: int,
     svc: PlantSpeciesService = Depends(get_plant_species_service),
-    _: User = Depends(get_current_user),
+    _: Principal = Depends(get_current_principal),
 ):
     await svc.delete(species_id)
     return
@@ -6,18 +6,23 @@ from fastapi import APIRouter, Depends, status
 
 from app.schemas.profile_schema import ProfileResponse, ProfileUpdate
 from app.services.profile_service import ProfileService
-from app.core.dependencies import get_profile_service, get_current_user
-from app.models.user import User
+from app.core.dependencies import check_path_user_etag, get_current_principal, get_profile_service
+from app.core.principal_cache import Principal
 
 
 router = APIRouter()
 
 
-@router.get("/user/{user_id}", response_model=ProfileResponse)
+@router.get(
+    "/user/{user_id}",
+    response_model=ProfileResponse,
+    dependencies=[Depends(get_current_principal), Depends(check_path_user_etag)],
+    responses={304: {"description": "Not modified since the given ETag"}},
+)
 async def get_profile_by_user_id(
     user_id: int,
     profile_service: ProfileService = Depends(get_profile_service),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     """
     Get profile by user ID (requires authentication)
@@ -39,7 +44,7 @@ async def create_profile_by_user_id(
     user_id: int,
     profile_data: ProfileUpdate,
     profile_service: ProfileService = Depends(get_profile_service),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     """
     Create a new profile for a user (requires authentication)
@@ -70,7 +75,7 @@ async def update_profile_by_user_id(
     user_id: int,
     profile_data: ProfileUpdate,
     profile_service: ProfileService = Depends(get_profile_service),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     """
     Update profile by user ID (requires authentication)
@@ -0,0 +1,50 @@
+"""
+Delta sync and batched mutation endpoints for the mobile client
+"""
+
+from typing import Optional
+from fastapi import APIRouter, Depends
+
+from app.schemas.mutation_schema import MutationBatchRequest, MutationBatchResponse
+from app.schemas.sync_schema import SyncResponse
+from app.services.mutation_service import MutationService
+from app.services.sync_service import SyncService
+from app.core.dependencies import get_current_principal, get_mutation_service, get_sync_service
+from app.core.principal_cache import Principal
+from app.read_models.base import RowsResponse
+
+router = APIRouter()
+
+
+@router.get("", response_model=SyncResponse)
+async def sync(
+    since: Optional[str] = None,
+    sync_service: SyncService = Depends(get_sync_service),
+    current_user: Principal = Depends(get_current_principal),
+):
+    """
+    Get the current user's plants, diagnoses and profile changed since ``since``
+
+    Pass the ``watermark`` of the previous sync as ``since``; leave it out
+    for a full sync. Rows near the watermark may be sent twice, so apply
+    them as upserts. Rows are serialized directly from read-model rows;
+    response_model only documents the shape.
+    """
+    return RowsResponse(await sync_service.get_changes(current_user.id, since))
+
+
+@router.post("/mutations", response_model=MutationBatchResponse)
+async def apply_mutations(
+    batch: MutationBatchRequest,
+    mutation_service: MutationService = Depends(get_mutation_service),
+    current_user: Principal = Depends(get_current_principal),
+):
+    """
+    Apply the client's queued operations in order, in one transaction
+
+    Each result carries the status its single-operation endpoint would
+    have answered; a failed operation is rolled back alone and the others
+    still apply. Resending a batch is safe: operations whose ``client_id``
+    was already applied are replayed, not applied again.
+    """
+    return {"results": await mutation_service.apply(current_user.id, batch.operations)}
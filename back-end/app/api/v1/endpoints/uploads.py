@@ -3,8 +3,8 @@ File upload endpoints for images
 """
 
 from fastapi import APIRouter, Depends, UploadFile, File, HTTPException
-from app.models.user import User
-from app.core.dependencies import get_current_user, get_user_service, get_plant_service
+from app.core.principal_cache import Principal
+from app.core.dependencies import get_current_principal, get_user_service, get_plant_service
 from app.services.storage_service import storage_service
 from app.services.user_service import UserService
 from app.services.plant_service import PlantService
@@ -20,7 +20,7 @@ router = APIRouter(prefix="/uploads", tags=["Uploads"])
 async def upload_plant_image(
     plant_id: int,
     file: UploadFile = File(...),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     plant_service: PlantService = Depends(get_plant_service),
 ):
     """
@@ -69,7 +69,7 @@ async def upload_plant_image(
 @router.post("/diagnosis/image", response_model=Dict[str, str])
 async def upload_diagnosis_image(
     file: UploadFile = File(...),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     """
     Upload diagnosis image to Supabase Storage
@@ -2,19 +2,33 @@
 User management endpoints
 """
 
-from typing import List
-from fastapi import APIRouter, Depends, status
+from typing import List, Optional
+from fastapi import APIRouter, BackgroundTasks, Depends, Response, status
+from sqlalchemy.ext.asyncio import async_sessionmaker
 
 from app.schemas.user_schema import UserResponse, UserUpdate
-from app.services.user_service import UserService
-from app.core.dependencies import get_user_service, get_current_user
+from app.services.user_service import UserService, purge_account
+from app.core.dependencies import (
+    check_current_user_etag,
+    get_current_principal,
+    get_current_user,
+    get_user_service,
+)
+from app.core.principal_cache import Principal
+from app.db.database import get_session_factory
+from app.utils.pagination import decode_cursor, set_next_cursor
 from app.models.user import User
 
 
 router = APIRouter()
 
 
-@router.get("/me", response_model=UserResponse)
+@router.get(
+    "/me",
+    response_model=UserResponse,
+    dependencies=[Depends(check_current_user_etag)],
+    responses={304: {"description": "Not modified since the given ETag"}},
+)
 async def get_current_user_info(current_user: User = Depends(get_current_user)):
     """
     Get current authenticated user information
@@ -30,10 +44,12 @@ async def get_current_user_info(current_user: User = Depends(get_current_user)):
 
 @router.get("/", response_model=List[UserResponse])
 async def get_users(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     user_service: UserService = Depends(get_user_service),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     """
     Get all users (requires authentication)
@@ -41,13 +57,16 @@ async def get_users(
     Args:
         skip: Number of records to skip
         limit: Maximum number of records
+        cursor: X-Next-Cursor value of the previous page (replaces skip)
         user_service: User service instance
         current_user: Currently authenticated user
 
     Returns:
         List of users
     """
-    users = await user_service.get_all_users(skip=skip, limit=limit)
+    after = decode_cursor(cursor, int) if cursor else None
+    users = await user_service.get_all_users(skip=skip, limit=limit, after=after)
+    set_next_cursor(response, users, limit, lambda user: (user.id,))
     return users
 
 
@@ -55,7 +74,7 @@ async def get_users(
 async def get_user(
     user_id: int,
     user_service: UserService = Depends(get_user_service),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     """
     Get user by ID (requires authentication)
@@ -81,7 +100,7 @@ async def update_user(
     user_id: int,
     user_data: UserUpdate,
     user_service: UserService = Depends(get_user_service),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
 ):
     """
     Update user information (requires authentication)
@@ -107,19 +126,33 @@ async def update_user(
     return user
 
 
-@router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete(
+    "/{user_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses={status.HTTP_202_ACCEPTED: {"description": "User deactivated and queued for deletion"}},
+)
 async def delete_user(
     user_id: int,
+    background_tasks: BackgroundTasks,
+    background: bool = False,
     user_service: UserService = Depends(get_user_service),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
+    session_factory: async_sessionmaker = Depends(get_session_factory),
 ):
     """
     Delete a user (requires authentication and superuser privileges)
 
+    With ``background=true`` the user is deactivated at once and answered
+    with 202; their data is then removed in small batches after the
+    response, and their images are queued for storage cleanup.
+
     Args:
         user_id: User ID
+        background_tasks: Tasks run after the response
+        background: Delete in the background instead of in this request
         user_service: User service instance
         current_user: Currently authenticated user
+        session_factory: Session factory for the background deletion
     """
     # Only superusers can delete users
     if not current_user.is_superuser:
@@ -127,4 +160,9 @@ async def delete_user(
 
         raise HTTPException(status_code=403, detail="Not authorized to delete users")
 
+    if background:
+        await user_service.request_user_deletion(user_id)
+        background_tasks.add_task(purge_account, session_factory, user_id)
+        return Response(status_code=status.HTTP_202_ACCEPTED)
+
     await user_service.delete_user(user_id)
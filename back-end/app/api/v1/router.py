@@ -4,7 +4,7 @@ Main API router aggregating all endpoint routers
 
 from fastapi import APIRouter
 
-from app.api.v1.endpoints import users, plants, plants_spieces, auth, diagnoses, uploads, plant_identification, plant_diagnosis, profiles, activity
+from app.api.v1.endpoints import users, plants, plants_spieces, auth, diagnoses, uploads, plant_identification, plant_diagnosis, profiles, activity, dashboard, garden, sync
 
 api_router = APIRouter()
 # Include all endpoint routers
@@ -19,6 +19,9 @@ api_router.include_router(plant_diagnosis.router, prefix="/plants", tags=["AI"])
 
 api_router.include_router(profiles.router, prefix="/profiles", tags=["profiles"])
 api_router.include_router(activity.router, tags=["activity"])
+api_router.include_router(dashboard.router, prefix="/dashboard", tags=["dashboard"])
+api_router.include_router(garden.router, prefix="/garden", tags=["garden"])
+api_router.include_router(sync.router, prefix="/sync", tags=["sync"])
 
 # Add more routers here as the application grows
 # api_router.include_router(items.router, prefix="/items", tags=["Items"])
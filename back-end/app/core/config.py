@@ -24,16 +24,45 @@ class Settings(BaseSettings):
 
     # Database (Supabase PostgreSQL)
     DATABASE_URL: str
+    DATABASE_REPLICA_URL: str = ""
+    DB_REPLICA_STICKY_SECONDS: int = 10
     DB_CONNECTION_TIMEOUT: int = 120
     DB_COMMAND_TIMEOUT: int = 120
     DB_POOL_SIZE: int = 5
     DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = False
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    DB_COMPILE_CACHE_SIZE: int = 500
+    DB_SLOW_QUERY_MS: int = 200
+    DB_N_PLUS_ONE_THRESHOLD: int = 5
     DB_SSL_VERIFY: bool = True
 
     # Security
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 1440
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 10000
+    SPECIES_SEARCH_INDEX_TTL_SECONDS: int = 300
+    SPECIES_CACHE_POLL_SECONDS: float = 5.0
+
+    # Activity log: partitions created ahead, months kept live, feed read window
+    ACTIVITY_PARTITION_MONTHS_AHEAD: int = 3
+    ACTIVITY_RETENTION_MONTHS: int = 12
+    ACTIVITY_FEED_WINDOW_MONTHS: int = 3
+
+    # Background account deletion: rows removed per transaction
+    ACCOUNT_DELETION_BATCH_SIZE: int = 500
+    # Attempts before a queued image removal is given up on
+    STORAGE_CLEANUP_MAX_ATTEMPTS: int = 5
+
+    # Delta sync: deletions are reported for this long, after which older
+    # watermarks get a full sync; each watermark reaches back this many
+    # seconds so rows of transactions still committing are not skipped
+    SYNC_TOMBSTONE_RETENTION_DAYS: int = 30
+    SYNC_WATERMARK_OVERLAP_SECONDS: int = 60
 
     # CORS
     ALLOWED_ORIGINS: List[str] = ["http://localhost:3000"]
@@ -2,13 +2,14 @@
 Dependency injection for FastAPI endpoints
 """
 
-from typing import AsyncGenerator, Optional
-from fastapi import Depends, HTTPException, status
+from typing import AsyncGenerator, Optional, Tuple
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.db.database import get_session
+from app.db.database import get_read_session, get_read_session_factory, get_session
 from app.core.security import decode_access_token
+from app.core.principal_cache import Principal, principal_cache
 from app.repositories.user_repository import UserRepository
 from app.services.user_service import UserService
 from app.models.user import User
@@ -20,6 +21,14 @@ from app.repositories.diagnosis_repository import DiagnosisRepository
 from app.services.diagnosis_service import DiagnosisService
 from app.repositories.profile_repository import ProfileRepository
 from app.services.profile_service import ProfileService
+from app.services.dashboard_service import DashboardService
+from app.repositories.garden_transfer_repository import GardenTransferRepository
+from app.services.garden_transfer_service import GardenExportService, GardenImportService
+from app.repositories.user_data_version_repository import UserDataVersionRepository
+from app.services.sync_service import SyncService
+from app.repositories.mutation_repository import MutationRepository
+from app.services.mutation_service import MutationService
+from app.utils.etag import etag_matches, make_etag
 
 
 # Security
@@ -58,54 +67,122 @@ async def get_user_service(
     return UserService(repository)
 
 
-async def get_current_user(
+def _credentials_exception(detail: str) -> HTTPException:
+    """
+    Build the 401 error raised for unusable credentials
+    """
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def _decode_credentials(credentials: HTTPAuthorizationCredentials) -> Tuple[int, int]:
+    """
+    Decode a bearer token into its user ID and token version
+
+    Args:
+        credentials: HTTP authorization credentials
+
+    Returns:
+        Tuple of (user_id, token_version)
+
+    Raises:
+        HTTPException: If token is invalid
+    """
+    payload = decode_access_token(credentials.credentials)
+    if payload is None:
+        raise _credentials_exception("Invalid authentication credentials")
+
+    user_id: Optional[str] = payload.get("sub")
+    if user_id is None:
+        raise _credentials_exception("Invalid authentication credentials")
+
+    # Tokens issued before token versioning carry no "ver" claim
+    return int(user_id), int(payload.get("ver", 0))
+
+
+def _check_principal(principal: Optional[Principal], token_version: int) -> Principal:
+    """
+    Validate that a principal may use a token
+
+    Raises:
+        HTTPException: If the user is missing, inactive or the token was revoked
+    """
+    if principal is None:
+        raise _credentials_exception("User not found")
+    if not principal.is_active:
+        raise _credentials_exception("Inactive user")
+    if principal.token_version != token_version:
+        raise _credentials_exception("Token has been revoked")
+    return principal
+
+
+async def get_current_principal(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     user_service: UserService = Depends(get_user_service),
-) -> User:
+) -> Principal:
     """
-    Get current authenticated user from JWT token
+    Get the current authenticated principal from JWT token
+
+    Served from the principal cache, so endpoints that only need the user's
+    ID or permissions normally do not query the users table at all.
 
     Args:
         credentials: HTTP authorization credentials
         user_service: User service
 
     Returns:
-        Current user
+        Current principal
 
     Raises:
         HTTPException: If token is invalid or user not found
     """
-    token = credentials.credentials
-    payload = decode_access_token(token)
+    user_id, token_version = _decode_credentials(credentials)
+    principal = await user_service.get_principal(user_id)
+    return _check_principal(principal, token_version)
 
 
-    
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    user_service: UserService = Depends(get_user_service),
+) -> User:
+    """
+    Get current authenticated user from JWT token
 
-    if payload is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authentication credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    Loads the full User model; prefer get_current_principal when only the
+    user's ID or permissions are needed.
 
-    user_id: Optional[str] = payload.get("sub")
-    if user_id is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authentication credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    Args:
+        credentials: HTTP authorization credentials
+        user_service: User service
+
+    Returns:
+        Current user
 
-    user = await user_service.get_user_by_id(int(user_id))
+    Raises:
+        HTTPException: If token is invalid or user not found
+    """
+    user_id, token_version = _decode_credentials(credentials)
+    user = await user_service.get_user_by_id(user_id)
     if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise _credentials_exception("User not found")
 
+    principal = Principal.from_user(user)
+    _check_principal(principal, token_version)
+    principal_cache.set(principal)
     return user
 
+async def get_profile_repository(
+    session: AsyncSession = Depends(get_session),
+) -> ProfileRepository:
+    """
+    Get profile repository instance
+    """
+    return ProfileRepository(session)
+
+
 async def get_plant_repository(
     session: AsyncSession = Depends(get_session),
 ) -> PlantRepository:
@@ -117,11 +194,20 @@ async def get_plant_repository(
 
 async def get_plant_service(
     repository: PlantRepository = Depends(get_plant_repository),
+    profile_repository: ProfileRepository = Depends(get_profile_repository),
 ) -> PlantService:
     """
     Get plant service instance
     """
-    return PlantService(repository)
+    return PlantService(repository, profile_repository)
+
+async def get_read_plant_service(
+    session: AsyncSession = Depends(get_read_session),
+) -> PlantService:
+    """
+    Get plant service instance for read-only endpoints
+    """
+    return PlantService(PlantRepository(session), ProfileRepository(session))
 
 async def get_plant_species_repository(
 
@@ -134,11 +220,21 @@ async def get_plant_species_repository(
 
 async def get_plant_species_service(
     repository: PlantSpeciesRepository = Depends(get_plant_species_repository),
+    plant_repository: PlantRepository = Depends(get_plant_repository),
 ) -> PlantSpeciesService:
     """
     Get plant species service instance
     """
-    return PlantSpeciesService(repository)
+    return PlantSpeciesService(repository, plant_repository)
+
+
+async def get_read_plant_species_service(
+    session: AsyncSession = Depends(get_read_session),
+) -> PlantSpeciesService:
+    """
+    Get plant species service instance for read-only endpoints
+    """
+    return PlantSpeciesService(PlantSpeciesRepository(session), PlantRepository(session))
 
 
 async def get_diagnosis_repository(
@@ -160,13 +256,13 @@ async def get_diagnosis_service(
     return DiagnosisService(diagnosis_repository, plant_repository)
 
 
-async def get_profile_repository(
-    session: AsyncSession = Depends(get_session),
-) -> ProfileRepository:
+async def get_read_diagnosis_service(
+    session: AsyncSession = Depends(get_read_session),
+) -> DiagnosisService:
     """
-    Get profile repository instance
+    Get diagnosis service instance for read-only endpoints
     """
-    return ProfileRepository(session)
+    return DiagnosisService(DiagnosisRepository(session), PlantRepository(session))
 
 
 async def get_profile_service(
@@ -179,3 +275,100 @@ async def get_profile_service(
     """
     return ProfileService(profile_repository, user_repository, plant_repository)
 
+
+async def get_dashboard_service(
+    session_factory: async_sessionmaker = Depends(get_read_session_factory),
+) -> DashboardService:
+    """
+    Get dashboard service instance
+    """
+    return DashboardService(session_factory)
+
+
+async def get_garden_export_service(
+    session_factory: async_sessionmaker = Depends(get_read_session_factory),
+) -> GardenExportService:
+    """
+    Get garden export service instance
+    """
+    return GardenExportService(session_factory)
+
+
+async def get_garden_import_service(
+    session: AsyncSession = Depends(get_session),
+) -> GardenImportService:
+    """
+    Get garden import service instance
+    """
+    return GardenImportService(
+        GardenTransferRepository(session), ProfileRepository(session), PlantRepository(session)
+    )
+
+
+async def get_sync_service(
+    session: AsyncSession = Depends(get_session),
+    profile_service: ProfileService = Depends(get_profile_service),
+) -> SyncService:
+    """
+    Get sync service instance
+    """
+    return SyncService(session, profile_service)
+
+
+async def get_mutation_service(
+    session: AsyncSession = Depends(get_session),
+    plant_service: PlantService = Depends(get_plant_service),
+    diagnosis_service: DiagnosisService = Depends(get_diagnosis_service),
+) -> MutationService:
+    """
+    Get mutation service instance
+    """
+    return MutationService(plant_service, diagnosis_service, MutationRepository(session))
+
+
+async def _check_user_etag(request: Request, user_id: int, session: AsyncSession) -> None:
+    """
+    Answer a conditional GET of a user's data from their data version
+
+    The ETag covers the URL and the user's data version, which every write
+    to the user's data bumps, so equal tags mean an identical response.
+    It is stored on ``request.state`` for ConditionalGetMiddleware to send.
+
+    Raises:
+        HTTPException: 304 if the client's If-None-Match is current
+    """
+    version = await UserDataVersionRepository(session).get(user_id)
+    etag = make_etag(request.url.path, request.url.query, user_id, version, weak=False)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        raise HTTPException(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag, "Cache-Control": "private, no-cache"},
+        )
+    request.state.etag = etag
+
+
+async def check_current_user_etag(
+    request: Request,
+    current_user: Principal = Depends(get_current_principal),
+    session: AsyncSession = Depends(get_read_session),
+) -> None:
+    """
+    Conditional GET for endpoints returning the current user's data
+
+    Add to a route's ``dependencies``; a current If-None-Match is answered
+    with 304 before the endpoint runs any query.
+    """
+    await _check_user_etag(request, current_user.id, session)
+
+
+async def check_path_user_etag(
+    request: Request,
+    user_id: int,
+    session: AsyncSession = Depends(get_read_session),
+) -> None:
+    """
+    Conditional GET for endpoints returning the data of the ``user_id`` path parameter
+
+    Does not authenticate; list the route's authentication dependency first.
+    """
+    await _check_user_etag(request, user_id, session)
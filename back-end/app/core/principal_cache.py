@@ -0,0 +1,137 @@
+"""
+Authenticated-principal cache
+
+Keeps the few user fields needed to authorize a request in process memory,
+so most endpoints never have to query the users table.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+
+
+@dataclass(frozen=True)
+class Principal:
+    """
+    Minimal identity of an authenticated user
+    """
+
+    id: int
+    is_active: bool
+    is_superuser: bool
+    token_version: int
+
+    @classmethod
+    def from_user(cls, user) -> "Principal":
+        """
+        Build a principal from a User model (or any row with the same fields)
+
+        Args:
+            user: User instance or row
+
+        Returns:
+            Principal instance
+        """
+        return cls(
+            id=user.id,
+            is_active=bool(user.is_active),
+            is_superuser=bool(user.is_superuser),
+            token_version=user.token_version or 0,
+        )
+
+
+class PrincipalCache:
+    """
+    Process-local TTL cache of principals keyed by user id
+
+    Entries expire after ``ttl_seconds``, which bounds how long another worker
+    can keep serving a principal after the user was changed elsewhere.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        """
+        Initialize cache
+
+        Args:
+            ttl_seconds: Lifetime of an entry
+            max_entries: Maximum number of cached principals
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: Dict[int, Tuple[float, Principal]] = {}
+
+    def get(self, user_id: int) -> Optional[Principal]:
+        """
+        Get a cached principal
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            Principal or None if missing or expired
+        """
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+
+        expires_at, principal = entry
+        if expires_at < time.monotonic():
+            self._entries.pop(user_id, None)
+            return None
+        return principal
+
+    def set(self, principal: Principal) -> None:
+        """
+        Store a principal
+
+        Args:
+            principal: Principal to cache
+        """
+        if self.ttl_seconds <= 0:
+            return
+
+        self._entries.pop(principal.id, None)
+        if len(self._entries) >= self.max_entries:
+            # Dicts keep insertion order, so the first key is the oldest entry
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[principal.id] = (time.monotonic() + self.ttl_seconds, principal)
+
+    def invalidate(self, user_id: int) -> None:
+        """
+        Drop the cached principal of a user
+
+        Args:
+            user_id: User ID
+        """
+        self._entries.pop(user_id, None)
+
+    def invalidate_on_commit(self, user_id: int, session: AsyncSession) -> None:
+        """
+        Drop the cached principal of a user now and again once ``session`` commits
+
+        The second drop covers a concurrent request that re-cached the
+        principal from the users row before the change was committed.
+
+        Args:
+            user_id: User ID
+            session: Session holding the change to the user
+        """
+        self.invalidate(user_id)
+        event.listen(session.sync_session, "after_commit", lambda _: self.invalidate(user_id), once=True)
+
+    def clear(self) -> None:
+        """
+        Drop all cached principals
+        """
+        self._entries.clear()
+
+
+principal_cache = PrincipalCache(
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+    max_entries=settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+)
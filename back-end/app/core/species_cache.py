@@ -0,0 +1,121 @@
+"""
+Species catalog cache
+
+The species catalog is small, read-mostly and shared by every user, so each
+worker keeps all of it in process memory as immutable SpeciesRow records.
+Once loaded, species lookups and list pages need no database round trip.
+
+Staleness is bounded by the ``cache_versions`` row for "species": writers
+bump it in the same transaction as their change (and drop this worker's
+copy once they commit), and every worker polls it to pick up changes made
+by others.
+"""
+
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.read_models.plant_rows import SpeciesRow
+
+SPECIES_CACHE = "species"
+
+
+class SpeciesCache:
+    """
+    Process-local copy of the species catalog
+    """
+
+    def __init__(self):
+        self.version: Optional[int] = None
+        self._by_id: Dict[int, SpeciesRow] = {}
+        self._ordered: List[SpeciesRow] = []
+        self._keys: List[Tuple[str, int]] = []
+        self._by_common_name: Dict[str, SpeciesRow] = {}
+        self._by_scientific_name: Dict[str, SpeciesRow] = {}
+
+    @property
+    def loaded(self) -> bool:
+        """
+        Whether the cache holds a catalog it can answer from
+        """
+        return self.version is not None
+
+    def load(self, records: Iterable[SpeciesRow], version: int) -> None:
+        """
+        Replace the cached catalog
+
+        Args:
+            records: Every species
+            version: Cache version the records were read at (read before them)
+        """
+        ordered = sorted(records, key=lambda record: (record.common_name, record.id))
+        self._by_id = {record.id: record for record in ordered}
+        self._ordered = ordered
+        self._keys = [(record.common_name, record.id) for record in ordered]
+        self._by_common_name = {record.common_name: record for record in ordered}
+        self._by_scientific_name = {
+            record.scientific_name: record for record in ordered if record.scientific_name
+        }
+        self.version = version
+
+    def invalidate(self) -> None:
+        """
+        Drop the cached catalog; it is reloaded on the next read
+        """
+        self.version = None
+
+    def invalidate_on_commit(self, session: AsyncSession) -> None:
+        """
+        Drop the cached catalog now and again once ``session`` commits
+
+        The second drop covers a reload that ran while the write was still
+        uncommitted and so read the old catalog.
+
+        Args:
+            session: Session holding the species write
+        """
+        self.invalidate()
+        event.listen(session.sync_session, "after_commit", lambda _: self.invalidate(), once=True)
+
+    def get(self, species_id: int) -> Optional[SpeciesRow]:
+        """
+        Get a species by ID
+        """
+        return self._by_id.get(species_id)
+
+    def get_by_common_name(self, common_name: str) -> Optional[SpeciesRow]:
+        """
+        Get a species by exact common name
+        """
+        return self._by_common_name.get(common_name)
+
+    def get_by_scientific_name(self, scientific_name: str) -> Optional[SpeciesRow]:
+        """
+        Get a species by exact scientific name
+        """
+        return self._by_scientific_name.get(scientific_name)
+
+    def all(self) -> List[SpeciesRow]:
+        """
+        Every species, ordered by (common_name, id)
+        """
+        return self._ordered
+
+    def page(
+        self, skip: int = 0, limit: int = 100, after: Optional[Tuple[str, int]] = None
+    ) -> List[SpeciesRow]:
+        """
+        A page of species ordered by (common_name, id), like PlantSpeciesRepository.get_all
+
+        Args:
+            skip: Number of species to skip (ignored when ``after`` is given)
+            limit: Maximum number of species
+            after: ``(common_name, id)`` keyset cursor of the last species already seen
+        """
+        start = bisect_right(self._keys, tuple(after)) if after is not None else skip
+        return self._ordered[start : start + limit]
+
+
+species_cache = SpeciesCache()
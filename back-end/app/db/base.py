@@ -7,9 +7,15 @@ from app.db.database import Base
 from app.models.user import User
 from app.models.plant import Plant
 from app.models.plant_species import PlantSpecies
-from app.models.activity import Activity
+from app.models.activity import Activity, ActivityArchive
 from app.models.diagnosis import Diagnosis
 from app.models.profile import Profile
+from app.models.cache_version import CacheVersion
+from app.models.storage_cleanup import StorageCleanup
+from app.models.plant_health_rollup import PlantHealthRollup
+from app.models.user_data_version import UserDataVersion
+from app.models.sync_tombstone import SyncTombstone
+from app.models.applied_mutation import AppliedMutation
 
 # Add more models as they are created
-__all__ = ["Base", "User", "Plant", "PlantSpecies", "Activity", "Diagnosis", "Profile"]
+__all__ = ["Base", "User", "Plant", "PlantSpecies", "Activity", "ActivityArchive", "Diagnosis", "Profile", "CacheVersion", "StorageCleanup", "PlantHealthRollup", "UserDataVersion", "SyncTombstone", "AppliedMutation"]
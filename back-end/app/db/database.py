@@ -2,8 +2,12 @@
 Database configuration and session management
 """
 
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Dict
+from fastapi import Depends, Request
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     create_async_engine,
     async_sessionmaker,
@@ -12,21 +16,76 @@ from sqlalchemy.orm import declarative_base
 
 from app.core.config import settings
 from app.core.logging import get_logger
-import ssl
-import ssl
-from sqlalchemy.ext.asyncio import create_async_engine
+from app.db.metrics import InstrumentedAsyncQueuePool, instrument_engine
+from app.db.query_stats import install_query_tracking
+from app.db.routing import replica_router
 
 logger = get_logger(__name__)
 
-print("Database url" + settings.DATABASE_URL)
 
+def engine_options(database_url: str) -> Dict[str, Any]:
+    """
+    Build engine keyword arguments from settings
 
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=5,
-)
+    SQLite (used by tests and local scripts) has no connection pool to size
+    and no asyncpg connect arguments, so only pre-ping and the compile cache
+    size apply.
+
+    Args:
+        database_url: Database URL the engine connects to
+
+    Returns:
+        Keyword arguments for create_async_engine
+    """
+    url = make_url(database_url)
+    options: Dict[str, Any] = {
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "query_cache_size": settings.DB_COMPILE_CACHE_SIZE,
+    }
+    if url.get_backend_name() == "sqlite":
+        return options
+
+    options.update(
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+    )
+    if url.get_driver_name() == "asyncpg":
+        options["connect_args"] = {
+            "timeout": settings.DB_CONNECTION_TIMEOUT,
+            "command_timeout": settings.DB_COMMAND_TIMEOUT,
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        }
+    return options
+
+
+def enable_sqlite_foreign_keys(engine: AsyncEngine) -> None:
+    """
+    Turn on foreign key enforcement for every SQLite connection of ``engine``
+
+    SQLite ignores foreign keys, and so ON DELETE CASCADE, unless each
+    connection asks for them. Does nothing for other databases.
+
+    Args:
+        engine: Engine to configure
+    """
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _enable_foreign_keys(dbapi_connection, _connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
+install_query_tracking()
+
+engine = create_async_engine(settings.DATABASE_URL, **engine_options(settings.DATABASE_URL))
+instrument_engine(engine, "primary")
+enable_sqlite_foreign_keys(engine)
 
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -34,6 +93,21 @@ AsyncSessionLocal = async_sessionmaker(
     expire_on_commit=False,
 )
 
+# Optional read replica; without one every read goes to the primary
+replica_engine = None
+ReplicaSessionLocal = None
+if settings.DATABASE_REPLICA_URL:
+    replica_engine = create_async_engine(
+        settings.DATABASE_REPLICA_URL, **engine_options(settings.DATABASE_REPLICA_URL)
+    )
+    instrument_engine(replica_engine, "replica")
+    enable_sqlite_foreign_keys(replica_engine)
+    ReplicaSessionLocal = async_sessionmaker(
+        replica_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+
 Base = declarative_base()
 
 
@@ -55,6 +129,64 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def get_read_session(
+    request: Request,
+    primary: AsyncSession = Depends(get_session),
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Get a session for read-only work
+
+    Served by the replica when one is configured, unless the request must
+    see its client's own recent writes (see app/db/routing.py), in which case
+    the primary session is returned. The primary session only opens a
+    connection if it is actually used.
+
+    Args:
+        request: Current request
+        primary: Primary database session
+
+    Yields:
+        AsyncSession instance
+    """
+    if ReplicaSessionLocal is None or replica_router.use_primary(request):
+        yield primary
+        return
+
+    async with ReplicaSessionLocal() as session:
+        yield session
+
+
+def get_read_session_factory(request: Request) -> async_sessionmaker:
+    """
+    Get a session factory for read-only work that fans out over several
+    connections at once
+
+    Follows the same replica routing as get_read_session. Every session
+    opened from it holds its own pooled connection, so callers should keep
+    the fan-out small.
+
+    Args:
+        request: Current request
+
+    Returns:
+        async_sessionmaker for the replica or the primary
+    """
+    if ReplicaSessionLocal is None or replica_router.use_primary(request):
+        return AsyncSessionLocal
+    return ReplicaSessionLocal
+
+
+def get_session_factory() -> async_sessionmaker:
+    """
+    Get the primary session factory, for work that outlives the request
+    session (background tasks)
+
+    Returns:
+        async_sessionmaker for the primary
+    """
+    return AsyncSessionLocal
+
+
 async def create_tables():
     """
     Create all database tables
@@ -0,0 +1,239 @@
+"""
+Connection pool and SQL compile cache telemetry
+
+Counters are fed by SQLAlchemy pool events (connect, checkout, checkin,
+invalidate) and by ``InstrumentedAsyncQueuePool``, which times how long
+each checkout waits for a connection. Gauges (checked out, overflow, idle)
+are read from the pool when a snapshot is taken.
+
+Every statement execution also records whether its compiled SQL came from
+the engine's compile cache, so a query that stops being cacheable (and is
+recompiled on every call) shows up as a falling hit rate.
+"""
+
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import default
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool
+
+
+class PoolMetrics:
+    """
+    Counters for a single engine's connection pool
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.wait_count = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record_wait(self, seconds: float) -> None:
+        """
+        Record the time a checkout spent waiting for a connection
+
+        Args:
+            seconds: Wait time in seconds
+        """
+        self.wait_count += 1
+        self.wait_seconds_total += seconds
+        self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+    def snapshot(self, pool: Pool) -> Dict[str, Any]:
+        """
+        Combine the counters with the pool's current gauges
+
+        Args:
+            pool: Pool the counters belong to
+
+        Returns:
+            Dictionary of pool metrics
+        """
+        data: Dict[str, Any] = {
+            "pool_class": type(pool).__name__,
+            "connects": self.connects,
+            "checkouts": self.checkouts,
+            "checkins": self.checkins,
+            "invalidations": self.invalidations,
+            "timeouts": self.timeouts,
+            "wait_count": self.wait_count,
+            "wait_seconds_total": round(self.wait_seconds_total, 6),
+            "wait_seconds_avg": round(self.wait_seconds_total / self.wait_count, 6)
+            if self.wait_count
+            else 0.0,
+            "wait_seconds_max": round(self.wait_seconds_max, 6),
+        }
+        if isinstance(pool, AsyncAdaptedQueuePool):
+            data.update(
+                size=pool.size(),
+                checked_out=pool.checkedout(),
+                checked_in=pool.checkedin(),
+                overflow=max(pool.overflow(), 0),
+                max_overflow=pool._max_overflow,
+            )
+        return data
+
+
+class CompileCacheMetrics:
+    """
+    Compile cache outcomes for a single engine's statements
+    """
+
+    # Statements that could not be cached at all; a few SQL samples are kept
+    UNCACHEABLE_SAMPLES = 10
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.uncacheable = 0
+        self.uncacheable_samples: Dict[str, int] = {}
+
+    def record(self, cache_hit: Any, statement: str) -> None:
+        """
+        Record the compile cache outcome of one execution
+
+        Args:
+            cache_hit: ``ExecutionContext.cache_hit`` of the execution
+            statement: SQL text that was executed
+        """
+        if cache_hit == default.CACHE_HIT:
+            self.hits += 1
+        elif cache_hit == default.CACHE_MISS:
+            self.misses += 1
+        elif cache_hit == default.NO_CACHE_KEY:
+            self.uncacheable += 1
+            sample = " ".join(statement.split())[:200]
+            samples = self.uncacheable_samples
+            if sample in samples or len(samples) < self.UNCACHEABLE_SAMPLES:
+                samples[sample] = samples.get(sample, 0) + 1
+
+    def snapshot(self, compiled_cache: Any) -> Dict[str, Any]:
+        """
+        Combine the counters with the cache's current fill level
+
+        Args:
+            compiled_cache: The engine's compiled cache (None when disabled)
+
+        Returns:
+            Dictionary of compile cache metrics
+        """
+        cached = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / cached, 4) if cached else 0.0,
+            "uncacheable": self.uncacheable,
+            "uncacheable_samples": dict(self.uncacheable_samples),
+            "entries": len(compiled_cache) if compiled_cache is not None else 0,
+            "capacity": compiled_cache.capacity if compiled_cache is not None else 0,
+        }
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    Async queue pool that records checkout wait time and timeouts
+
+    Pool events fire only once a connection has been obtained, so the time
+    spent blocked on an exhausted pool has to be measured around ``_do_get``.
+    """
+
+    metrics: Optional[PoolMetrics] = None
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            if self.metrics is not None:
+                self.metrics.timeouts += 1
+            raise
+        finally:
+            if self.metrics is not None:
+                self.metrics.record_wait(time.perf_counter() - start)
+
+    def recreate(self) -> "InstrumentedAsyncQueuePool":
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+_registry: Dict[str, AsyncEngine] = {}
+
+
+def instrument_engine(engine: AsyncEngine, name: str) -> PoolMetrics:
+    """
+    Attach pool and execution event hooks to an engine and register it for reporting
+
+    Args:
+        engine: Engine to instrument
+        name: Label used in the metrics output (e.g. "primary")
+
+    Returns:
+        The engine's PoolMetrics
+    """
+    metrics = PoolMetrics(name)
+    sync_engine = engine.sync_engine
+    sync_engine.pool_metrics = metrics
+    compile_metrics = CompileCacheMetrics()
+    sync_engine.compile_cache_metrics = compile_metrics
+    if isinstance(sync_engine.pool, InstrumentedAsyncQueuePool):
+        sync_engine.pool.metrics = metrics
+
+    @event.listens_for(sync_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        metrics.connects += 1
+
+    @event.listens_for(sync_engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        metrics.checkouts += 1
+
+    @event.listens_for(sync_engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        metrics.checkins += 1
+
+    @event.listens_for(sync_engine, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        metrics.invalidations += 1
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _on_execute(conn, cursor, statement, parameters, context, executemany):
+        # Driver-level SQL (PRAGMAs, raw strings) and DDL never go through the cache
+        if context is not None and context.compiled is not None and not context.isddl:
+            compile_metrics.record(context.cache_hit, statement)
+
+    _registry[name] = engine
+    return metrics
+
+
+def get_pool_metrics() -> Dict[str, Dict[str, Any]]:
+    """
+    Snapshot the metrics of every instrumented engine
+
+    Returns:
+        Mapping of engine name to its pool metrics
+    """
+    return {
+        name: engine.sync_engine.pool_metrics.snapshot(engine.sync_engine.pool)
+        for name, engine in _registry.items()
+    }
+
+
+def get_compile_cache_metrics() -> Dict[str, Dict[str, Any]]:
+    """
+    Snapshot the compile cache metrics of every instrumented engine
+
+    Returns:
+        Mapping of engine name to its compile cache metrics
+    """
+    return {
+        name: engine.sync_engine.compile_cache_metrics.snapshot(engine.sync_engine._compiled_cache)
+        for name, engine in _registry.items()
+    }
@@ -0,0 +1,102 @@
+"""
+Database schema migrations
+
+Schema changes are applied by Alembic revisions in ``migrations/`` and run
+as a separate step before the API starts, so application startup never
+touches the schema.
+
+Usage:
+    python -m app.db.migrate                      # upgrade to the latest revision
+    python -m app.db.migrate upgrade <revision>   # upgrade to a revision
+    python -m app.db.migrate downgrade <revision> # downgrade to a revision
+    python -m app.db.migrate current              # show the applied revision
+"""
+
+import argparse
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.core.logging import get_logger, setup_logging
+
+logger = get_logger(__name__)
+
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+
+def get_alembic_config(connection: Connection = None) -> Config:
+    """
+    Build the Alembic configuration
+
+    Args:
+        connection: Optional open connection for the migrations to reuse
+
+    Returns:
+        Alembic Config instance
+    """
+    config = Config(str(ALEMBIC_INI))
+    config.set_main_option("script_location", str(ALEMBIC_INI.parent / "migrations"))
+    if connection is not None:
+        config.attributes["connection"] = connection
+        config.attributes["configure_logger"] = False
+    return config
+
+
+def migrate(revision: str = "head") -> None:
+    """
+    Upgrade the database to a revision
+
+    Args:
+        revision: Target revision ("head" for the latest)
+    """
+    command.upgrade(get_alembic_config(), revision)
+    logger.info(f"Database upgraded to revision {revision}")
+
+
+def rollback(revision: str) -> None:
+    """
+    Downgrade the database to a revision
+
+    Args:
+        revision: Target revision ("base" to remove everything)
+    """
+    command.downgrade(get_alembic_config(), revision)
+    logger.info(f"Database downgraded to revision {revision}")
+
+
+async def migrate_with_connection(connection: AsyncConnection, revision: str = "head") -> None:
+    """
+    Upgrade the database over an existing async connection
+
+    Used by code that already runs inside an event loop (e.g. seeding),
+    where Alembic cannot start its own.
+
+    Args:
+        connection: Open async connection
+        revision: Target revision
+    """
+
+    def _upgrade(sync_connection: Connection) -> None:
+        command.upgrade(get_alembic_config(sync_connection), revision)
+
+    await connection.run_sync(_upgrade)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Apply database migrations")
+    parser.add_argument(
+        "action", nargs="?", default="upgrade", choices=["upgrade", "downgrade", "current"]
+    )
+    parser.add_argument("revision", nargs="?", default="head", help="Target revision")
+    args = parser.parse_args()
+
+    setup_logging()
+    if args.action == "upgrade":
+        migrate(args.revision)
+    elif args.action == "downgrade":
+        rollback(args.revision)
+    else:
+        command.current(get_alembic_config(), verbose=True)
@@ -0,0 +1,59 @@
+"""
+Monthly range partitions of the activities table (PostgreSQL)
+
+On PostgreSQL ``activities`` is partitioned by ``created_at``, one partition
+per calendar month (UTC) named ``activities_pYYYY_MM``, plus a default
+partition for rows outside every monthly range. Partitions are created
+ahead of time by ``python -m app.jobs.archive_activities``; other databases
+keep a single plain table.
+"""
+
+import re
+from datetime import datetime, timezone
+from typing import Optional
+
+ACTIVITY_DEFAULT_PARTITION = "activities_default"
+_PARTITION_NAME = re.compile(r"^activities_p(\d{4})_(\d{2})$")
+
+
+def month_start(moment: datetime) -> datetime:
+    """
+    First instant of the calendar month containing ``moment``, keeping its timezone
+    """
+    return moment.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(month: datetime, months: int) -> datetime:
+    """
+    Shift a month start by a number of months (negative goes back)
+    """
+    index = month.year * 12 + month.month - 1 + months
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(month: datetime) -> str:
+    """
+    Name of the partition holding ``month``
+    """
+    return f"activities_p{month.year:04d}_{month.month:02d}"
+
+
+def partition_month(name: str) -> Optional[datetime]:
+    """
+    Month start (UTC) a partition holds, or None for names that are not monthly partitions
+    """
+    match = _PARTITION_NAME.match(name)
+    if match is None:
+        return None
+    return datetime(int(match.group(1)), int(match.group(2)), 1, tzinfo=timezone.utc)
+
+
+def create_partition_sql(month: datetime) -> str:
+    """
+    DDL creating the partition for ``month`` if it does not exist yet
+    """
+    month = month_start(month.astimezone(timezone.utc))
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(month)} PARTITION OF activities "
+        f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+    )
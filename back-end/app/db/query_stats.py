@@ -0,0 +1,249 @@
+"""
+Per-request SQL statistics
+
+Engine events count every statement executed while a ``QueryStats`` is
+active (the query stats middleware opens one per request) together with
+the time spent in the database. Statements are also grouped by
+fingerprint, their SQL with IN-lists collapsed: the same fingerprint run
+many times in one request is the signature of an N+1 load, typically a
+lazy or selectin relationship loaded once per parent row.
+
+Independently of requests, statements slower than ``DB_SLOW_QUERY_MS`` are
+logged with their parameter values redacted.
+"""
+
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# "IN (?, ?, ?)", "IN ($1, $2)" and "VALUES (...), (...)" vary with list length
+_PLACEHOLDER_LIST = re.compile(r"\((?:\s*(?:\?|\$\d+|%\(\w+\)s|:\w+)\s*,)+\s*(?:\?|\$\d+|%\(\w+\)s|:\w+)\s*\)")
+_REPEATED_TUPLES = re.compile(r"(\(\?\))(?:\s*,\s*\(\?\))+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(statement: str) -> str:
+    """
+    Normalize SQL so executions of the same query compare equal
+
+    Args:
+        statement: SQL text as sent to the driver
+
+    Returns:
+        The statement with whitespace collapsed and placeholder lists shortened
+    """
+    statement = _WHITESPACE.sub(" ", statement).strip()
+    statement = _PLACEHOLDER_LIST.sub("(?)", statement)
+    return _REPEATED_TUPLES.sub(r"\1", statement)
+
+
+def redact_parameters(parameters: Any, executemany: bool) -> str:
+    """
+    Describe statement parameters without their values
+
+    Args:
+        parameters: Parameters passed to the cursor
+        executemany: Whether the statement ran once per parameter set
+
+    Returns:
+        Parameter type names, e.g. ``(int, str)``
+    """
+    if executemany:
+        return f"<{len(parameters)} parameter sets>"
+    if isinstance(parameters, dict):
+        return "{" + ", ".join(f"{key}: {type(value).__name__}" for key, value in parameters.items()) + "}"
+    if isinstance(parameters, (list, tuple)):
+        return "(" + ", ".join(type(value).__name__ for value in parameters) + ")"
+    return "()"
+
+
+class QueryStats:
+    """
+    Statements executed within one request (or other tracked block)
+
+    Nested stats (a test's query budget around a request) also count
+    towards their parent.
+    """
+
+    def __init__(self, parent: Optional["QueryStats"] = None):
+        self.parent = parent
+        self.count = 0
+        self.seconds = 0.0
+        self.fingerprints: Counter = Counter()
+
+    def record(self, statement: str, seconds: float) -> None:
+        """
+        Record one executed statement
+
+        Args:
+            statement: SQL text as sent to the driver
+            seconds: Time spent executing it
+        """
+        stats: Optional[QueryStats] = self
+        key = fingerprint(statement)
+        while stats is not None:
+            stats.count += 1
+            stats.seconds += seconds
+            stats.fingerprints[key] += 1
+            stats = stats.parent
+
+    def repeated(self, threshold: Optional[int] = None) -> List[Tuple[str, int]]:
+        """
+        Statements executed at least ``threshold`` times, most repeated first
+
+        Args:
+            threshold: Minimum number of executions (defaults to DB_N_PLUS_ONE_THRESHOLD)
+
+        Returns:
+            List of (fingerprint, count)
+        """
+        if threshold is None:
+            threshold = settings.DB_N_PLUS_ONE_THRESHOLD
+        return [(key, count) for key, count in self.fingerprints.most_common() if count >= threshold]
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    Count the statements executed inside the block
+
+    The stats follow the async context, so statements run by tasks started
+    inside the block (e.g. the dashboard's concurrent sections) count too.
+
+    Yields:
+        QueryStats filled in as statements run
+    """
+    stats = QueryStats(parent=_current_stats.get())
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+class EndpointQueryMetrics:
+    """
+    Aggregated per-endpoint query counters for GET /metrics
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.queries = 0
+        self.max_queries = 0
+        self.db_seconds = 0.0
+        self.n_plus_one = 0
+
+    def record(self, stats: QueryStats) -> None:
+        """
+        Add one request's stats
+
+        Args:
+            stats: The request's query stats
+        """
+        self.requests += 1
+        self.queries += stats.count
+        self.max_queries = max(self.max_queries, stats.count)
+        self.db_seconds += stats.seconds
+        if stats.repeated():
+            self.n_plus_one += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Current counters with per-request averages
+
+        Returns:
+            Dictionary of endpoint query metrics
+        """
+        return {
+            "requests": self.requests,
+            "queries_avg": round(self.queries / self.requests, 2) if self.requests else 0.0,
+            "queries_max": self.max_queries,
+            "db_ms_avg": round(self.db_seconds * 1000 / self.requests, 3) if self.requests else 0.0,
+            "n_plus_one_requests": self.n_plus_one,
+        }
+
+
+_endpoint_metrics: Dict[str, EndpointQueryMetrics] = {}
+
+
+def record_endpoint(endpoint: str, stats: QueryStats) -> None:
+    """
+    Add a finished request's stats to its endpoint's counters
+
+    Logs a warning listing the repeated statements when the request looks
+    like an N+1 load.
+
+    Args:
+        endpoint: Method and route template, e.g. ``GET /api/v1/plants/{plant_id}``
+        stats: The request's query stats
+    """
+    metrics = _endpoint_metrics.get(endpoint)
+    if metrics is None:
+        metrics = _endpoint_metrics[endpoint] = EndpointQueryMetrics()
+    metrics.record(stats)
+    for statement, count in stats.repeated():
+        logger.warning(f"Possible N+1 in {endpoint}: statement ran {count} times: {statement[:300]}")
+
+
+def get_endpoint_query_metrics() -> Dict[str, Dict[str, Any]]:
+    """
+    Snapshot the per-endpoint query counters
+
+    Returns:
+        Mapping of endpoint to its query metrics
+    """
+    return {endpoint: metrics.snapshot() for endpoint, metrics in _endpoint_metrics.items()}
+
+
+def reset_endpoint_query_metrics() -> None:
+    """
+    Drop all per-endpoint query counters
+    """
+    _endpoint_metrics.clear()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    seconds = time.perf_counter() - conn.info["query_start"].pop()
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, seconds)
+    if seconds * 1000 >= settings.DB_SLOW_QUERY_MS:
+        logger.warning(
+            f"Slow query ({seconds * 1000:.1f} ms): {_WHITESPACE.sub(' ', statement)[:500]} "
+            f"params={redact_parameters(parameters, executemany)}"
+        )
+
+
+def _handle_error(exception_context):
+    # A failed statement never reaches after_cursor_execute
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_start"):
+        connection.info["query_start"].pop()
+
+
+def install_query_tracking() -> None:
+    """
+    Listen to statement execution on every engine (idempotent)
+    """
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(Engine, "handle_error", _handle_error)
@@ -0,0 +1,102 @@
+"""
+Read/write session routing
+
+Read-only dependencies may be served by a replica, which lags the primary
+by up to a few seconds. To keep read-after-write consistent, a client that
+has just written is pinned to the primary for ``DB_REPLICA_STICKY_SECONDS``,
+and a request can always ask for the primary explicitly.
+"""
+
+import hashlib
+import time
+from typing import Dict, Optional
+
+from fastapi import Request
+
+from app.core.config import settings
+
+
+READ_CONSISTENCY_HEADER = "X-Read-Consistency"
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class ReplicaRouter:
+    """
+    Decides whether a request's reads may go to the replica
+    """
+
+    def __init__(self, sticky_seconds: int, max_entries: int = 10000):
+        self._sticky_seconds = sticky_seconds
+        self._max_entries = max_entries
+        self._sticky_until: Dict[str, float] = {}
+
+    @staticmethod
+    def _client_key(request: Request) -> Optional[str]:
+        """
+        Identify the client a request came from
+
+        Uses a digest of the bearer token so raw tokens are not kept in memory,
+        falling back to the client address for anonymous requests.
+        """
+        authorization = request.headers.get("authorization")
+        if authorization:
+            return hashlib.sha1(authorization.encode()).hexdigest()
+        if request.client is not None:
+            return request.client.host
+        return None
+
+    def mark_write(self, request: Request) -> None:
+        """
+        Pin the request's client to the primary for the sticky window
+
+        Args:
+            request: Request that wrote to the primary
+        """
+        key = self._client_key(request)
+        if key is None or self._sticky_seconds <= 0:
+            return
+        now = time.monotonic()
+        if len(self._sticky_until) >= self._max_entries:
+            self._sticky_until = {
+                k: until for k, until in self._sticky_until.items() if until > now
+            }
+        self._sticky_until[key] = now + self._sticky_seconds
+
+    def use_primary(self, request: Request) -> bool:
+        """
+        Whether the request's reads must go to the primary
+
+        True for writes, when the request or client asked for the primary,
+        or when the client wrote within the sticky window.
+
+        Args:
+            request: Current request
+
+        Returns:
+            True to read from the primary
+        """
+        if request.method not in SAFE_METHODS:
+            return True
+        if getattr(request.state, "use_primary", False):
+            return True
+        if request.headers.get(READ_CONSISTENCY_HEADER, "").lower() == "primary":
+            return True
+        key = self._client_key(request)
+        if key is None:
+            return False
+        until = self._sticky_until.get(key)
+        if until is None:
+            return False
+        if until <= time.monotonic():
+            self._sticky_until.pop(key, None)
+            return False
+        return True
+
+    def clear(self) -> None:
+        """
+        Forget all sticky clients
+        """
+        self._sticky_until.clear()
+
+
+replica_router = ReplicaRouter(settings.DB_REPLICA_STICKY_SECONDS)
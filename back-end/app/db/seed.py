@@ -14,6 +14,9 @@ from app.models.profile import Profile
 from app.models.activity import Activity, ActivityType
 from app.core.security import get_password_hash
 from app.core.logging import get_logger
+from app.db.migrate import migrate_with_connection
+from app.repositories.plant_health_repository import PlantHealthRepository
+from app.repositories.plant_repository import PlantRepository
 
 logger = get_logger(__name__)
 
@@ -520,6 +523,9 @@ async def seed_data(session: AsyncSession) -> None:
     )
     session.add_all([diagnosis_emma_1, diagnosis_david_1, diagnosis_margaret_1])
     await session.flush()
+    diagnosed = [d.plant_id for d in (diagnosis_emma_1, diagnosis_david_1, diagnosis_margaret_1)]
+    await PlantRepository(session).refresh_health_snapshots(diagnosed)
+    await PlantHealthRepository(session).refresh_rollups(diagnosed, datetime.now(timezone.utc))
 
     # ==================== CREATE ACTIVITIES ====================
 
@@ -685,7 +691,7 @@ async def init_db() -> None:
 
     This function:
     1. Drops all existing database tables
-    2. Creates all database tables based on models
+    2. Recreates the schema by running all migrations
     3. Seeds fresh initial data
     """
     logger.info("Dropping all tables...")
@@ -697,10 +703,11 @@ async def init_db() -> None:
         # Drop enum types explicitly (they're not dropped with tables)
         from sqlalchemy import text
         await conn.execute(text("DROP TYPE IF EXISTS activitytype CASCADE"))
+        await conn.execute(text("DROP TABLE IF EXISTS alembic_version"))
 
-    # Create all tables
+    # Recreate the schema from migrations
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all, checkfirst=True)
+        await migrate_with_connection(conn)
 
     logger.info("Tables recreated")
 
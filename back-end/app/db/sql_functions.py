@@ -0,0 +1,110 @@
+"""
+Dialect-specific SQL constructs
+
+Date arithmetic differs between PostgreSQL (production) and SQLite (tests),
+so constructs that need it are compiled per dialect here.
+"""
+
+from datetime import datetime
+from typing import Iterable
+
+from sqlalchemy import DateTime, Float, any_, bindparam, literal
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ColumnElement, FunctionElement
+
+
+class days_since(FunctionElement):
+    """
+    Fractional days elapsed from a timestamp expression to a reference time
+
+    ``days_since(Plant.last_watered, now) < 7`` matches the Python check
+    ``(now - last_watered).days < 7``. NULL timestamps give NULL.
+    """
+
+    type = Float()
+    name = "days_since"
+    inherit_cache = True
+
+    def __init__(self, timestamp: ColumnElement, now: datetime):
+        super().__init__(timestamp, literal(now, DateTime(timezone=True)))
+
+
+@compiles(days_since)
+def _days_since_default(element, compiler, **kw):
+    timestamp, now = list(element.clauses)
+    return "(EXTRACT(EPOCH FROM (%s - %s)) / 86400.0)" % (
+        compiler.process(now, **kw),
+        compiler.process(timestamp, **kw),
+    )
+
+
+@compiles(days_since, "sqlite")
+def _days_since_sqlite(element, compiler, **kw):
+    timestamp, now = list(element.clauses)
+    return "(julianday(%s) - julianday(%s))" % (
+        compiler.process(now, **kw),
+        compiler.process(timestamp, **kw),
+    )
+
+
+class add_days(FunctionElement):
+    """
+    Timestamp expression shifted by a whole number of days
+
+    ``add_days(Plant.last_watered, PlantSpecies.watering_frequency_days)``
+    matches the Python ``last_watered + timedelta(days=frequency)``.
+    """
+
+    type = DateTime(timezone=True)
+    name = "add_days"
+    inherit_cache = True
+
+
+@compiles(add_days)
+def _add_days_default(element, compiler, **kw):
+    timestamp, days = list(element.clauses)
+    return "(%s + make_interval(days => %s))" % (
+        compiler.process(timestamp, **kw),
+        compiler.process(days, **kw),
+    )
+
+
+@compiles(add_days, "sqlite")
+def _add_days_sqlite(element, compiler, **kw):
+    timestamp, days = list(element.clauses)
+    # Keep SQLAlchemy's storage format (with microseconds) so values compare as text
+    return "strftime('%%Y-%%m-%%d %%H:%%M:%%f000', %s, '+' || %s || ' days')" % (
+        compiler.process(timestamp, **kw),
+        compiler.process(days, **kw),
+    )
+
+
+def any_of(column: ColumnElement, values: Iterable, dialect_name: str) -> ColumnElement:
+    """
+    Condition matching ``column`` against a list of values
+
+    On PostgreSQL this is ``column = ANY(:values)`` with the list sent as one
+    array parameter, so the statement text (and its prepared statement) does
+    not change with the list length. Other dialects get a plain ``IN``.
+
+    Args:
+        column: Column to match
+        values: Values to match
+        dialect_name: Name of the dialect the statement will run on
+    """
+    values = list(values)
+    if dialect_name == "postgresql":
+        return column == any_(bindparam(None, values, type_=ARRAY(column.type)))
+    return column.in_(values)
+
+
+def upsert(table, dialect_name: str):
+    """
+    INSERT construct of ``table`` that supports ``on_conflict_do_update``
+
+    PostgreSQL and SQLite both spell it ``INSERT ... ON CONFLICT``, through
+    their own dialect constructs.
+    """
+    return (sqlite if dialect_name == "sqlite" else postgresql).insert(table)
@@ -0,0 +1,46 @@
+"""
+Unit of work
+
+Repositories only add and flush; they never commit. A service wraps each
+business operation in ``async with self.uow:`` so its writes are flushed
+together and discarded together on error. The single COMMIT of a request is
+issued by ``get_session`` once the endpoint has returned; code running
+outside a request (jobs, scripts) calls ``commit()`` itself.
+
+Inside a savepoint (``session.begin_nested()``, as batched mutations use)
+a failed operation only rolls back to the savepoint: the savepoint's owner
+does that, so earlier work in the transaction survives.
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class UnitOfWork:
+    """
+    Transactional boundary around a session
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize unit of work
+
+        Args:
+            session: Database session the repositories share
+        """
+        self.session = session
+
+    async def __aenter__(self) -> "UnitOfWork":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        if exc_type is None:
+            await self.session.flush()
+        elif not self.session.in_nested_transaction():
+            await self.session.rollback()
+        return False
+
+    async def commit(self) -> None:
+        """
+        Commit the session (only for work running outside a request)
+        """
+        await self.session.commit()
@@ -0,0 +1,106 @@
+"""
+Activity partition maintenance and archival
+
+1. On PostgreSQL, creates the monthly ``activities`` partitions for the
+   current month and the next ``ACTIVITY_PARTITION_MONTHS_AHEAD`` months,
+   so new activities never land in the default partition.
+2. Moves activities older than ``ACTIVITY_RETENTION_MONTHS`` full months
+   into ``activities_archive``. Whole monthly partitions are detached,
+   copied and dropped, which leaves no dead rows behind; anything else
+   (the default partition, or the plain table on other databases) is moved
+   in batches.
+
+Run it daily (it is idempotent):
+    python -m app.jobs.archive_activities
+"""
+
+import argparse
+import asyncio
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import app.db.base  # noqa: F401  (registers every model with the mapper)
+from app.core.config import settings
+from app.core.logging import get_logger, setup_logging
+from app.db.database import AsyncSessionLocal, engine
+from app.db.partitions import add_months, month_start
+from app.repositories.activity_repository import (
+    archive_activities_before,
+    archive_partition,
+    create_activity_partitions,
+    get_activity_partitions,
+)
+
+logger = get_logger(__name__)
+
+BATCH_SIZE = 1000
+
+
+async def maintain_activities(
+    session: AsyncSession,
+    now: Optional[datetime] = None,
+    retention_months: Optional[int] = None,
+    months_ahead: Optional[int] = None,
+) -> int:
+    """
+    Create upcoming partitions and archive expired activities
+
+    Commits after each partition and each batch, so an interrupted run keeps
+    its progress.
+
+    Args:
+        session: Database session
+        now: Reference time (defaults to the current time)
+        retention_months: Full months kept live before the current one
+        months_ahead: Partitions created beyond the current month
+
+    Returns:
+        Number of archived activities
+    """
+    now = now or datetime.now(timezone.utc)
+    if retention_months is None:
+        retention_months = settings.ACTIVITY_RETENTION_MONTHS
+    if months_ahead is None:
+        months_ahead = settings.ACTIVITY_PARTITION_MONTHS_AHEAD
+    cutoff = add_months(month_start(now), -retention_months)
+    archived = 0
+
+    if session.get_bind().dialect.name == "postgresql":
+        await create_activity_partitions(session, now, months_ahead + 1)
+        await session.commit()
+        for name, month in sorted((await get_activity_partitions(session)).items()):
+            if add_months(month, 1) <= cutoff:
+                moved = await archive_partition(session, name)
+                await session.commit()
+                logger.info(f"Archived partition {name} ({moved} activities)")
+                archived += moved
+
+    while True:
+        moved = await archive_activities_before(session, cutoff, BATCH_SIZE)
+        await session.commit()
+        archived += moved
+        if moved < BATCH_SIZE:
+            return archived
+
+
+async def main(retention_months: int, months_ahead: int) -> None:
+    """
+    Run one maintenance pass
+    """
+    async with AsyncSessionLocal() as session:
+        archived = await maintain_activities(
+            session, retention_months=retention_months, months_ahead=months_ahead
+        )
+    await engine.dispose()
+    logger.info(f"Archived {archived} activities")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--retention-months", type=int, default=settings.ACTIVITY_RETENTION_MONTHS)
+    parser.add_argument("--months-ahead", type=int, default=settings.ACTIVITY_PARTITION_MONTHS_AHEAD)
+    args = parser.parse_args()
+    setup_logging()
+    asyncio.run(main(args.retention_months, args.months_ahead))
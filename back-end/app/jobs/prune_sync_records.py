@@ -0,0 +1,41 @@
+"""
+Sync record pruning
+
+Deletes sync tombstones and applied-mutation records older than
+``SYNC_TOMBSTONE_RETENTION_DAYS``. Clients whose watermark is older get a
+full sync, so they never need the tombstones; a client does not retry an
+offline batch for that long.
+
+Run it daily:
+    python -m app.jobs.prune_sync_records
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import app.db.base  # noqa: F401  (registers every model with the mapper)
+from app.core.config import settings
+from app.core.logging import get_logger, setup_logging
+from app.db.database import AsyncSessionLocal, engine
+from app.repositories.mutation_repository import MutationRepository
+from app.repositories.sync_repository import SyncRepository
+
+logger = get_logger(__name__)
+
+
+async def main() -> None:
+    """
+    Prune expired records in one transaction
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+    async with AsyncSessionLocal() as session:
+        tombstones = await SyncRepository(session).prune_tombstones(cutoff)
+        mutations = await MutationRepository(session).prune(cutoff)
+        await session.commit()
+    await engine.dispose()
+    logger.info(f"Pruned {tombstones} sync tombstones and {mutations} applied-mutation records")
+
+
+if __name__ == "__main__":
+    setup_logging()
+    asyncio.run(main())
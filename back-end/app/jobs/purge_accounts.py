@@ -0,0 +1,97 @@
+"""
+Background account deletion and storage cleanup
+
+1. Finishes every account queued for background deletion (users with
+   ``deletion_requested_at`` set). The API starts the purge right after the
+   request; this picks up purges a restart or crash interrupted.
+2. Removes the images queued in ``storage_cleanup`` from Supabase Storage.
+   Failed removals are retried on later runs, up to
+   ``STORAGE_CLEANUP_MAX_ATTEMPTS`` times.
+
+Run it periodically:
+    python -m app.jobs.purge_accounts
+"""
+
+import asyncio
+from typing import Dict
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+import app.db.base  # noqa: F401  (registers every model with the mapper)
+from app.core.config import settings
+from app.core.logging import get_logger, setup_logging
+from app.db.database import AsyncSessionLocal, engine
+from app.repositories.account_deletion_repository import AccountDeletionRepository
+from app.repositories.user_repository import UserRepository
+from app.services.storage_service import storage_service
+from app.services.user_service import purge_account
+
+logger = get_logger(__name__)
+
+BATCH_SIZE = 100
+
+
+async def purge_pending_accounts(session_factory: async_sessionmaker) -> int:
+    """
+    Finish every queued account deletion
+
+    Returns:
+        Number of purged users
+    """
+    async with session_factory() as session:
+        user_ids = await UserRepository(session).get_pending_deletion_ids()
+    for user_id in user_ids:
+        await purge_account(session_factory, user_id)
+    return len(user_ids)
+
+
+async def drain_storage_cleanup(session: AsyncSession, batch_size: int = BATCH_SIZE) -> Dict[str, int]:
+    """
+    Remove queued images from storage
+
+    Each queued image is tried once per run. URLs that do not point into
+    their bucket are dropped without a storage call. Commits after each batch.
+
+    Returns:
+        Counts of removed and failed images
+    """
+    repository = AccountDeletionRepository(session)
+    stats = {"removed": 0, "failed": 0}
+    after_id = 0
+    while True:
+        batch = await repository.get_storage_cleanup_batch(
+            batch_size, settings.STORAGE_CLEANUP_MAX_ATTEMPTS, after_id
+        )
+        if not batch:
+            return stats
+        after_id = batch[-1].id
+        done, failed = [], []
+        for item in batch:
+            file_path = storage_service.extract_file_path_from_url(item.image_url, item.bucket)
+            if file_path is None or await storage_service.delete_image(item.bucket, file_path):
+                done.append(item.id)
+            else:
+                failed.append(item.id)
+        await repository.remove_storage_cleanup(done)
+        await repository.record_storage_cleanup_failure(failed)
+        await session.commit()
+        stats["removed"] += len(done)
+        stats["failed"] += len(failed)
+        if len(batch) < batch_size:
+            return stats
+
+
+async def main() -> None:
+    """
+    Run one purge and cleanup pass
+    """
+    purged = await purge_pending_accounts(AsyncSessionLocal)
+    async with AsyncSessionLocal() as session:
+        stats = await drain_storage_cleanup(session)
+    await engine.dispose()
+    logger.info(f"Purged {purged} accounts, storage cleanup: {stats}")
+
+
+if __name__ == "__main__":
+    setup_logging()
+    asyncio.run(main())
@@ -0,0 +1,183 @@
+"""
+Profile care stats reconciliation
+
+PlantService keeps each profile's ``plant_count`` and
+``plants_watered_on_time`` up to date as plants are created, deleted and
+watered. This job corrects what incremental maintenance cannot:
+
+1. A plant's ``watered_on_time`` flag goes stale once its watering interval
+   passes without a watering, so flags are re-evaluated against the clock.
+2. Counters are recounted from the plants table and any drift is fixed.
+
+Run it periodically; the interval bounds how stale a care rate can get:
+    python -m app.jobs.reconcile_profile_stats
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from sqlalchemy import bindparam, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.logging import get_logger, setup_logging
+from app.db.database import AsyncSessionLocal, engine
+from app.models.plant import Plant
+from app.models.plant_species import PlantSpecies
+from app.models.profile import Profile
+from app.models.user import User
+from app.repositories.user_data_version_repository import UserDataVersionRepository
+from app.services.plant_service import is_watered_on_time
+
+logger = get_logger(__name__)
+
+BATCH_SIZE = 1000
+
+
+async def refresh_watering_flags(
+    session: AsyncSession, now: Optional[datetime] = None, batch_size: int = BATCH_SIZE
+) -> int:
+    """
+    Re-evaluate every plant's watered_on_time flag
+
+    Commits after each batch, so flipped plant rows are not kept locked
+    against watering requests for the whole run. A flag is only written if
+    the plant was not watered since it was read.
+
+    Args:
+        session: Database session
+        now: Reference time (defaults to the current time)
+        batch_size: Plants read per query
+
+    Returns:
+        Number of plants whose flag changed
+    """
+    now = now or datetime.now(timezone.utc)
+    changed = 0
+    last_id = 0
+    plants = Plant.__table__
+    while True:
+        result = await session.execute(
+            select(
+                Plant.id,
+                Plant.last_watered,
+                Plant.watered_on_time,
+                PlantSpecies.watering_frequency_days,
+            )
+            .join(PlantSpecies, PlantSpecies.id == Plant.species_id)
+            .where(Plant.id > last_id)
+            .order_by(Plant.id)
+            .limit(batch_size)
+        )
+        rows = result.all()
+        if not rows:
+            break
+        last_id = rows[-1].id
+
+        updates = [
+            {"plant_id": row.id, "watered": row.last_watered, "on_time": expected}
+            for row in rows
+            if (expected := is_watered_on_time(row.last_watered, row.watering_frequency_days, now))
+            != row.watered_on_time
+        ]
+        if updates:
+            await session.execute(
+                update(plants)
+                .where(
+                    plants.c.id == bindparam("plant_id"),
+                    plants.c.last_watered.is_not_distinct_from(bindparam("watered")),
+                )
+                # The flag is not part of the plant's API shape: leave updated_at (delta sync) alone
+                .values(watered_on_time=bindparam("on_time"), updated_at=plants.c.updated_at),
+                updates,
+            )
+            changed += len(updates)
+        await session.commit()
+    return changed
+
+
+async def reconcile_profile_counters(session: AsyncSession, batch_size: int = BATCH_SIZE) -> int:
+    """
+    Recount each profile's plant counters and fix the ones that drifted
+
+    Each batch of profiles is recounted by one ``UPDATE ... SET col =
+    (SELECT count(*) ...)``, so the counts are taken by the statement that
+    writes them and never overwrite an increment committed in between.
+    Commits after each batch.
+
+    Args:
+        session: Database session
+        batch_size: Profiles recounted per statement
+
+    Returns:
+        Number of profiles corrected
+    """
+    profiles = Profile.__table__
+    owned = Plant.user_id == profiles.c.user_id
+    plant_count = select(func.count()).where(owned).scalar_subquery()
+    on_time = select(func.count()).where(owned, Plant.watered_on_time).scalar_subquery()
+    corrected = 0
+    last_id = 0
+    while True:
+        ids = (
+            await session.execute(
+                select(Profile.id).where(Profile.id > last_id).order_by(Profile.id).limit(batch_size)
+            )
+        ).scalars().all()
+        if not ids:
+            return corrected
+        last_id = ids[-1]
+
+        result = await session.execute(
+            update(profiles)
+            .where(
+                profiles.c.id.in_(ids),
+                or_(
+                    profiles.c.plant_count.is_distinct_from(plant_count),
+                    profiles.c.plants_watered_on_time.is_distinct_from(on_time),
+                ),
+            )
+            .values(plant_count=plant_count, plants_watered_on_time=on_time, updated_at=profiles.c.updated_at)
+            .returning(profiles.c.user_id)
+        )
+        user_ids = result.scalars().all()
+        if user_ids:
+            # Profile responses show the corrected care rate
+            await UserDataVersionRepository(session).bump_many(
+                select(User.id).where(User.id.in_(user_ids))
+            )
+        await session.commit()
+        corrected += len(user_ids)
+
+
+async def reconcile_profile_stats(session: AsyncSession) -> Dict[str, int]:
+    """
+    Refresh watering flags, then fix profile counter drift
+
+    Args:
+        session: Database session (committed after each batch)
+
+    Returns:
+        Number of plants and profiles that were corrected
+    """
+    plants_updated = await refresh_watering_flags(session)
+    profiles_corrected = await reconcile_profile_counters(session)
+    return {"plants_updated": plants_updated, "profiles_corrected": profiles_corrected}
+
+
+async def main() -> None:
+    """
+    Run one reconciliation pass
+    """
+    async with AsyncSessionLocal() as session:
+        stats = await reconcile_profile_stats(session)
+    await engine.dispose()
+    logger.info(
+        f"Profile stats reconciled: {stats['plants_updated']} plant flags updated, "
+        f"{stats['profiles_corrected']} profiles corrected"
+    )
+
+
+if __name__ == "__main__":
+    setup_logging()
+    asyncio.run(main())
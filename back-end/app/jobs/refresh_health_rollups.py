@@ -0,0 +1,58 @@
+"""
+Plant health rollup rebuild
+
+DiagnosisService refreshes a plant's rollup on every diagnosis write. This
+rebuilds the rollups of every diagnosed plant from scratch, in batches:
+run it once after the migration that adds them, and whenever the severity
+ranking changes:
+    python -m app.jobs.refresh_health_rollups
+"""
+
+import asyncio
+from datetime import datetime, timezone
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import app.db.base  # noqa: F401  (registers every model with the mapper)
+from app.core.logging import get_logger, setup_logging
+from app.db.database import AsyncSessionLocal, engine
+from app.repositories.plant_health_repository import PlantHealthRepository
+
+logger = get_logger(__name__)
+
+BATCH_SIZE = 500
+
+
+async def refresh_all_rollups(session: AsyncSession, batch_size: int = BATCH_SIZE) -> int:
+    """
+    Rebuild the rollup of every diagnosed plant, committing after each batch
+
+    Returns:
+        Number of plants refreshed
+    """
+    repository = PlantHealthRepository(session)
+    refreshed = 0
+    after_id = 0
+    while True:
+        plant_ids = await repository.get_diagnosed_plant_ids(after_id, batch_size)
+        if not plant_ids:
+            return refreshed
+        await repository.refresh_rollups(plant_ids, datetime.now(timezone.utc))
+        await session.commit()
+        refreshed += len(plant_ids)
+        after_id = plant_ids[-1]
+
+
+async def main() -> None:
+    """
+    Run one rebuild
+    """
+    async with AsyncSessionLocal() as session:
+        refreshed = await refresh_all_rollups(session)
+    await engine.dispose()
+    logger.info(f"Refreshed health rollups of {refreshed} plants")
+
+
+if __name__ == "__main__":
+    setup_logging()
+    asyncio.run(main())
@@ -0,0 +1,100 @@
+"""
+Watering reminders
+
+Finds the plants that became due for water since the previous run and
+groups them per user. Plants are read in bounded keyset batches over the
+``(next_water_at, id)`` index, so a run costs the same per plant no matter
+how many plants exist in total.
+
+Run it on the same interval as ``--window-minutes``, e.g. every 15 minutes:
+    python -m app.jobs.watering_reminders --window-minutes 15
+"""
+
+import argparse
+import asyncio
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import app.db.base  # noqa: F401  (registers every model with the mapper)
+from app.core.logging import get_logger, setup_logging
+from app.db.database import AsyncSessionLocal, engine
+from app.repositories.plant_repository import PlantRepository
+
+logger = get_logger(__name__)
+
+BATCH_SIZE = 1000
+WINDOW_MINUTES = 15
+
+
+async def collect_due_plants(
+    session: AsyncSession,
+    start: datetime,
+    end: datetime,
+    batch_size: int = BATCH_SIZE,
+) -> Dict[int, List[str]]:
+    """
+    Group the plants that become due in ``[start, end)`` by owner
+
+    Args:
+        session: Database session
+        start: Window start (inclusive)
+        end: Window end (exclusive)
+        batch_size: Plants read per query
+
+    Returns:
+        Mapping of user ID to the names of their plants that need water
+    """
+    repository = PlantRepository(session)
+    due: Dict[int, List[str]] = defaultdict(list)
+    after = None
+    while True:
+        rows = await repository.scan_due(start, end, limit=batch_size, after=after)
+        for row in rows:
+            due[row.user_id].append(row.plant_name)
+        if len(rows) < batch_size:
+            break
+        after = (rows[-1].next_water_at, rows[-1].id)
+    return dict(due)
+
+
+async def send_watering_reminders(
+    session: AsyncSession, now: Optional[datetime] = None, window_minutes: int = WINDOW_MINUTES
+) -> int:
+    """
+    Remind each user whose plants became due during the last window
+
+    Args:
+        session: Database session
+        now: Window end (defaults to the current time)
+        window_minutes: Window length; match the job's run interval
+
+    Returns:
+        Number of users reminded
+    """
+    end = now or datetime.now(timezone.utc)
+    due = await collect_due_plants(session, end - timedelta(minutes=window_minutes), end)
+    for user_id, plant_names in due.items():
+        # No push channel exists yet; the log line is the reminder hook
+        logger.info(f"Watering reminder for user {user_id}: {', '.join(plant_names)}")
+    return len(due)
+
+
+async def main(window_minutes: int) -> None:
+    """
+    Run one reminder window
+    """
+    async with AsyncSessionLocal() as session:
+        reminded = await send_watering_reminders(session, window_minutes=window_minutes)
+    await engine.dispose()
+    logger.info(f"Watering reminders sent to {reminded} users")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--window-minutes", type=int, default=WINDOW_MINUTES)
+    args = parser.parse_args()
+    setup_logging()
+    asyncio.run(main(args.window_minutes))
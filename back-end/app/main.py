@@ -2,29 +2,54 @@
 Main FastAPI application entry point
 """
 
-from contextlib import asynccontextmanager
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager, suppress
+from fastapi import Depends, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.core.config import settings
-from app.core.logging import setup_logging
-from app.db.database import create_tables
+from app.core.logging import get_logger, setup_logging
 from app.api.v1.router import api_router
+from app.core.dependencies import get_current_principal
+from app.core.principal_cache import Principal
+from app.middleware.conditional_get import ConditionalGetMiddleware
 from app.middleware.error_handler import add_exception_handlers
+from app.middleware.query_stats import QueryStatsMiddleware
+from app.middleware.read_routing import PrimaryStickinessMiddleware
+from app.db.database import AsyncSessionLocal
+from app.db.metrics import get_compile_cache_metrics, get_pool_metrics
+from app.db.query_stats import get_endpoint_query_metrics
+from app.services.plant_species_service import poll_species_cache, sync_species_cache
+
+logger = get_logger(__name__)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     Lifespan context manager for startup and shutdown events
+
+    Schema changes are applied separately with ``python -m app.db.migrate``,
+    so startup does no schema work. Startup warms the species cache and
+    starts the task that keeps it in step with other workers.
     """
     # Startup
+    setup_logging()
     try:
-        setup_logging()
-        await create_tables()
-    except Exception as e:
-        print(e)
+        async with AsyncSessionLocal() as session:
+            await sync_species_cache(session)
+    except Exception:
+        # The cache loads on first use instead
+        logger.exception("Could not warm the species cache")
+    poller = asyncio.create_task(
+        poll_species_cache(AsyncSessionLocal, settings.SPECIES_CACHE_POLL_SECONDS)
+    )
     yield
+    # Shutdown
+    poller.cancel()
+    with suppress(asyncio.CancelledError):
+        await poller
 
 
 def create_application() -> FastAPI:
@@ -39,6 +64,7 @@ def create_application() -> FastAPI:
         docs_url="/api/docs",
         redoc_url="/api/redoc",
         openapi_url="/api/openapi.json",
+        default_response_class=ORJSONResponse,
     )
 
     # CORS middleware
@@ -50,6 +76,15 @@ def create_application() -> FastAPI:
         allow_headers=settings.ALLOWED_HEADERS,
     )
 
+    # Pin clients to the primary database right after they write
+    app.add_middleware(PrimaryStickinessMiddleware)
+
+    # ETags of the user-scoped GET endpoints (see check_current_user_etag)
+    app.add_middleware(ConditionalGetMiddleware)
+
+    # Per-request SQL counts and timing (Server-Timing header, /metrics)
+    app.add_middleware(QueryStatsMiddleware)
+
     # Exception handlers
     add_exception_handlers(app)
 
@@ -65,6 +100,17 @@ def create_application() -> FastAPI:
             "environment": settings.ENVIRONMENT,
         }
 
+    @app.get("/metrics")
+    async def metrics(current_user: Principal = Depends(get_current_principal)):
+        """Connection pool, SQL compile cache and per-endpoint query metrics (superusers only)"""
+        if not current_user.is_superuser:
+            raise HTTPException(status_code=403, detail="Not authorized to view metrics")
+        return {
+            "db_pool": get_pool_metrics(),
+            "sql_compile_cache": get_compile_cache_metrics(),
+            "sql_requests": get_endpoint_query_metrics(),
+        }
+
     return app
 
 
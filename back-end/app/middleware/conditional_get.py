@@ -0,0 +1,36 @@
+"""
+Conditional GET middleware
+"""
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class ConditionalGetMiddleware:
+    """
+    Send the ETag a conditional-GET dependency computed for the request
+
+    Endpoints often return their own Response objects (RowsResponse,
+    json_response), which ignore headers set on the injected Response, so
+    the tag travels on ``request.state`` and is added here to successful
+    responses. 304 answers carry their headers themselves.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                etag = scope.get("state", {}).get("etag")
+                if etag is not None:
+                    headers = MutableHeaders(scope=message)
+                    headers["ETag"] = etag
+                    headers["Cache-Control"] = "private, no-cache"
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
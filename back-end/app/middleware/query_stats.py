@@ -0,0 +1,47 @@
+"""
+Per-request SQL statistics middleware
+"""
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.db.query_stats import record_endpoint, track_queries
+
+
+class QueryStatsMiddleware:
+    """
+    Count each request's SQL statements and report them
+
+    The statement count and database time so far are sent in a
+    ``Server-Timing`` header (visible in browser dev tools), and the final
+    numbers are added to the per-endpoint counters on GET /metrics. For
+    streamed responses the header only covers the queries run before the
+    first byte.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "Server-Timing",
+                        f'db;dur={stats.seconds * 1000:.1f};desc="{stats.count} queries"',
+                    )
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                # Routing stores the matched route in the scope; key on its template
+                route = scope.get("route")
+                path = getattr(route, "path", None) or "<unmatched>"
+                record_endpoint(f"{scope['method']} {path}", stats)
@@ -0,0 +1,32 @@
+"""
+Primary stickiness middleware
+"""
+
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.db.routing import SAFE_METHODS, replica_router
+
+
+class PrimaryStickinessMiddleware:
+    """
+    Pin a client to the primary database after a successful write
+
+    Written as plain ASGI middleware so it adds no per-request task or
+    body buffering on the read path.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                replica_router.mark_write(Request(scope))
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
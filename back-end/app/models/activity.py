@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Enum, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Enum, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -10,12 +10,25 @@ class ActivityType(enum.Enum):
     WATERED = "watered"
 
 class Activity(Base):
+    """
+    Activity feed entry
+
+    On PostgreSQL the table is range-partitioned by month on created_at (see
+    app.db.partitions and migration 0007); its primary key there is
+    (id, created_at), as partitioning requires. ids stay unique through the
+    shared sequence, so the model keeps id as its identity.
+    """
+
     __tablename__ = "activities"
+    __table_args__ = (
+        # Serves the per-user feed ordered by (created_at, id)
+        Index("ix_activities_user_id_created_at", "user_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    plant_id = Column(Integer, ForeignKey("plants.id"), nullable=True)
-    diagnosis_id = Column(Integer, ForeignKey("diagnoses.id"), nullable=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    plant_id = Column(Integer, ForeignKey("plants.id", ondelete="CASCADE"), nullable=True)
+    diagnosis_id = Column(Integer, ForeignKey("diagnoses.id", ondelete="CASCADE"), nullable=True)
     activity_type = Column(Enum(ActivityType, values_callable=lambda x: [e.name for e in x]), nullable=False)
     title = Column(String(255), nullable=True)
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
@@ -27,3 +40,25 @@ class Activity(Base):
 # Add back_populates to User and Plant models:
 # User.activities = relationship("Activity", back_populates="user")
 # Plant.activities = relationship("Activity", back_populates="plant")
+
+
+class ActivityArchive(Base):
+    """
+    Activities older than the retention period, moved out of the live table
+
+    Same columns as activities, without foreign keys, so archived rows do not
+    block deleting the users, plants or diagnoses they refer to.
+    """
+
+    __tablename__ = "activities_archive"
+    __table_args__ = (
+        Index("ix_activities_archive_user_id_created_at", "user_id", "created_at"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    user_id = Column(Integer, nullable=False)
+    plant_id = Column(Integer, nullable=True)
+    diagnosis_id = Column(Integer, nullable=True)
+    activity_type = Column(Enum(ActivityType, values_callable=lambda x: [e.name for e in x]), nullable=False)
+    title = Column(String(255), nullable=True)
+    created_at = Column(DateTime(timezone=True), nullable=False)
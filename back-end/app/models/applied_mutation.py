@@ -0,0 +1,27 @@
+"""
+Applied mutation database model
+"""
+from sqlalchemy import JSON, Column, DateTime, ForeignKey, Integer, String
+from app.db.database import Base
+
+
+class AppliedMutation(Base):
+    """
+    Outcome of a batched mutation, keyed by its client-generated ID
+
+    Written in the same transaction as the mutation, so a batch the client
+    retries (e.g. after losing the response) replays the stored outcome
+    instead of applying the operation twice. Pruned with the sync tombstones
+    by ``python -m app.jobs.prune_sync_records``.
+    """
+
+    __tablename__ = "applied_mutations"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    client_id = Column(String(64), primary_key=True)
+    status_code = Column(Integer, nullable=False)
+    result = Column(JSON, nullable=True)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self):
+        return f"<AppliedMutation(user_id={self.user_id}, client_id={self.client_id})>"
@@ -0,0 +1,22 @@
+"""
+Cache version database model
+"""
+from sqlalchemy import BigInteger, Column, String
+from app.db.database import Base
+
+
+class CacheVersion(Base):
+    """
+    Version counter of a process-local cache
+
+    Writers bump the counter in the same transaction as the data they
+    change; every worker polls it and reloads its cache when it moves.
+    """
+
+    __tablename__ = "cache_versions"
+
+    name = Column(String(50), primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0, server_default="0")
+
+    def __repr__(self):
+        return f"<CacheVersion(name={self.name}, version={self.version})>"
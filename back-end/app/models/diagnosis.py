@@ -2,9 +2,9 @@
 Diagnosis database model
 """
 
-from sqlalchemy import Column, Integer, String, Float, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, Text, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
-from datetime import datetime
+from datetime import datetime, timezone
 from app.db.database import Base
 
 
@@ -14,6 +14,15 @@ class Diagnosis(Base):
     """
 
     __tablename__ = "diagnoses"
+    __table_args__ = (
+        # Serves the per-user diagnosis list ordered by (created_at, id)
+        Index("ix_diagnoses_user_id_created_at", "user_id", "created_at", "id"),
+        # Serves per-plant history in time order: the health trend windows,
+        # the latest-health snapshot and the per-plant list
+        Index("ix_diagnoses_plant_id_created_at", "plant_id", "created_at", "id"),
+        # Serves delta sync: a user's diagnoses changed since a watermark
+        Index("ix_diagnoses_user_id_updated_at", "user_id", "updated_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(
@@ -26,7 +35,6 @@ class Diagnosis(Base):
         Integer,
         ForeignKey("plants.id", ondelete="CASCADE"),
         nullable=True,  # Allow standalone diagnoses without a plant
-        index=True
     )
     plant_common_name = Column(String(255), nullable=True)
     issue_detected = Column(String(255), nullable=False)
@@ -42,7 +50,15 @@ class Diagnosis(Base):
     recovery_temperature = Column(String(255), nullable=True)
     
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+    updated_at = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        nullable=True,
+    )
 
     # Relationship to Plant
     plant = relationship("Plant", back_populates="diagnoses", lazy="joined")
-    activities = relationship("Activity", back_populates="diagnosis", cascade="all, delete-orphan", lazy="selectin")
+    activities = relationship(
+        "Activity", back_populates="diagnosis", cascade="all, delete-orphan", passive_deletes=True, lazy="raise"
+    )
@@ -3,13 +3,23 @@ Plant database model
 """
 
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Boolean, Column, Integer, String, DateTime, ForeignKey, Index, false
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
 from app.db.database import Base
 
 class Plant(Base):
     __tablename__ = "plants"
+    __table_args__ = (
+        # Serves the per-user garden list ordered by id
+        Index("ix_plants_user_id_id", "user_id", "id"),
+        # Serves a user's due-soon list ordered by next watering
+        Index("ix_plants_user_id_next_water_at", "user_id", "next_water_at"),
+        # Serves the reminder job's keyset scan across all users
+        Index("ix_plants_next_water_at_id", "next_water_at", "id"),
+        # Serves delta sync: a user's plants changed since a watermark
+        Index("ix_plants_user_id_updated_at", "user_id", "updated_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -25,9 +35,33 @@ class Plant(Base):
     last_watered = Column(DateTime(timezone=True), nullable=True)
     image_url = Column(String(500), nullable=True)
     acquired_date = Column(DateTime(timezone=True), nullable=True)
+    # Watered within the species' watering interval; set when watered, cleared
+    # by the profile stats reconciliation job once the interval has passed
+    watered_on_time = Column(Boolean, default=False, server_default=false(), nullable=False)
+    # When the plant is next due for water: last_watered plus the species'
+    # interval, or the time it was added if never watered. NULL when the
+    # species has no watering interval
+    next_water_at = Column(DateTime(timezone=True), nullable=True)
+    # Snapshot of the latest diagnosis (by created_at, id) for health badges,
+    # kept in step by DiagnosisService; all NULL when never diagnosed. No
+    # foreign key: diagnoses already reference plants
+    last_diagnosis_id = Column(Integer, nullable=True)
+    last_severity = Column(String(50), nullable=True)
+    last_issue = Column(String(255), nullable=True)
+    last_diagnosed_at = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        nullable=True,
+    )
 
     # relationships
     owner = relationship("User", back_populates="plants", lazy="selectin")
     species = relationship("PlantSpecies", back_populates="plants", lazy="joined", uselist=False)
-    diagnoses = relationship("Diagnosis", back_populates="plant", cascade="all, delete-orphan", lazy="selectin")
-    activities = relationship("Activity", back_populates="plant", cascade="all, delete-orphan", lazy="selectin")
+    diagnoses = relationship(
+        "Diagnosis", back_populates="plant", cascade="all, delete-orphan", passive_deletes=True, lazy="raise"
+    )
+    activities = relationship(
+        "Activity", back_populates="plant", cascade="all, delete-orphan", passive_deletes=True, lazy="raise"
+    )
@@ -0,0 +1,34 @@
+"""
+Plant health rollup database model
+"""
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer
+from app.db.database import Base
+
+
+class PlantHealthRollup(Base):
+    """
+    Per-plant summary of the diagnosis history
+
+    Derived from diagnoses by PlantHealthRepository.refresh_rollups, which
+    DiagnosisService calls in the same transaction as every diagnosis write.
+    Plants never diagnosed have no row.
+    """
+
+    __tablename__ = "plant_health_rollups"
+
+    plant_id = Column(Integer, ForeignKey("plants.id", ondelete="CASCADE"), primary_key=True)
+    diagnosis_count = Column(Integer, nullable=False)
+    # Transitions to a lower / higher severity rank than the diagnosis before
+    improvements = Column(Integer, nullable=False)
+    regressions = Column(Integer, nullable=False)
+    first_diagnosed_at = Column(DateTime(timezone=True), nullable=False)
+    last_diagnosed_at = Column(DateTime(timezone=True), nullable=False)
+    # Latest diagnosis that found a problem (severity rank above "Healthy")
+    last_issue_at = Column(DateTime(timezone=True), nullable=True)
+    latest_severity_rank = Column(Integer, nullable=True)
+    previous_severity_rank = Column(Integer, nullable=True)
+    average_confidence = Column(Float, nullable=True)
+    refreshed_at = Column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self):
+        return f"<PlantHealthRollup(plant_id={self.plant_id}, diagnosis_count={self.diagnosis_count})>"
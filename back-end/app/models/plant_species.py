@@ -1,12 +1,27 @@
 """
 Plant species database model
 """
-from sqlalchemy import Column, Integer, String, Float
+from sqlalchemy import Column, Integer, String, Float, Index
 from sqlalchemy.orm import relationship
 from app.db.database import Base
 
 class PlantSpecies(Base):
     __tablename__ = "plant_species"
+    __table_args__ = (
+        # Trigram indexes for the species search (PostgreSQL only, needs pg_trgm)
+        Index(
+            "ix_plant_species_common_name_trgm",
+            "common_name",
+            postgresql_using="gin",
+            postgresql_ops={"common_name": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_plant_species_scientific_name_trgm",
+            "scientific_name",
+            postgresql_using="gin",
+            postgresql_ops={"scientific_name": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
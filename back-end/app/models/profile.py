@@ -1,7 +1,7 @@
 """
 Profile database model
 """
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import backref, relationship
 from datetime import datetime
 from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Date
 from app.db.database import Base
@@ -23,12 +23,14 @@ class Profile(Base):
     experience_start_date = Column(Date, nullable=True)
     city = Column(String(100), nullable=True)
     country = Column(String(100), nullable=True)
+    # Maintained incrementally by PlantService; care rate = on time / plant count
     plant_count = Column(Integer, default=0, nullable=True)
+    plants_watered_on_time = Column(Integer, default=0, server_default="0", nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationship to User model
-    user = relationship("User", backref="profile")
+    user = relationship("User", backref=backref("profile", passive_deletes=True))
 
     def __repr__(self):
         return f"<Profile(id={self.id}, user_id={self.user_id})>"
@@ -0,0 +1,26 @@
+"""
+Storage cleanup queue database model
+"""
+from datetime import datetime, timezone
+from sqlalchemy import Column, DateTime, Integer, String, Text
+from app.db.database import Base
+
+
+class StorageCleanup(Base):
+    """
+    Image whose database row is gone and whose stored file still has to be removed
+
+    Filled by background account deletion and drained by
+    ``python -m app.jobs.purge_accounts``.
+    """
+
+    __tablename__ = "storage_cleanup"
+
+    id = Column(Integer, primary_key=True)
+    bucket = Column(String(100), nullable=False)
+    image_url = Column(Text, nullable=False)
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")
+    created_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+
+    def __repr__(self):
+        return f"<StorageCleanup(id={self.id}, bucket={self.bucket})>"
@@ -0,0 +1,33 @@
+"""
+Sync tombstone database model
+"""
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String
+from app.db.database import Base
+
+# Entity types a tombstone can stand for
+SYNC_PLANT = "plant"
+SYNC_DIAGNOSIS = "diagnosis"
+
+
+class SyncTombstone(Base):
+    """
+    Record of a deleted plant or diagnosis, so delta sync can report the deletion
+
+    Kept for SYNC_TOMBSTONE_RETENTION_DAYS; clients with an older watermark
+    get a full sync instead.
+    """
+
+    __tablename__ = "sync_tombstones"
+    __table_args__ = (
+        # Serves a user's deletions since a watermark
+        Index("ix_sync_tombstones_user_id_deleted_at", "user_id", "deleted_at"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    entity = Column(String(20), nullable=False)
+    entity_id = Column(Integer, nullable=False)
+    deleted_at = Column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self):
+        return f"<SyncTombstone(entity={self.entity}, entity_id={self.entity_id})>"
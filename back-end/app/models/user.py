@@ -21,11 +21,20 @@ class User(Base):
     full_name = Column(String, nullable=True)
     is_active = Column(Boolean, default=True)
     is_superuser = Column(Boolean, default=False)
+    token_version = Column(Integer, default=0, server_default="0", nullable=False)
+    # Set when the account is queued for background deletion
+    deletion_requested_at = Column(DateTime, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     def __repr__(self):
         return f"<User(id={self.id}, username={self.username}, email={self.email})>"
     
-    plants = relationship("Plant", back_populates="owner", cascade="all, delete-orphan", lazy="selectin")
-    activities = relationship("Activity", back_populates="user", cascade="all, delete-orphan", lazy="selectin")
+    # Child rows are removed by ON DELETE CASCADE in the database; the ORM
+    # never loads a collection just to delete it
+    plants = relationship(
+        "Plant", back_populates="owner", cascade="all, delete-orphan", passive_deletes=True, lazy="selectin"
+    )
+    activities = relationship(
+        "Activity", back_populates="user", cascade="all, delete-orphan", passive_deletes=True, lazy="raise"
+    )
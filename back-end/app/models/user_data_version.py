@@ -0,0 +1,23 @@
+"""
+User data version database model
+"""
+from sqlalchemy import BigInteger, Column, ForeignKey, Integer
+from app.db.database import Base
+
+
+class UserDataVersion(Base):
+    """
+    Version counter of everything a user's GET endpoints return
+
+    Every write to a user's plants, diagnoses, activities, profile or account
+    bumps it in the same transaction. The counter backs the ETags of the
+    user-scoped GET endpoints; a user without a row is at version 0.
+    """
+
+    __tablename__ = "user_data_versions"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0, server_default="0")
+
+    def __repr__(self):
+        return f"<UserDataVersion(user_id={self.user_id}, version={self.version})>"
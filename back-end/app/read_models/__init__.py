@@ -0,0 +1,9 @@
+"""
+Read models - lightweight rows for hot list endpoints
+
+Queries here select exact columns with SQLAlchemy Core and pack each row
+into a ``__slots__`` dataclass, skipping ORM identity-map bookkeeping,
+relationship loading and Pydantic re-validation. Rows are serialized
+straight to JSON by RowsResponse. Write paths keep using the ORM models in
+``app.models``.
+"""
@@ -0,0 +1,32 @@
+"""
+Row base class and JSON response for read models
+"""
+
+from typing import Any
+
+from fastapi import Response
+
+from app.utils.serialization import dumps
+
+
+class SlotRow:
+    """
+    Base for read-model rows
+
+    Subclasses are ``@dataclass(slots=True)``; fields are declared in the
+    order the matching response schema lists them, so the JSON keys match.
+    orjson serializes them natively, without building per-row dicts.
+    """
+
+    __slots__ = ()
+
+
+class RowsResponse(Response):
+    """
+    JSON response for read-model rows (one row or a list), serialized without Pydantic
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,139 @@
+"""
+Diagnosis list read model
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy import func, lambda_stmt, literal, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.diagnosis import Diagnosis
+from app.models.plant import Plant
+from app.read_models.base import SlotRow
+
+
+@dataclass(slots=True)
+class DiagnosisRow(SlotRow):
+    """
+    Diagnosis as in DiagnosisResponse
+    """
+
+    id: int
+    user_id: int
+    plant_id: Optional[int]
+    created_at: datetime
+    plant_common_name: Optional[str]
+    issue_detected: str
+    confidence_score: float
+    severity: str
+    recommendation: Optional[str]
+    image_url: Optional[str]
+    recovery_watering: Optional[str]
+    recovery_sunlight: Optional[str]
+    recovery_air_circulation: Optional[str]
+    recovery_temperature: Optional[str]
+    plant_name: str
+
+
+# Display name: the plant's nickname, else the AI-identified name
+PLANT_NAME = func.coalesce(
+    Plant.plant_name, Diagnosis.plant_common_name, literal("Standalone Diagnosis")
+).label("plant_name")
+
+DIAGNOSIS_COLUMNS = tuple(getattr(Diagnosis, name) for name in DiagnosisRow.__slots__[:-1])
+
+
+class DiagnosisReadRepository:
+    """
+    Column-level diagnosis queries returning DiagnosisRow objects
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize diagnosis read repository
+
+        Args:
+            session: Database session
+        """
+        self.session = session
+
+    async def get_by_id(self, diagnosis_id: int) -> Optional[Tuple[DiagnosisRow, Optional[int]]]:
+        """
+        Get a diagnosis with the owner of its plant, for the caller's access check
+
+        Returns:
+            Tuple of (row, plant owner's user ID or None), or None if not found
+        """
+        stmt = lambda_stmt(
+            lambda: select(*DIAGNOSIS_COLUMNS, PLANT_NAME, Plant.user_id)
+            .outerjoin(Plant, Plant.id == Diagnosis.plant_id)
+            .where(Diagnosis.id == diagnosis_id)
+        )
+        result = await self.session.execute(stmt)
+        row = result.tuples().one_or_none()
+        if row is None:
+            return None
+        return DiagnosisRow(*row[:-1]), row[-1]
+
+    async def get_by_user_id(
+        self,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> List[DiagnosisRow]:
+        """
+        List a user's diagnoses, newest first (same paging as DiagnosisRepository.get_by_user_id)
+        """
+        stmt = lambda_stmt(
+            lambda: select(*DIAGNOSIS_COLUMNS, PLANT_NAME)
+            .outerjoin(Plant, Plant.id == Diagnosis.plant_id)
+            .where(Diagnosis.user_id == user_id)
+            .order_by(Diagnosis.created_at.desc(), Diagnosis.id.desc())
+            .limit(limit)
+        )
+        if after is not None:
+            after_created, after_id = after
+            stmt += lambda s: s.where(
+                tuple_(Diagnosis.created_at, Diagnosis.id) < tuple_(after_created, after_id)
+            )
+        else:
+            stmt += lambda s: s.offset(skip)
+        result = await self.session.execute(stmt)
+        return [DiagnosisRow(*row) for row in result.tuples()]
+
+    async def get_changed_for_user(self, user_id: int, since: Optional[datetime]) -> List[DiagnosisRow]:
+        """
+        List a user's diagnoses changed at or after ``since`` (all of them if None), by id
+
+        Served by the (user_id, updated_at) index.
+        """
+        stmt = lambda_stmt(
+            lambda: select(*DIAGNOSIS_COLUMNS, PLANT_NAME)
+            .outerjoin(Plant, Plant.id == Diagnosis.plant_id)
+            .where(Diagnosis.user_id == user_id)
+            .order_by(Diagnosis.id)
+        )
+        if since is not None:
+            stmt += lambda s: s.where(Diagnosis.updated_at >= since)
+        result = await self.session.execute(stmt)
+        return [DiagnosisRow(*row) for row in result.tuples()]
+
+    async def get_by_plant_id(
+        self, plant_id: int, skip: int = 0, limit: int = 100
+    ) -> List[DiagnosisRow]:
+        """
+        List a plant's diagnoses, newest first
+        """
+        stmt = lambda_stmt(
+            lambda: select(*DIAGNOSIS_COLUMNS, PLANT_NAME)
+            .outerjoin(Plant, Plant.id == Diagnosis.plant_id)
+            .where(Diagnosis.plant_id == plant_id)
+            .order_by(Diagnosis.created_at.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        return [DiagnosisRow(*row) for row in result.tuples()]
@@ -0,0 +1,166 @@
+"""
+Plant list read model
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy import lambda_stmt, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.plant import Plant
+from app.models.plant_species import PlantSpecies
+from app.read_models.base import SlotRow
+
+
+@dataclass(slots=True, frozen=True)
+class SpeciesRow(SlotRow):
+    """
+    Species as in PlantSpeciesResponse
+
+    Frozen: the species cache shares one instance across requests.
+    """
+
+    id: int
+    scientific_name: Optional[str]
+    common_name: str
+    care_difficulty: Optional[str]
+    watering_frequency_days: Optional[int]
+    sunlight_hours_needed: Optional[float]
+    sunlight_type: Optional[str]
+    humidity_preference: Optional[str]
+    temperature_min: Optional[float]
+
+
+@dataclass(slots=True)
+class PlantRow(SlotRow):
+    """
+    Plant as in PlantResponse
+    """
+
+    id: int
+    user_id: int
+    species_id: int
+    plant_name: str
+    location: Optional[str]
+    last_watered: Optional[datetime]
+    next_water_at: Optional[datetime]
+    acquired_date: Optional[datetime]
+    image_url: Optional[str]
+    last_diagnosis_id: Optional[int]
+    last_severity: Optional[str]
+    last_issue: Optional[str]
+    last_diagnosed_at: Optional[datetime]
+    species: SpeciesRow
+
+
+PLANT_COLUMNS = tuple(getattr(Plant, name) for name in PlantRow.__slots__[:-1])
+SPECIES_COLUMNS = tuple(getattr(PlantSpecies, name) for name in SpeciesRow.__slots__)
+
+
+class PlantReadRepository:
+    """
+    Column-level plant queries returning PlantRow objects
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize plant read repository
+
+        Args:
+            session: Database session
+        """
+        self.session = session
+
+    async def _fetch(self, stmt) -> List[PlantRow]:
+        result = await self.session.execute(stmt)
+        split = len(PLANT_COLUMNS)
+        return [PlantRow(*row[:split], SpeciesRow(*row[split:])) for row in result.tuples()]
+
+    async def get_by_id_for_user(self, plant_id: int, user_id: int) -> Optional[PlantRow]:
+        """
+        Get a single plant belonging to a user, without loading its relationships
+        """
+        stmt = lambda_stmt(
+            lambda: select(*PLANT_COLUMNS, *SPECIES_COLUMNS)
+            .join(PlantSpecies, PlantSpecies.id == Plant.species_id)
+            .where(Plant.id == plant_id, Plant.user_id == user_id)
+        )
+        rows = await self._fetch(stmt)
+        return rows[0] if rows else None
+
+    async def get_all_for_user(
+        self,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[Tuple[int]] = None,
+    ) -> List[PlantRow]:
+        """
+        List plants for a user, newest first (same paging as PlantRepository.get_all_for_user)
+        """
+        stmt = lambda_stmt(
+            lambda: select(*PLANT_COLUMNS, *SPECIES_COLUMNS)
+            .join(PlantSpecies, PlantSpecies.id == Plant.species_id)
+            .where(Plant.user_id == user_id)
+            .order_by(Plant.id.desc())
+            .limit(limit)
+        )
+        if after is not None:
+            after_id = after[0]
+            stmt += lambda s: s.where(Plant.id < after_id)
+        else:
+            stmt += lambda s: s.offset(skip)
+        return await self._fetch(stmt)
+
+    async def get_changed_for_user(self, user_id: int, since: Optional[datetime]) -> List[PlantRow]:
+        """
+        List a user's plants changed at or after ``since`` (all of them if None), by id
+
+        Served by the (user_id, updated_at) index.
+        """
+        stmt = lambda_stmt(
+            lambda: select(*PLANT_COLUMNS, *SPECIES_COLUMNS)
+            .join(PlantSpecies, PlantSpecies.id == Plant.species_id)
+            .where(Plant.user_id == user_id)
+            .order_by(Plant.id)
+        )
+        if since is not None:
+            stmt += lambda s: s.where(Plant.updated_at >= since)
+        return await self._fetch(stmt)
+
+    async def get_due_for_user(
+        self,
+        user_id: int,
+        before: datetime,
+        limit: int = 50,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> List[PlantRow]:
+        """
+        List a user's plants due for water by ``before``, soonest first
+
+        Overdue plants are included. Served by the (user_id, next_water_at) index.
+
+        Args:
+            user_id: User ID
+            before: Include plants due at or before this time
+            limit: Maximum number of plants
+            after: ``(next_water_at, id)`` key of the last plant already seen
+
+        Returns:
+            Plant rows ordered by (next_water_at, id)
+        """
+        stmt = lambda_stmt(
+            lambda: select(*PLANT_COLUMNS, *SPECIES_COLUMNS)
+            .join(PlantSpecies, PlantSpecies.id == Plant.species_id)
+            .where(Plant.user_id == user_id, Plant.next_water_at <= before)
+            .order_by(Plant.next_water_at, Plant.id)
+            .limit(limit)
+        )
+        if after is not None:
+            after_due, after_id = after
+            stmt += lambda s: s.where(
+                tuple_(Plant.next_water_at, Plant.id) > tuple_(after_due, after_id)
+            )
+        return await self._fetch(stmt)
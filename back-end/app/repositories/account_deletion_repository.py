@@ -0,0 +1,122 @@
+"""
+Account deletion repository for data access
+"""
+
+from datetime import datetime, timezone
+from typing import List, Optional, Type, Union
+
+from sqlalchemy import delete, insert, literal, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.activity import Activity, ActivityArchive
+from app.models.diagnosis import Diagnosis
+from app.models.plant import Plant
+from app.models.storage_cleanup import StorageCleanup
+from app.models.user import User
+
+OwnedModel = Type[Union[Activity, ActivityArchive, Diagnosis, Plant]]
+
+
+class AccountDeletionRepository:
+    """
+    Removes a user's data in bounded batches and tracks images left to clean up
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize account deletion repository
+
+        Args:
+            session: Database session
+        """
+        self.session = session
+
+    async def delete_owned_batch(
+        self,
+        model: OwnedModel,
+        user_id: int,
+        batch_size: int,
+        image_bucket: Optional[str] = None,
+    ) -> int:
+        """
+        Delete up to ``batch_size`` of a user's rows from one table
+
+        Rows referencing the deleted ones go with them through ON DELETE
+        CASCADE.
+
+        Args:
+            model: Model with a ``user_id`` column
+            user_id: User ID
+            batch_size: Maximum number of rows to delete
+            image_bucket: When given, the rows' ``image_url`` values are queued
+                for removal from this storage bucket
+
+        Returns:
+            Number of deleted rows
+        """
+        ids = (
+            await self.session.execute(
+                select(model.id).where(model.user_id == user_id).order_by(model.id).limit(batch_size)
+            )
+        ).scalars().all()
+        if not ids:
+            return 0
+
+        if image_bucket is not None:
+            await self.session.execute(
+                insert(StorageCleanup).from_select(
+                    ["bucket", "image_url", "created_at"],
+                    select(
+                        literal(image_bucket), model.image_url, literal(datetime.now(timezone.utc))
+                    ).where(model.id.in_(ids), model.image_url.is_not(None)),
+                )
+            )
+        await self.session.execute(
+            delete(model).where(model.id.in_(ids)).execution_options(synchronize_session=False)
+        )
+        return len(ids)
+
+    async def delete_user(self, user_id: int) -> bool:
+        """
+        Delete the user row itself (the profile cascades)
+
+        Returns:
+            True if deleted, False if not found
+        """
+        result = await self.session.execute(
+            delete(User).where(User.id == user_id).execution_options(synchronize_session=False)
+        )
+        return result.rowcount > 0
+
+    async def get_storage_cleanup_batch(
+        self, batch_size: int, max_attempts: int, after_id: int = 0
+    ) -> List[StorageCleanup]:
+        """
+        Oldest queued images after ``after_id`` that have not failed ``max_attempts`` times yet
+        """
+        result = await self.session.execute(
+            select(StorageCleanup)
+            .where(StorageCleanup.id > after_id, StorageCleanup.attempts < max_attempts)
+            .order_by(StorageCleanup.id)
+            .limit(batch_size)
+        )
+        return list(result.scalars().all())
+
+    async def remove_storage_cleanup(self, ids: List[int]) -> None:
+        """
+        Drop queued images that were removed from storage
+        """
+        if ids:
+            await self.session.execute(delete(StorageCleanup).where(StorageCleanup.id.in_(ids)))
+
+    async def record_storage_cleanup_failure(self, ids: List[int]) -> None:
+        """
+        Count a failed removal attempt for queued images
+        """
+        if ids:
+            await self.session.execute(
+                update(StorageCleanup)
+                .where(StorageCleanup.id.in_(ids))
+                .values(attempts=StorageCleanup.attempts + 1)
+                .execution_options(synchronize_session=False)
+            )
@@ -1,13 +1,198 @@
-from app.models.activity import Activity, ActivityType
-from typing import List
+from app.models.activity import Activity, ActivityArchive, ActivityType
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import column, delete, func, insert, select, table, text, tuple_
 
-async def get_activities_by_user_id(user_id: int, db: AsyncSession) -> List[Activity]:
+from app.core.config import settings
+from app.db.partitions import (
+    ACTIVITY_DEFAULT_PARTITION,
+    add_months,
+    create_partition_sql,
+    month_start,
+    partition_month,
+    partition_name,
+)
+from app.repositories.user_data_version_repository import UserDataVersionRepository
+
+ARCHIVE_COLUMNS = ("id", "user_id", "plant_id", "diagnosis_id", "activity_type", "title", "created_at")
+
+async def get_activities_by_user_id(
+    user_id: int,
+    db: AsyncSession,
+    limit: int = 100,
+    after: Optional[Tuple[datetime, int]] = None,
+) -> List[Activity]:
+    """
+    Get a page of a user's activity feed, newest first
+
+    Pass ``after`` (the ``(created_at, id)`` key of the last activity already
+    seen) to fetch the next page.
+
+    The page is read in windows of ACTIVITY_FEED_WINDOW_MONTHS months going
+    back from the cursor, so each query only touches a few monthly
+    partitions; an older window is only read when the newer ones do not
+    fill the page. Before reading one, a ``max(created_at)`` probe finds the
+    next older activity, so empty months are skipped and a sparse feed stops
+    as soon as nothing older is left. Past the retention horizon the last
+    window is open-ended.
+    """
+    anchor = after[0] if after is not None else datetime.now(timezone.utc)
+    if anchor.tzinfo is None:
+        # SQLite hands back naive UTC timestamps
+        anchor = anchor.replace(tzinfo=timezone.utc)
+    window = settings.ACTIVITY_FEED_WINDOW_MONTHS
+    horizon = add_months(month_start(datetime.now(timezone.utc)), -settings.ACTIVITY_RETENTION_MONTHS)
+    upper: Optional[datetime] = None
+    lower: Optional[datetime] = add_months(month_start(anchor), 1 - window)
+
+    activities: List[Activity] = []
+    while True:
+        stmt = (
+            select(Activity)
+            .where(Activity.user_id == user_id)
+            .order_by(Activity.created_at.desc(), Activity.id.desc())
+            .limit(limit - len(activities))
+        )
+        if after is not None:
+            stmt = stmt.where(tuple_(Activity.created_at, Activity.id) < tuple_(*after))
+        if upper is not None:
+            stmt = stmt.where(Activity.created_at < upper)
+        if lower is not None:
+            stmt = stmt.where(Activity.created_at >= lower)
+        result = await db.execute(stmt)
+        activities.extend(result.scalars().all())
+        if len(activities) >= limit or lower is None:
+            return activities
+        probe = select(func.max(Activity.created_at)).where(
+            Activity.user_id == user_id, Activity.created_at < lower
+        )
+        if after is not None:
+            probe = probe.where(tuple_(Activity.created_at, Activity.id) < tuple_(*after))
+        newest = (await db.execute(probe)).scalar()
+        if newest is None:
+            return activities
+        if newest.tzinfo is None:
+            newest = newest.replace(tzinfo=timezone.utc)
+        upper = lower
+        lower = add_months(month_start(newest), 1 - window) if lower > horizon else None
+
+async def add_activities(rows: List[Dict], db: AsyncSession) -> None:
+    """
+    Insert many activities with a single multi-row INSERT
+
+    ``rows`` holds the column values of one activity per dict. Uses a
+    VALUES list rather than executemany, so it is one statement on every driver.
+    """
+    if rows:
+        await db.execute(insert(Activity).values(rows))
+
+async def create_activity_partitions(db: AsyncSession, first_month: datetime, months: int) -> None:
+    """
+    Create the monthly activities partitions from ``first_month`` on (PostgreSQL)
+
+    Existing partitions are left alone. PostgreSQL refuses a new range that
+    overlaps rows already in the default partition, so when it holds rows of
+    a new month the default partition is detached, those rows are moved into
+    the new partition and the default partition is attached again.
+    """
+    existing = await get_activity_partitions(db)
+    month = month_start(first_month.astimezone(timezone.utc))
+    for _ in range(months):
+        if partition_name(month) not in existing:
+            await _create_activity_partition(db, month)
+        month = add_months(month, 1)
+
+async def _create_activity_partition(db: AsyncSession, month: datetime) -> None:
+    """
+    Create the partition for ``month``, taking its rows out of the default partition
+    """
+    columns = ", ".join(ARCHIVE_COLUMNS)
+    bounds = {"start": month, "end": add_months(month, 1)}
+    in_month = f"FROM {ACTIVITY_DEFAULT_PARTITION} WHERE created_at >= :start AND created_at < :end"
+    if (await db.execute(text(f"SELECT 1 {in_month} LIMIT 1"), bounds)).first() is None:
+        await db.execute(text(create_partition_sql(month)))
+        return
+    await db.execute(text(f"ALTER TABLE activities DETACH PARTITION {ACTIVITY_DEFAULT_PARTITION}"))
+    await db.execute(text(create_partition_sql(month)))
+    await db.execute(
+        text(
+            f"WITH moved AS (DELETE {in_month} RETURNING {columns}) "
+            f"INSERT INTO activities ({columns}) SELECT {columns} FROM moved"
+        ),
+        bounds,
+    )
+    await db.execute(text(f"ALTER TABLE activities ATTACH PARTITION {ACTIVITY_DEFAULT_PARTITION} DEFAULT"))
+
+async def get_activity_partitions(db: AsyncSession) -> Dict[str, datetime]:
+    """
+    Monthly partitions of activities (PostgreSQL)
+
+    Returns:
+        Mapping of partition name to the month start it holds
+    """
     result = await db.execute(
-        select(Activity).where(Activity.user_id == user_id).order_by(Activity.created_at.desc())
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = 'activities'"
+        )
+    )
+    partitions = {}
+    for (name,) in result.tuples():
+        month = partition_month(name)
+        if month is not None:
+            partitions[name] = month
+    return partitions
+
+async def archive_partition(db: AsyncSession, name: str) -> int:
+    """
+    Move a whole monthly partition into activities_archive and drop it (PostgreSQL)
+
+    The partition is detached first, so the live table stops seeing it
+    before its rows are copied. Its users' feeds change, so their data
+    versions are bumped.
+
+    Returns:
+        Number of archived activities
+    """
+    columns = ", ".join(ARCHIVE_COLUMNS)
+    await UserDataVersionRepository(db).bump_many(
+        select(column("user_id")).select_from(table(name)).distinct()
     )
-    return result.scalars().all()
+    await db.execute(text(f"ALTER TABLE activities DETACH PARTITION {name}"))
+    result = await db.execute(
+        text(f"INSERT INTO activities_archive ({columns}) SELECT {columns} FROM {name}")
+    )
+    await db.execute(text(f"DROP TABLE {name}"))
+    return result.rowcount
+
+async def archive_activities_before(db: AsyncSession, cutoff: datetime, batch_size: int = 1000) -> int:
+    """
+    Move one batch of activities older than ``cutoff`` into activities_archive
+
+    Used for rows that are not in a droppable monthly partition (the default
+    partition, or the plain table on other databases). Bumps the data
+    versions of the users whose activities moved.
+
+    Returns:
+        Number of archived activities (fewer than ``batch_size`` means done)
+    """
+    ids = (
+        await db.execute(
+            select(Activity.id).where(Activity.created_at < cutoff).order_by(Activity.id).limit(batch_size)
+        )
+    ).scalars().all()
+    if not ids:
+        return 0
+    # The created_at bound lets PostgreSQL prune the partitions newer than the cutoff
+    batch = (Activity.id.in_(ids), Activity.created_at < cutoff)
+    await UserDataVersionRepository(db).bump_many(select(Activity.user_id).where(*batch).distinct())
+    columns = [getattr(Activity, name) for name in ARCHIVE_COLUMNS]
+    await db.execute(insert(ActivityArchive).from_select(ARCHIVE_COLUMNS, select(*columns).where(*batch)))
+    await db.execute(delete(Activity).where(*batch))
+    return len(ids)
 
 # Example usage:
 # activities = get_activities_by_user_id(user_id, db)
@@ -2,8 +2,8 @@
 Base repository with common CRUD operations
 """
 
-from typing import Generic, TypeVar, Type, Optional, List
-from sqlalchemy import select
+from typing import Generic, TypeVar, Type, Optional, List, Tuple
+from sqlalchemy import lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.database import Base
@@ -38,25 +38,33 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             Model instance or None
         """
+        # Lambda statement: built and cache-keyed once per model, not per call
+        model = self.model
         result = await self.session.execute(
-            select(self.model).where(self.model.id == id)
+            lambda_stmt(lambda: select(model).where(model.id == id))
         )
         return result.scalar_one_or_none()
 
-    async def get_all(self, skip: int = 0, limit: int = 100) -> List[ModelType]:
+    async def get_all(
+        self, skip: int = 0, limit: int = 100, after: Optional[Tuple[int]] = None
+    ) -> List[ModelType]:
         """
-        Get all records with pagination
+        Get all records with pagination, ordered by ID
 
         Args:
-            skip: Number of records to skip
+            skip: Number of records to skip (ignored when ``after`` is given)
             limit: Maximum number of records to return
+            after: Keyset cursor ``(id,)`` of the last record of the previous page
 
         Returns:
             List of model instances
         """
-        result = await self.session.execute(
-            select(self.model).offset(skip).limit(limit)
-        )
+        stmt = select(self.model).order_by(self.model.id.asc()).limit(limit)
+        if after is not None:
+            stmt = stmt.where(self.model.id > after[0])
+        else:
+            stmt = stmt.offset(skip)
+        result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
     async def create(self, **kwargs) -> ModelType:
@@ -71,8 +79,8 @@ class BaseRepository(Generic[ModelType]):
         """
         instance = self.model(**kwargs)
         self.session.add(instance)
+        # The INSERT's RETURNING clause fills in the generated primary key
         await self.session.flush()
-        await self.session.refresh(instance)
         return instance
 
     async def update(self, id: int, **kwargs) -> Optional[ModelType]:
@@ -92,7 +100,6 @@ class BaseRepository(Generic[ModelType]):
                 if hasattr(instance, key):
                     setattr(instance, key, value)
             await self.session.flush()
-            await self.session.refresh(instance)
         return instance
 
     async def delete(self, id: int) -> bool:
@@ -0,0 +1,53 @@
+"""
+Cache version repository for data access
+"""
+
+from typing import Optional
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.cache_version import CacheVersion
+
+
+class CacheVersionRepository:
+    """
+    Reads and bumps cache version counters
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize cache version repository
+
+        Args:
+            session: Database session
+        """
+        self.session = session
+
+    async def get(self, name: str) -> int:
+        """
+        Current version of a cache (0 if it was never bumped)
+
+        Args:
+            name: Cache name
+        """
+        result = await self.session.execute(
+            select(CacheVersion.version).where(CacheVersion.name == name)
+        )
+        version: Optional[int] = result.scalar_one_or_none()
+        return version or 0
+
+    async def bump(self, name: str) -> None:
+        """
+        Increment a cache's version in the current transaction
+
+        Args:
+            name: Cache name
+        """
+        result = await self.session.execute(
+            update(CacheVersion)
+            .where(CacheVersion.name == name)
+            .values(version=CacheVersion.version + 1)
+        )
+        if result.rowcount == 0:
+            await self.session.execute(insert(CacheVersion).values(name=name, version=1))
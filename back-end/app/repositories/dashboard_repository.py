@@ -0,0 +1,76 @@
+"""
+Dashboard repository for data access
+"""
+
+from datetime import datetime
+
+from sqlalchemy import func, select, true
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.activity import Activity
+from app.models.diagnosis import Diagnosis
+from app.models.plant import Plant
+from app.models.plant_species import PlantSpecies
+from app.repositories.plant_repository import PlantRepository
+
+
+class DashboardRepository:
+    """
+    Queries spanning several of a user's tables for the overview screen
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize dashboard repository
+
+        Args:
+            session: Database session
+        """
+        self.session = session
+
+    async def get_fingerprint(self, user_id: int, now: datetime) -> Row:
+        """
+        Summarize everything the dashboard shows into one cheap row
+
+        The row changes whenever a plant, diagnosis or activity is added,
+        edited or removed, or a plant's watering state changes with time.
+        Only aggregates are read, never the rows themselves.
+
+        Args:
+            user_id: User ID
+            now: Reference time
+
+        Returns:
+            Row of aggregate values
+        """
+        plants = (
+            select(
+                func.max(Plant.id).label("plants_max_id"),
+                func.max(Plant.updated_at).label("plants_updated_at"),
+                *PlantRepository.garden_health_columns(now),
+            )
+            .select_from(Plant)
+            .join(PlantSpecies, PlantSpecies.id == Plant.species_id)
+            .where(Plant.user_id == user_id)
+            .subquery()
+        )
+        diagnoses = (
+            select(
+                func.count(Diagnosis.id).label("diagnoses_count"),
+                func.max(Diagnosis.id).label("diagnoses_max_id"),
+                func.max(Diagnosis.updated_at).label("diagnoses_updated_at"),
+            )
+            .where(Diagnosis.user_id == user_id)
+            .subquery()
+        )
+        activities = (
+            select(func.max(Activity.id).label("activities_max_id"))
+            .where(Activity.user_id == user_id)
+            .subquery()
+        )
+        stmt = select(plants, diagnoses, activities).select_from(
+            plants.join(diagnoses, true()).join(activities, true())
+        )
+        result = await self.session.execute(stmt)
+        return result.one()
@@ -3,10 +3,12 @@ Diagnosis repository for data access
 """
 
 from typing import Optional, List
-from sqlalchemy import select
+from sqlalchemy import func, literal, select
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 from app.models.diagnosis import Diagnosis
+from app.models.plant import Plant
 from app.repositories.base_repository import BaseRepository
 
 
@@ -38,41 +40,6 @@ class DiagnosisRepository(BaseRepository[Diagnosis]):
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
-    async def get_by_plant_id(
-        self, plant_id: int, skip: int = 0, limit: int = 100
-    ) -> List[Diagnosis]:
-        """
-        Get all diagnoses for a specific plant with pagination
-        """
-        stmt = (
-            select(Diagnosis)
-            .options(joinedload(Diagnosis.plant))
-            .where(Diagnosis.plant_id == plant_id)
-            .order_by(Diagnosis.created_at.desc())
-            .offset(skip)
-            .limit(limit)
-        )
-        result = await self.session.execute(stmt)
-        return result.scalars().all()
-
-    async def get_by_user_id(
-        self, user_id: int, skip: int = 0, limit: int = 100
-    ) -> List[Diagnosis]:
-        """
-        Get all diagnoses for a specific user
-        Includes both plant-linked diagnoses and standalone diagnoses
-        """
-        stmt = (
-            select(Diagnosis)
-            .options(joinedload(Diagnosis.plant))
-            .where(Diagnosis.user_id == user_id)
-            .order_by(Diagnosis.created_at.desc())
-            .offset(skip)
-            .limit(limit)
-        )
-        result = await self.session.execute(stmt)
-        return result.scalars().all()
-
     async def get_by_id(self, diagnosis_id: int) -> Optional[Diagnosis]:
         """
         Get a single diagnosis by ID
@@ -86,9 +53,9 @@ class DiagnosisRepository(BaseRepository[Diagnosis]):
         Create a new diagnosis for a plant
         """
         diagnosis = Diagnosis(plant_id=plant_id, **kwargs)
+        diagnosis.activities = []
         self.session.add(diagnosis)
-        await self.session.commit()
-        await self.session.refresh(diagnosis)
+        await self.session.flush()
         return diagnosis
 
     async def update(self, diagnosis_id: int, **kwargs) -> Optional[Diagnosis]:
@@ -103,8 +70,7 @@ class DiagnosisRepository(BaseRepository[Diagnosis]):
         for k, v in kwargs.items():
             setattr(diagnosis, k, v)
 
-        await self.session.commit()
-        await self.session.refresh(diagnosis)
+        await self.session.flush()
         return diagnosis
 
     async def delete(self, diagnosis_id: int) -> bool:
@@ -117,5 +83,42 @@ class DiagnosisRepository(BaseRepository[Diagnosis]):
             return False
 
         await self.session.delete(diagnosis)
-        await self.session.commit()
+        await self.session.flush()
         return True
+
+    async def get_latest_summaries(self, user_id: int, limit: int = 5) -> List[Row]:
+        """
+        Get a user's most recent diagnoses as compact rows
+
+        Selects only the columns a summary needs and resolves the display
+        name in SQL, without loading the plant or activity relationships.
+
+        Args:
+            user_id: User ID
+            limit: Maximum number of diagnoses
+
+        Returns:
+            Rows with id, plant_id, plant_name, issue_detected, severity,
+            image_url and created_at
+        """
+        stmt = (
+            select(
+                Diagnosis.id,
+                Diagnosis.plant_id,
+                func.coalesce(
+                    Plant.plant_name,
+                    Diagnosis.plant_common_name,
+                    literal("Standalone Diagnosis"),
+                ).label("plant_name"),
+                Diagnosis.issue_detected,
+                Diagnosis.severity,
+                Diagnosis.image_url,
+                Diagnosis.created_at,
+            )
+            .outerjoin(Plant, Plant.id == Diagnosis.plant_id)
+            .where(Diagnosis.user_id == user_id)
+            .order_by(Diagnosis.created_at.desc(), Diagnosis.id.desc())
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        return result.all()
@@ -0,0 +1,146 @@
+"""
+Garden transfer repository for streaming exports and batched imports
+"""
+
+from typing import Dict, Iterable, List
+
+from sqlalchemy import insert, or_, select
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
+
+from app.models.activity import Activity
+from app.models.diagnosis import Diagnosis
+from app.models.plant import Plant
+from app.models.plant_species import PlantSpecies
+
+# Rows fetched per round trip from the server-side cursor
+STREAM_BATCH_SIZE = 500
+
+SPECIES_COLUMNS = (
+    "common_name",
+    "scientific_name",
+    "watering_frequency_days",
+    "sunlight_hours_needed",
+    "sunlight_type",
+    "humidity_preference",
+    "temperature_min",
+    "care_difficulty",
+)
+
+
+class GardenTransferRepository:
+    """
+    Bulk reads and writes of a user's plants, diagnoses and activities
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize garden transfer repository
+
+        Args:
+            session: Database session
+        """
+        self.session = session
+
+    async def _stream(self, stmt) -> AsyncResult:
+        return await self.session.stream(stmt.execution_options(yield_per=STREAM_BATCH_SIZE))
+
+    async def stream_plants(self, user_id: int) -> AsyncResult:
+        """
+        Stream a user's plants with their species columns (prefixed ``species_``)
+        """
+        species_columns = [
+            getattr(PlantSpecies, name).label(f"species_{name}") for name in SPECIES_COLUMNS
+        ]
+        return await self._stream(
+            select(
+                Plant.id,
+                Plant.plant_name,
+                Plant.location,
+                Plant.last_watered,
+                Plant.image_url,
+                Plant.acquired_date,
+                *species_columns,
+            )
+            .join(PlantSpecies, PlantSpecies.id == Plant.species_id)
+            .where(Plant.user_id == user_id)
+            .order_by(Plant.id)
+        )
+
+    async def stream_diagnoses(self, user_id: int) -> AsyncResult:
+        """
+        Stream a user's diagnoses as plain rows
+        """
+        columns = [
+            column
+            for column in Diagnosis.__table__.c
+            if column.name not in ("user_id", "updated_at")
+        ]
+        return await self._stream(
+            select(*columns).where(Diagnosis.user_id == user_id).order_by(Diagnosis.id)
+        )
+
+    async def stream_activities(self, user_id: int) -> AsyncResult:
+        """
+        Stream a user's activity feed as plain rows
+        """
+        return await self._stream(
+            select(
+                Activity.plant_id,
+                Activity.diagnosis_id,
+                Activity.activity_type,
+                Activity.title,
+                Activity.created_at,
+            )
+            .where(Activity.user_id == user_id)
+            .order_by(Activity.id)
+        )
+
+    async def find_species(self, names: Iterable[str]) -> List[Row]:
+        """
+        Look up species by common or scientific name in one query
+
+        Args:
+            names: Names to look up
+
+        Returns:
+            Rows with id, common_name, scientific_name and watering_frequency_days
+        """
+        names = list(names)
+        result = await self.session.execute(
+            select(
+                PlantSpecies.id,
+                PlantSpecies.common_name,
+                PlantSpecies.scientific_name,
+                PlantSpecies.watering_frequency_days,
+            ).where(
+                or_(PlantSpecies.common_name.in_(names), PlantSpecies.scientific_name.in_(names))
+            )
+        )
+        return result.all()
+
+    async def _insert_returning_ids(self, model, rows: List[Dict]) -> List[int]:
+        # insertmanyvalues batches the rows into multi-row INSERT ... RETURNING
+        # statements; sort_by_parameter_order lines the IDs up with ``rows``
+        result = await self.session.execute(
+            insert(model).returning(model.id, sort_by_parameter_order=True), rows
+        )
+        return list(result.scalars())
+
+    async def insert_species(self, rows: List[Dict]) -> List[int]:
+        """
+        Insert species, returning their IDs in input order
+        """
+        return await self._insert_returning_ids(PlantSpecies, rows)
+
+    async def insert_plants(self, rows: List[Dict]) -> List[int]:
+        """
+        Insert plants, returning their IDs in input order
+        """
+        return await self._insert_returning_ids(Plant, rows)
+
+    async def insert_diagnoses(self, rows: List[Dict]) -> List[int]:
+        """
+        Insert diagnoses, returning their IDs in input order
+        """
+        return await self._insert_returning_ids(Diagnosis, rows)
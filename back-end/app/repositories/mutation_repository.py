@@ -0,0 +1,76 @@
+"""
+Mutation repository for data access
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.applied_mutation import AppliedMutation
+
+
+class MutationRepository:
+    """
+    Records the outcomes of batched mutations by client-generated ID
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize mutation repository
+
+        Args:
+            session: Database session
+        """
+        self.session = session
+
+    async def get_applied(
+        self, user_id: int, client_ids: Iterable[str]
+    ) -> Dict[str, Tuple[int, Optional[dict]]]:
+        """
+        Outcomes of the given mutations that were already applied
+
+        Returns:
+            Mapping of client ID to (status code, result)
+        """
+        result = await self.session.execute(
+            select(AppliedMutation.client_id, AppliedMutation.status_code, AppliedMutation.result).where(
+                AppliedMutation.user_id == user_id,
+                AppliedMutation.client_id.in_(set(client_ids)),
+            )
+        )
+        return {client_id: (status_code, outcome) for client_id, status_code, outcome in result.tuples()}
+
+    async def add(
+        self,
+        user_id: int,
+        client_id: str,
+        status_code: int,
+        outcome: Optional[dict],
+        now: datetime,
+    ) -> None:
+        """
+        Record an applied mutation in the current transaction
+        """
+        await self.session.execute(
+            insert(AppliedMutation).values(
+                user_id=user_id,
+                client_id=client_id,
+                status_code=status_code,
+                result=outcome,
+                created_at=now,
+            )
+        )
+
+    async def prune(self, before: datetime) -> int:
+        """
+        Delete records of mutations applied before ``before``
+
+        Returns:
+            Number of deleted records
+        """
+        result = await self.session.execute(
+            delete(AppliedMutation).where(AppliedMutation.created_at < before)
+        )
+        return result.rowcount
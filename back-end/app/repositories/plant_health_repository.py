@@ -0,0 +1,207 @@
+"""
+Plant health repository: diagnosis history trends and rollups
+"""
+
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+
+from sqlalchemy import case, delete, func, insert, literal, select
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.expression import ColumnElement
+
+from app.db.sql_functions import any_of, days_since
+from app.models.diagnosis import Diagnosis
+from app.models.plant_health_rollup import PlantHealthRollup
+
+# Severity labels (the AI's and the seed data's) by rank; higher is worse.
+# Unrecognized labels such as "Unknown" rank NULL and never count as a change.
+SEVERITY_RANKS = {
+    "healthy": 0,
+    "low severity": 1,
+    "mild": 1,
+    "medium severity": 2,
+    "moderate": 2,
+    "high severity": 3,
+    "severe": 3,
+}
+
+# Diagnoses averaged into each trend point's moving confidence
+CONFIDENCE_WINDOW = 3
+
+
+def severity_rank(severity: ColumnElement) -> ColumnElement:
+    """
+    SQL expression ranking a severity label (see SEVERITY_RANKS)
+    """
+    return case(SEVERITY_RANKS, value=func.lower(func.trim(severity)))
+
+
+def severity_change(
+    rank: ColumnElement,
+    previous: ColumnElement,
+    labels: Tuple[str, str, str] = ("improved", "worsened", "unchanged"),
+) -> ColumnElement:
+    """
+    SQL expression naming the move from ``previous`` to ``rank`` (NULL if either is unknown)
+    """
+    better, worse, same = labels
+    return case((rank < previous, better), (rank > previous, worse), (rank == previous, same))
+
+
+def _ranked_diagnoses(plant_filter: ColumnElement):
+    """
+    Diagnoses of the matching plants with their per-plant window values
+
+    Every window runs over one plant's history in (created_at, id) order,
+    which the (plant_id, created_at, id) index returns presorted.
+    """
+    rank = severity_rank(Diagnosis.severity)
+    history = {"partition_by": Diagnosis.plant_id, "order_by": (Diagnosis.created_at, Diagnosis.id)}
+    return (
+        select(
+            Diagnosis.id,
+            Diagnosis.plant_id,
+            Diagnosis.created_at,
+            Diagnosis.severity,
+            Diagnosis.issue_detected,
+            Diagnosis.confidence_score,
+            rank.label("severity_rank"),
+            func.lag(rank).over(**history).label("previous_severity_rank"),
+            func.avg(Diagnosis.confidence_score)
+            .over(rows=(-(CONFIDENCE_WINDOW - 1), 0), **history)
+            .label("confidence_moving_avg"),
+            func.row_number()
+            .over(
+                partition_by=Diagnosis.plant_id,
+                order_by=(Diagnosis.created_at.desc(), Diagnosis.id.desc()),
+            )
+            .label("recency"),
+        )
+        .where(plant_filter)
+        .subquery()
+    )
+
+
+class PlantHealthRepository:
+    """
+    Window-function queries over each plant's diagnosis history
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize plant health repository
+
+        Args:
+            session: Database session
+        """
+        self.session = session
+
+    async def get_trend_points(self, plant_id: int, limit: int = 30) -> List[Row]:
+        """
+        A plant's most recent diagnoses with severity transitions and moving confidence
+
+        Window values are computed over the plant's whole history, so the
+        oldest returned point still knows the severity before it.
+
+        Args:
+            plant_id: Plant ID
+            limit: Maximum number of points
+
+        Returns:
+            Rows oldest first, with diagnosis_id, created_at, severity,
+            issue_detected, confidence_score, severity_rank, change
+            ("improved", "worsened", "unchanged" or None) and
+            confidence_moving_avg
+        """
+        ranked = _ranked_diagnoses(Diagnosis.plant_id == plant_id)
+        stmt = (
+            select(
+                ranked.c.id.label("diagnosis_id"),
+                ranked.c.created_at,
+                ranked.c.severity,
+                ranked.c.issue_detected,
+                ranked.c.confidence_score,
+                ranked.c.severity_rank,
+                severity_change(ranked.c.severity_rank, ranked.c.previous_severity_rank).label("change"),
+                ranked.c.confidence_moving_avg,
+            )
+            .where(ranked.c.recency <= limit)
+            .order_by(ranked.c.created_at, ranked.c.id)
+        )
+        result = await self.session.execute(stmt)
+        return result.all()
+
+    async def get_rollup(self, plant_id: int, now: datetime) -> Optional[Row]:
+        """
+        A plant's rollup with its trend and days_since_last_issue evaluated at ``now``
+
+        Returns:
+            Row with the rollup columns, trend ("improving", "worsening",
+            "stable" or None, from the last two diagnoses) and
+            days_since_last_issue, or None if the plant was never diagnosed
+        """
+        stmt = select(
+            *PlantHealthRollup.__table__.c,
+            severity_change(
+                PlantHealthRollup.latest_severity_rank,
+                PlantHealthRollup.previous_severity_rank,
+                ("improving", "worsening", "stable"),
+            ).label("trend"),
+            days_since(PlantHealthRollup.last_issue_at, now).label("days_since_last_issue"),
+        ).where(PlantHealthRollup.plant_id == plant_id)
+        result = await self.session.execute(stmt)
+        return result.one_or_none()
+
+    async def refresh_rollups(self, plant_ids: Iterable[int], now: datetime) -> None:
+        """
+        Recompute the rollups of the given plants from their diagnoses
+
+        Replaces the plants' rows with one aggregate over the window query;
+        plants left without diagnoses lose their row.
+
+        Args:
+            plant_ids: Plant IDs
+            now: Refresh time
+        """
+        plant_ids = list(plant_ids)
+        if not plant_ids:
+            return
+        dialect_name = self.session.get_bind().dialect.name
+        ranked = _ranked_diagnoses(any_of(Diagnosis.plant_id, plant_ids, dialect_name))
+        latest = ranked.c.recency == 1
+        summary = select(
+            ranked.c.plant_id,
+            func.count(),
+            func.sum(case((ranked.c.severity_rank < ranked.c.previous_severity_rank, 1), else_=0)),
+            func.sum(case((ranked.c.severity_rank > ranked.c.previous_severity_rank, 1), else_=0)),
+            func.min(ranked.c.created_at),
+            func.max(ranked.c.created_at),
+            func.max(case((ranked.c.severity_rank > 0, ranked.c.created_at))),
+            func.max(case((latest, ranked.c.severity_rank))),
+            func.max(case((latest, ranked.c.previous_severity_rank))),
+            func.avg(ranked.c.confidence_score),
+            literal(now, PlantHealthRollup.refreshed_at.type),
+        ).group_by(ranked.c.plant_id)
+
+        await self.session.execute(
+            delete(PlantHealthRollup).where(any_of(PlantHealthRollup.plant_id, plant_ids, dialect_name))
+        )
+        await self.session.execute(
+            insert(PlantHealthRollup).from_select(
+                [column.name for column in PlantHealthRollup.__table__.c], summary
+            )
+        )
+
+    async def get_diagnosed_plant_ids(self, after_id: int = 0, limit: int = 1000) -> List[int]:
+        """
+        IDs of plants with at least one diagnosis, in ID order after ``after_id``
+        """
+        result = await self.session.execute(
+            select(Diagnosis.plant_id)
+            .where(Diagnosis.plant_id > after_id)
+            .group_by(Diagnosis.plant_id)
+            .order_by(Diagnosis.plant_id)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
@@ -2,11 +2,16 @@
 Plant repository for data access
 """
 
-from typing import Optional, List
-from sqlalchemy import select, func
+from datetime import datetime
+from typing import Dict, Iterable, Optional, List, Tuple
+from sqlalchemy import and_, case, lambda_stmt, literal, or_, select, func, tuple_, update
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload, joinedload
+from sqlalchemy.orm import aliased, selectinload, joinedload
+from app.db.sql_functions import add_days, any_of, days_since
+from app.models.diagnosis import Diagnosis
 from app.models.plant import Plant
+from app.models.plant_species import PlantSpecies
 from app.repositories.base_repository import BaseRepository
 
 
@@ -24,38 +29,18 @@ class PlantRepository(BaseRepository[Plant]):
         """
         super().__init__(Plant, session)
 
-    async def get_by_id_for_user(self, plant_id: int, user_id: int) -> Optional[Plant]:
-        """
-        Get a single plant by id that belongs to the given user.
-        """
-        result = await self.session.execute(
-            select(Plant).where(Plant.id == plant_id, Plant.user_id == user_id)
-        )
-        return result.scalar_one_or_none()
-
-    async def get_all_for_user(
-        self, user_id: int, skip: int = 0, limit: int = 100
-    ) -> List[Plant]:
-        """
-        List plants for a user with pagination.
-        """
-        result = await self.session.execute(
-            select(Plant)
-            .where(Plant.user_id == user_id)
-            .order_by(Plant.id.desc())
-            .offset(skip)
-            .limit(limit)
-        )
-        return result.scalars().all()
-
     async def create(self, user_id: int, **kwargs) -> Plant:
         """
         Create a new plant for the given user.
         """
         plant = Plant(user_id=user_id, **kwargs)
+        # Nothing is attached to a new plant yet; start the collections empty
+        # so serializing it does not lazy-load them
+        plant.diagnoses = []
+        plant.activities = []
         self.session.add(plant)
-        await self.session.commit()
-        await self.session.refresh(plant)
+        await self.session.flush()
+        await self.session.refresh(plant, attribute_names=["species"])
         return plant
 
     async def update(self, plant_id: int, user_id: int, **kwargs) -> Optional[Plant]:
@@ -70,42 +55,93 @@ class PlantRepository(BaseRepository[Plant]):
         for k, v in kwargs.items():
             setattr(plant, k, v)
 
-        await self.session.commit()
-        await self.session.refresh(plant)
+        await self.session.flush()
+        if "species_id" in kwargs:
+            await self.session.refresh(plant, attribute_names=["species"])
         return plant
 
-    async def delete(self, plant_id: int, user_id: int) -> bool:
+    async def delete(self, plant_id: int, user_id: int) -> Optional[Plant]:
         """
         Delete a plant (must belong to the given user).
-        Returns True if deleted, False if not found.
+        Returns the deleted plant, or None if not found.
         """
         plant = await self.get_by_id_for_user(plant_id=plant_id, user_id=user_id)
         if not plant:
-            return False
+            return None
 
         await self.session.delete(plant)
-        await self.session.commit()
-        return True
-    async def get_all_for_user(self, user_id: int, skip: int, limit: int) -> List[Plant]:
+        await self.session.flush()
+        return plant
+    async def get_all_for_user(
+        self,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[Tuple[int]] = None,
+    ) -> List[Plant]:
+        """
+        List plants for a user, newest first.
+
+        Pass ``after`` (the ``(id,)`` key of the last plant already seen) for
+        keyset pagination; ``skip`` is only applied when ``after`` is None.
+        """
         stmt = (
             select(Plant)
-            .options(joinedload(Plant.species))    
+            .options(joinedload(Plant.species))
             .where(Plant.user_id == user_id)
             .order_by(Plant.id.desc())
-            .offset(skip).limit(limit)
+            .limit(limit)
         )
+        if after is not None:
+            stmt = stmt.where(Plant.id < after[0])
+        else:
+            stmt = stmt.offset(skip)
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
     async def get_by_id_for_user(self, plant_id: int, user_id: int) -> Optional[Plant]:
-        stmt = (
-            select(Plant)
+        """
+        Get a single plant by id that belongs to the given user, with its species.
+        """
+        stmt = lambda_stmt(
+            lambda: select(Plant)
             .options(joinedload(Plant.species))
             .where(Plant.id == plant_id, Plant.user_id == user_id)
         )
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def exists_for_user(self, plant_id: int, user_id: int) -> bool:
+        """
+        Whether a plant exists and belongs to the given user, without loading it
+        """
+        stmt = lambda_stmt(
+            lambda: select(Plant.id).where(Plant.id == plant_id, Plant.user_id == user_id)
+        )
+        result = await self.session.execute(stmt)
+        return result.first() is not None
+
+    async def species_exists(self, species_id: int) -> bool:
+        """
+        Whether a plant species exists, without loading it
+        """
+        stmt = lambda_stmt(lambda: select(PlantSpecies.id).where(PlantSpecies.id == species_id))
+        result = await self.session.execute(stmt)
+        return result.first() is not None
+
+    async def get_species_watering_frequency(self, species_id: int) -> Optional[Row]:
+        """
+        A species' watering interval, or None if the species does not exist
+
+        Returns:
+            Row with watering_frequency_days (itself None when not set)
+        """
+        stmt = lambda_stmt(
+            lambda: select(PlantSpecies.watering_frequency_days).where(PlantSpecies.id == species_id)
+        )
+        result = await self.session.execute(stmt)
+        return result.first()
+
     async def count_plants_for_user(self, user_id: int) -> int:
         """
         Count total plants for a user
@@ -119,3 +155,327 @@ class PlantRepository(BaseRepository[Plant]):
         stmt = select(func.count()).select_from(Plant).where(Plant.user_id == user_id)
         result = await self.session.execute(stmt)
         return result.scalar() or 0
+
+    async def get_care_counts(self, user_id: int) -> Tuple[int, int]:
+        """
+        Count a user's plants and how many of them are watered on time
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            Tuple of (plant_count, plants_watered_on_time)
+        """
+        stmt = select(
+            func.count(),
+            func.coalesce(func.sum(case((Plant.watered_on_time, 1), else_=0)), 0),
+        ).where(Plant.user_id == user_id)
+        result = await self.session.execute(stmt)
+        plant_count, on_time = result.one()
+        return plant_count, on_time
+
+    @staticmethod
+    def garden_health_columns(now: datetime) -> tuple:
+        """
+        Aggregate columns classifying plants by watering state at ``now``
+
+        Expects plants joined to their species.
+        """
+        frequency = PlantSpecies.watering_frequency_days
+        scheduled = and_(Plant.last_watered.is_not(None), frequency > 0)
+        elapsed = days_since(Plant.last_watered, now)
+
+        def count_where(condition):
+            return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+        return (
+            func.count(Plant.id).label("plant_count"),
+            count_where(and_(scheduled, elapsed < frequency)).label("on_time"),
+            count_where(and_(scheduled, elapsed >= frequency)).label("overdue"),
+            count_where(Plant.last_watered.is_(None)).label("never_watered"),
+            count_where(
+                and_(
+                    Plant.last_watered.is_not(None),
+                    or_(frequency.is_(None), frequency <= 0),
+                )
+            ).label("unscheduled"),
+        )
+
+    async def get_garden_health(self, user_id: int, now: datetime) -> Row:
+        """
+        Count a user's plants by watering state in one query
+
+        Args:
+            user_id: User ID
+            now: Reference time
+
+        Returns:
+            Row with plant_count, on_time, overdue, never_watered and unscheduled
+        """
+        stmt = (
+            select(*self.garden_health_columns(now))
+            .select_from(Plant)
+            .join(PlantSpecies, PlantSpecies.id == Plant.species_id)
+            .where(Plant.user_id == user_id)
+        )
+        result = await self.session.execute(stmt)
+        return result.one()
+
+    async def get_garden_health_for_users(
+        self, user_ids: Iterable[int], now: datetime
+    ) -> Dict[int, Row]:
+        """
+        Count plants by watering state for many users in one query
+
+        Args:
+            user_ids: User IDs
+            now: Reference time
+
+        Returns:
+            Mapping of user ID to its counts row; users without plants are absent
+        """
+        stmt = (
+            select(Plant.user_id, *self.garden_health_columns(now))
+            .join(PlantSpecies, PlantSpecies.id == Plant.species_id)
+            .where(Plant.user_id.in_(list(user_ids)))
+            .group_by(Plant.user_id)
+        )
+        result = await self.session.execute(stmt)
+        return {row.user_id: row for row in result.all()}
+
+    async def get_needing_attention(self, user_id: int, now: datetime, limit: int = 10) -> List[Row]:
+        """
+        List a user's plants that are overdue or were never watered
+
+        Never-watered plants come first, then the most overdue.
+
+        Args:
+            user_id: User ID
+            now: Reference time
+            limit: Maximum number of plants
+
+        Returns:
+            Rows with id, plant_name, image_url, species_name, last_watered
+            and watering_frequency_days
+        """
+        frequency = PlantSpecies.watering_frequency_days
+        elapsed = days_since(Plant.last_watered, now)
+        stmt = (
+            select(
+                Plant.id,
+                Plant.plant_name,
+                Plant.image_url,
+                PlantSpecies.common_name.label("species_name"),
+                Plant.last_watered,
+                frequency.label("watering_frequency_days"),
+            )
+            .join(PlantSpecies, PlantSpecies.id == Plant.species_id)
+            .where(
+                Plant.user_id == user_id,
+                or_(Plant.last_watered.is_(None), and_(frequency > 0, elapsed >= frequency)),
+            )
+            .order_by((elapsed - frequency).desc().nulls_first(), Plant.id)
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        return result.all()
+
+    async def scan_due(
+        self,
+        start: datetime,
+        end: datetime,
+        limit: int = 1000,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> List[Row]:
+        """
+        Walk plants of all users that become due in ``[start, end)``
+
+        Reads one bounded batch per call; pass the key of the last row as
+        ``after`` to continue. Served by the (next_water_at, id) index.
+
+        Args:
+            start: Window start (inclusive)
+            end: Window end (exclusive)
+            limit: Batch size
+            after: ``(next_water_at, id)`` key of the last row already seen
+
+        Returns:
+            Rows with id, user_id, plant_name and next_water_at
+        """
+        stmt = (
+            select(Plant.id, Plant.user_id, Plant.plant_name, Plant.next_water_at)
+            .where(Plant.next_water_at >= start, Plant.next_water_at < end)
+            .order_by(Plant.next_water_at, Plant.id)
+            .limit(limit)
+        )
+        if after is not None:
+            stmt = stmt.where(tuple_(Plant.next_water_at, Plant.id) > tuple_(*after))
+        result = await self.session.execute(stmt)
+        return result.all()
+
+    async def reschedule_species(
+        self, species_id: int, watering_frequency_days: Optional[int], now: datetime
+    ) -> None:
+        """
+        Recompute next_water_at for every plant of a species in one UPDATE
+
+        Used when a species' watering interval changes. Mirrors
+        plant_service.next_watering_at: never-watered plants keep their due
+        time (or become due now), and no interval clears the schedule.
+
+        Args:
+            species_id: Species ID
+            watering_frequency_days: The species' new watering interval
+            now: Due time for never-watered plants without one
+        """
+        if watering_frequency_days:
+            next_water_at = case(
+                (Plant.last_watered.is_(None), func.coalesce(Plant.next_water_at, now)),
+                else_=add_days(Plant.last_watered, watering_frequency_days),
+            )
+        else:
+            next_water_at = None
+        await self.session.execute(
+            update(Plant)
+            .where(Plant.species_id == species_id)
+            .values(next_water_at=next_water_at)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def touch_species_plants(self, species_id: int, now: datetime) -> None:
+        """
+        Mark every plant of a species as changed, for delta sync
+
+        Plant rows embed their species, so a species edit changes them.
+        """
+        await self.session.execute(
+            update(Plant)
+            .where(Plant.species_id == species_id)
+            .values(updated_at=now)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def touch_diagnoses(self, plant_id: int, now: datetime) -> None:
+        """
+        Mark a plant's diagnoses as changed, for delta sync
+
+        Diagnosis rows show their plant's name, so a rename changes them.
+        """
+        await self.session.execute(
+            update(Diagnosis)
+            .where(Diagnosis.plant_id == plant_id)
+            .values(updated_at=now)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def set_health_snapshot(self, plant_id: int, diagnosis: Diagnosis) -> None:
+        """
+        Record a just-created diagnosis as the plant's latest
+
+        Args:
+            plant_id: Plant ID
+            diagnosis: The new diagnosis (flushed, so it has an ID)
+        """
+        await self.session.execute(
+            update(Plant)
+            .where(Plant.id == plant_id)
+            .values(
+                last_diagnosis_id=diagnosis.id,
+                last_severity=diagnosis.severity,
+                last_issue=diagnosis.issue_detected,
+                last_diagnosed_at=diagnosis.created_at,
+            )
+        )
+
+    async def refresh_health_snapshots(self, plant_ids: Iterable[int]) -> None:
+        """
+        Recompute the latest-diagnosis snapshot of the given plants in one UPDATE
+
+        Used when a diagnosis is changed or deleted, or diagnoses are bulk
+        imported. Plants left without diagnoses get an all-NULL snapshot.
+
+        Args:
+            plant_ids: Plant IDs
+        """
+        candidate = aliased(Diagnosis)
+        latest_id = (
+            select(candidate.id)
+            .where(candidate.plant_id == Plant.id)
+            .order_by(candidate.created_at.desc(), candidate.id.desc())
+            .limit(1)
+            .correlate_except(candidate)
+            .scalar_subquery()
+        )
+
+        def latest(column):
+            return select(column).where(Diagnosis.id == latest_id).scalar_subquery()
+
+        await self.session.execute(
+            update(Plant)
+            .where(self._ids_match(plant_ids))
+            .values(
+                last_diagnosis_id=latest_id,
+                last_severity=latest(Diagnosis.severity),
+                last_issue=latest(Diagnosis.issue_detected),
+                last_diagnosed_at=latest(Diagnosis.created_at),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    def _ids_match(self, plant_ids: Iterable[int]):
+        return any_of(Plant.id, plant_ids, self.session.get_bind().dialect.name)
+
+    async def get_watering_state(self, user_id: int, plant_ids: Iterable[int]) -> List[Row]:
+        """
+        Read the watering state of the given plants that belong to a user
+
+        Args:
+            user_id: User ID
+            plant_ids: Plant IDs
+
+        Returns:
+            Rows with id and watered_on_time; plants not owned by the user are absent
+        """
+        stmt = select(Plant.id, Plant.watered_on_time).where(
+            Plant.user_id == user_id, self._ids_match(plant_ids)
+        )
+        result = await self.session.execute(stmt)
+        return result.all()
+
+    async def mark_watered(self, user_id: int, plant_ids: Iterable[int], now: datetime) -> List[Row]:
+        """
+        Water many plants of a user in one UPDATE ... RETURNING
+
+        Sets last_watered to ``now`` and reschedules each plant from its
+        species' interval, like PlantService.water_plant does for one plant.
+
+        Args:
+            user_id: User ID
+            plant_ids: Plant IDs
+            now: Watering time
+
+        Returns:
+            Rows with id, plant_name, last_watered, next_water_at and watered_on_time
+        """
+        frequency = (
+            select(PlantSpecies.watering_frequency_days)
+            .where(PlantSpecies.id == Plant.species_id)
+            .scalar_subquery()
+        )
+        stmt = (
+            update(Plant)
+            .where(Plant.user_id == user_id, self._ids_match(plant_ids))
+            .values(
+                last_watered=now,
+                next_water_at=case(
+                    (frequency > 0, add_days(literal(now, Plant.last_watered.type), frequency))
+                ),
+                watered_on_time=func.coalesce(frequency, 0) > 0,
+            )
+            .returning(
+                Plant.id, Plant.plant_name, Plant.last_watered, Plant.next_water_at, Plant.watered_on_time
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        return result.all()
@@ -1,12 +1,21 @@
 """
 PlantSpecies repository for data access
 """
-from typing import Optional, List
-from sqlalchemy import select
+from typing import Dict, Iterable, Optional, List, Tuple
+from sqlalchemy import case, func, literal, or_, select, tuple_
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.plant import Plant
 from app.models.plant_species import PlantSpecies
+from app.read_models.plant_rows import SPECIES_COLUMNS, SpeciesRow
 from app.repositories.base_repository import BaseRepository
+from app.utils.species_search import POPULARITY_WEIGHT, PREFIX_BONUS, SUBSTRING_BONUS
+
+
+def _like_escape(text: str) -> str:
+    return text.replace("!", "!!").replace("%", "!%").replace("_", "!_")
+
 
 class PlantSpeciesRepository(BaseRepository[PlantSpecies]):
     def __init__(self, session: AsyncSession):
@@ -24,19 +33,96 @@ class PlantSpeciesRepository(BaseRepository[PlantSpecies]):
         )
         return result.scalar_one_or_none()
 
-    async def get_all(self, skip: int = 0, limit: int = 100) -> List[PlantSpecies]:
-        result = await self.session.execute(
+    async def get_all(
+        self, skip: int = 0, limit: int = 100, after: Optional[Tuple[str, int]] = None
+    ) -> List[PlantSpecies]:
+        stmt = (
             select(PlantSpecies)
-            .order_by(PlantSpecies.common_name.asc())
-            .offset(skip).limit(limit)
+            .order_by(PlantSpecies.common_name.asc(), PlantSpecies.id.asc())
+            .limit(limit)
         )
+        if after is not None:
+            # keyset on (common_name, id), served by the common_name index
+            stmt = stmt.where(tuple_(PlantSpecies.common_name, PlantSpecies.id) > tuple_(*after))
+        else:
+            stmt = stmt.offset(skip)
+        result = await self.session.execute(stmt)
         return result.scalars().all()
 
+    async def search_trigram(self, query: str, limit: int) -> List[Row]:
+        """
+        Search species names with pg_trgm (PostgreSQL only)
+
+        Matches names that start with or contain the query (ILIKE) or are
+        word-similar to it (``<%``); both are served by the trigram GIN
+        indexes. Scored like app.utils.species_search.
+
+        Returns:
+            Rows of (PlantSpecies, plant_count, score), best first
+        """
+        query = query.strip()
+        contains = f"%{_like_escape(query)}%"
+        prefix = f"{_like_escape(query)}%"
+        names = (PlantSpecies.common_name, PlantSpecies.scientific_name)
+
+        def ilike(pattern: str):
+            return or_(*(name.ilike(pattern, escape="!") for name in names))
+
+        matches = (
+            select(
+                PlantSpecies.id,
+                select(func.count())
+                .where(Plant.species_id == PlantSpecies.id)
+                .scalar_subquery()
+                .label("plant_count"),
+            )
+            .where(or_(ilike(contains), *(literal(query).op("<%")(name) for name in names)))
+            .subquery()
+        )
+        name_similarity = func.greatest(
+            *(func.coalesce(func.word_similarity(query, name), 0.0) for name in names)
+        )
+        bonus = case((ilike(prefix), PREFIX_BONUS), (ilike(contains), SUBSTRING_BONUS), else_=0.0)
+        score = (
+            name_similarity + bonus + POPULARITY_WEIGHT * func.ln(1 + matches.c.plant_count)
+        ).label("score")
+        stmt = (
+            select(PlantSpecies, matches.c.plant_count, score)
+            .join(matches, matches.c.id == PlantSpecies.id)
+            .order_by(score.desc(), PlantSpecies.id)
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        return result.all()
+
+    async def get_all_rows(self) -> List[SpeciesRow]:
+        """
+        Every species as a read-model row, for loading the species cache
+        """
+        result = await self.session.execute(select(*SPECIES_COLUMNS))
+        return [SpeciesRow(*row) for row in result.tuples()]
+
+    async def count_plants(self, species_ids: Iterable[int]) -> Dict[int, int]:
+        """
+        Number of plants per species, for the given species only
+
+        Returns:
+            Mapping of species ID to plant count (species without plants are left out)
+        """
+        species_ids = list(species_ids)
+        if not species_ids:
+            return {}
+        result = await self.session.execute(
+            select(Plant.species_id, func.count())
+            .where(Plant.species_id.in_(species_ids))
+            .group_by(Plant.species_id)
+        )
+        return dict(result.tuples().all())
+
     async def create(self, **kwargs) -> PlantSpecies:
         obj = PlantSpecies(**kwargs)
         self.session.add(obj)
-        await self.session.commit()
-        await self.session.refresh(obj)
+        await self.session.flush()
         return obj
 
     async def update(self, species_id: int, **kwargs) -> Optional[PlantSpecies]:
@@ -45,8 +131,7 @@ class PlantSpeciesRepository(BaseRepository[PlantSpecies]):
             return None
         for k, v in kwargs.items():
             setattr(obj, k, v)
-        await self.session.commit()
-        await self.session.refresh(obj)
+        await self.session.flush()
         return obj
 
     async def delete(self, species_id: int) -> bool:
@@ -54,5 +139,5 @@ class PlantSpeciesRepository(BaseRepository[PlantSpecies]):
         if not obj:
             return False
         await self.session.delete(obj)
-        await self.session.commit()
+        await self.session.flush()
         return True
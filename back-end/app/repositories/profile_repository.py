@@ -3,10 +3,12 @@ Profile repository for data access
 """
 
 from typing import Optional
-from sqlalchemy import select
+from sqlalchemy import func, select, update
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.profile import Profile
+from app.models.user import User
 from app.repositories.base_repository import BaseRepository
 
 
@@ -39,6 +41,52 @@ class ProfileRepository(BaseRepository[Profile]):
         )
         return result.scalar_one_or_none()
 
+    async def get_with_full_name(self, user_id: int) -> Optional[Row]:
+        """
+        Get a profile together with its user's full name in one query
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            Row of (Profile, full_name) or None
+        """
+        result = await self.session.execute(
+            select(Profile, User.full_name)
+            .join(User, User.id == Profile.user_id)
+            .where(Profile.user_id == user_id)
+        )
+        return result.one_or_none()
+
+    async def increment_stats(
+        self, user_id: int, plant_count: int = 0, plants_watered_on_time: int = 0
+    ) -> None:
+        """
+        Atomically adjust a profile's care counters
+
+        Runs as a single ``UPDATE ... SET col = col + n`` so concurrent
+        requests cannot lose each other's changes. Users without a profile
+        are skipped; their counters are computed when the profile is created.
+
+        Args:
+            user_id: User ID
+            plant_count: Change in number of plants
+            plants_watered_on_time: Change in number of plants watered on time
+        """
+        if not plant_count and not plants_watered_on_time:
+            return
+        await self.session.execute(
+            update(Profile)
+            .where(Profile.user_id == user_id)
+            .values(
+                plant_count=func.coalesce(Profile.plant_count, 0) + plant_count,
+                plants_watered_on_time=Profile.plants_watered_on_time + plants_watered_on_time,
+                # Counter changes are not profile edits
+                updated_at=Profile.updated_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
     async def user_id_exists(self, user_id: int) -> bool:
         """
         Check if a profile exists for a given user ID
@@ -0,0 +1,116 @@
+"""
+Sync repository: deletion tombstones for delta sync
+"""
+
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import delete, insert, literal, select
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.diagnosis import Diagnosis
+from app.models.plant import Plant
+from app.models.sync_tombstone import SYNC_DIAGNOSIS, SYNC_PLANT, SyncTombstone
+
+TOMBSTONE_COLUMNS = ["user_id", "entity", "entity_id", "deleted_at"]
+
+
+def _tombstone_columns(entity: str, user_id, entity_id, now: datetime) -> tuple:
+    """
+    SELECT columns producing TOMBSTONE_COLUMNS for the rows being deleted
+    """
+    return user_id, literal(entity), entity_id, literal(now, SyncTombstone.deleted_at.type)
+
+
+class SyncRepository:
+    """
+    Records and reads the deletions delta sync reports
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize sync repository
+
+        Args:
+            session: Database session
+        """
+        self.session = session
+
+    async def _add_tombstones(self, rows) -> None:
+        """
+        Insert the tombstones a SELECT of TOMBSTONE_COLUMNS returns
+        """
+        await self.session.execute(insert(SyncTombstone).from_select(TOMBSTONE_COLUMNS, rows))
+
+    async def tombstone_plant(self, plant_id: int, user_id: int, now: datetime) -> None:
+        """
+        Record the deletion of a user's plant and of the diagnoses it takes along
+
+        Call before deleting the plant; nothing is recorded if the plant is
+        not the user's.
+        """
+        await self._add_tombstones(
+            select(*_tombstone_columns(SYNC_DIAGNOSIS, Diagnosis.user_id, Diagnosis.id, now))
+            .join(Plant, Plant.id == Diagnosis.plant_id)
+            .where(Plant.id == plant_id, Plant.user_id == user_id)
+        )
+        await self._add_tombstones(
+            select(*_tombstone_columns(SYNC_PLANT, Plant.user_id, Plant.id, now)).where(
+                Plant.id == plant_id, Plant.user_id == user_id
+            )
+        )
+
+    async def tombstone_species_plants(self, species_id: int, now: datetime) -> None:
+        """
+        Record the deletion of every plant of a species and of their diagnoses
+
+        Call before deleting the species, which takes its plants along.
+        """
+        await self._add_tombstones(
+            select(*_tombstone_columns(SYNC_DIAGNOSIS, Diagnosis.user_id, Diagnosis.id, now))
+            .join(Plant, Plant.id == Diagnosis.plant_id)
+            .where(Plant.species_id == species_id)
+        )
+        await self._add_tombstones(
+            select(*_tombstone_columns(SYNC_PLANT, Plant.user_id, Plant.id, now)).where(
+                Plant.species_id == species_id
+            )
+        )
+
+    async def tombstone_diagnosis(self, diagnosis_id: int, now: datetime) -> None:
+        """
+        Record the deletion of a diagnosis (call before deleting it)
+        """
+        await self._add_tombstones(
+            select(*_tombstone_columns(SYNC_DIAGNOSIS, Diagnosis.user_id, Diagnosis.id, now)).where(
+                Diagnosis.id == diagnosis_id
+            )
+        )
+
+    async def get_tombstones(self, user_id: int, since: Optional[datetime]) -> List[Row]:
+        """
+        A user's deletions at or after ``since``
+
+        Returns:
+            Rows with entity and entity_id
+        """
+        stmt = select(SyncTombstone.entity, SyncTombstone.entity_id).where(
+            SyncTombstone.user_id == user_id
+        )
+        if since is not None:
+            stmt = stmt.where(SyncTombstone.deleted_at >= since)
+        result = await self.session.execute(stmt.order_by(SyncTombstone.id))
+        return result.all()
+
+    async def prune_tombstones(self, before: datetime) -> int:
+        """
+        Delete tombstones older than ``before``
+
+        Returns:
+            Number of deleted tombstones
+        """
+        result = await self.session.execute(
+            delete(SyncTombstone).where(SyncTombstone.deleted_at < before)
+        )
+        return result.rowcount
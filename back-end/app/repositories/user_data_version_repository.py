@@ -0,0 +1,98 @@
+"""
+User data version repository for data access
+"""
+
+from typing import Optional
+
+from sqlalchemy import literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+from app.db.sql_functions import upsert
+from app.models.plant import Plant
+from app.models.user import User
+from app.models.user_data_version import UserDataVersion
+
+
+class UserDataVersionRepository:
+    """
+    Reads and bumps per-user data versions
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize user data version repository
+
+        Args:
+            session: Database session
+        """
+        self.session = session
+
+    async def get(self, user_id: int) -> int:
+        """
+        Current data version of a user (0 if it was never bumped)
+
+        Args:
+            user_id: User ID
+        """
+        result = await self.session.execute(
+            select(UserDataVersion.version).where(UserDataVersion.user_id == user_id)
+        )
+        version: Optional[int] = result.scalar_one_or_none()
+        return version or 0
+
+    async def _upsert(self, insert_rows) -> None:
+        """
+        Run an INSERT of version-1 rows that increments the existing rows instead
+
+        A single INSERT ... ON CONFLICT, so concurrent first writes of a user
+        cannot both insert the row.
+
+        Args:
+            insert_rows: Function turning the dialect's INSERT construct into
+                one with rows (``values`` or ``from_select``)
+        """
+        stmt = insert_rows(upsert(UserDataVersion, self.session.get_bind().dialect.name))
+        await self.session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[UserDataVersion.user_id], set_={"version": UserDataVersion.version + 1}
+            )
+        )
+
+    async def bump(self, user_id: int) -> None:
+        """
+        Increment a user's data version in the current transaction
+
+        Args:
+            user_id: User ID
+        """
+        await self._upsert(lambda stmt: stmt.values(user_id=user_id, version=1))
+
+    async def bump_many(self, user_ids: Select) -> None:
+        """
+        Increment the data versions of many users in the current transaction
+
+        Used by writes that touch other users' data in bulk (species edits,
+        maintenance jobs); one statement whatever the number of users.
+
+        Args:
+            user_ids: One-column SELECT of user IDs
+        """
+        await self._upsert(
+            lambda stmt: stmt.from_select(
+                ["user_id", "version"],
+                # The WHERE also keeps SQLite from parsing ON CONFLICT as a join constraint
+                select(User.id, literal(1)).where(User.id.in_(user_ids)),
+            )
+        )
+
+    async def bump_species_owners(self, species_id: int) -> None:
+        """
+        Increment the data versions of every user with a plant of a species
+
+        Plant responses embed their species, so a species write changes them.
+
+        Args:
+            species_id: Species ID
+        """
+        await self.bump_many(select(Plant.user_id).where(Plant.species_id == species_id).distinct())
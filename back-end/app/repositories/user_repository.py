@@ -2,13 +2,14 @@
 User repository for data access
 """
 
-from typing import Optional
-from sqlalchemy import select
+from datetime import datetime
+from typing import List, Optional
+from sqlalchemy import delete, lambda_stmt, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 from sqlalchemy.orm import selectinload, joinedload
 
 
+from app.models.activity import ActivityArchive
 from app.models.plant import Plant  # ensure this import exists
 from app.models.user import User
 from app.repositories.base_repository import BaseRepository
@@ -38,7 +39,9 @@ class UserRepository(BaseRepository[User]):
         Returns:
             User instance or None
         """
-        result = await self.session.execute(select(User).where(User.email == email))
+        result = await self.session.execute(
+            lambda_stmt(lambda: select(User).where(User.email == email))
+        )
         return result.scalar_one_or_none()
 
     async def get_by_username(self, username: str) -> Optional[User]:
@@ -52,7 +55,7 @@ class UserRepository(BaseRepository[User]):
             User instance or None
         """
         result = await self.session.execute(
-            select(User).where(User.username == username)
+            lambda_stmt(lambda: select(User).where(User.username == username))
         )
         return result.scalar_one_or_none()
 
@@ -82,6 +85,25 @@ class UserRepository(BaseRepository[User]):
         user = await self.get_by_username(username)
         return user is not None
 
+    async def get_principal_fields(self, user_id: int):
+        """
+        Get only the fields needed to authorize a request
+
+        Unlike get_by_id this does not load the user's plants or activities.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            Row with id, is_active, is_superuser and token_version, or None
+        """
+        result = await self.session.execute(
+            select(
+                User.id, User.is_active, User.is_superuser, User.token_version
+            ).where(User.id == user_id)
+        )
+        return result.one_or_none()
+
     async def get_by_id_with_plants(self, user_id: int) -> Optional[User]:
         stmt = (
             select(User)
@@ -94,3 +116,57 @@ class UserRepository(BaseRepository[User]):
         )
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
+
+    async def delete(self, id: int) -> bool:
+        """
+        Delete a user and everything they own
+
+        Issues a single DELETE: plants, diagnoses, activities and the profile
+        go with it through ON DELETE CASCADE, so nothing is loaded. Archived
+        activities have no foreign key and are removed explicitly.
+
+        Args:
+            id: User ID
+
+        Returns:
+            True if deleted, False if not found
+        """
+        await self.session.execute(delete(ActivityArchive).where(ActivityArchive.user_id == id))
+        result = await self.session.execute(
+            delete(User).where(User.id == id).execution_options(synchronize_session=False)
+        )
+        return result.rowcount > 0
+
+    async def mark_for_deletion(self, user_id: int, requested_at: datetime) -> bool:
+        """
+        Deactivate a user, revoke their tokens and queue them for background deletion
+
+        Args:
+            user_id: User ID
+            requested_at: Time of the deletion request
+
+        Returns:
+            True if marked, False if not found
+        """
+        result = await self.session.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(
+                is_active=False,
+                token_version=User.token_version + 1,
+                deletion_requested_at=requested_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount > 0
+
+    async def get_pending_deletion_ids(self) -> List[int]:
+        """
+        IDs of users queued for background deletion, oldest request first
+        """
+        result = await self.session.execute(
+            select(User.id)
+            .where(User.deletion_requested_at.is_not(None))
+            .order_by(User.deletion_requested_at, User.id)
+        )
+        return list(result.scalars().all())
@@ -0,0 +1,52 @@
+"""
+Dashboard schemas for response validation
+"""
+
+from datetime import datetime
+from typing import List, Optional
+from pydantic import BaseModel, ConfigDict
+
+from app.schemas.activity_schema import ActivityOut
+from app.schemas.plant_schema import GardenHealthResponse
+
+
+class AttentionPlant(BaseModel):
+    """
+    Plant that is overdue for watering or was never watered
+    """
+
+    id: int
+    plant_name: str
+    image_url: Optional[str] = None
+    species_name: Optional[str] = None
+    last_watered: Optional[datetime] = None
+    watering_frequency_days: Optional[int] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class DiagnosisSummary(BaseModel):
+    """
+    Compact diagnosis for the overview screen
+    """
+
+    id: int
+    plant_id: Optional[int] = None
+    plant_name: str
+    issue_detected: str
+    severity: str
+    image_url: Optional[str] = None
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class DashboardResponse(BaseModel):
+    """
+    Everything the overview screen shows, in one payload
+    """
+
+    stats: GardenHealthResponse
+    needs_attention: List[AttentionPlant]
+    recent_activity: List[ActivityOut]
+    latest_diagnoses: List[DiagnosisSummary]
@@ -3,7 +3,7 @@ Diagnosis schemas for request/response validation
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, Field, ConfigDict
 
 
@@ -81,3 +81,48 @@ class DiagnosisResponse(BaseModel):
     plant_name: Optional[str] = None
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class HealthTrendPoint(BaseModel):
+    """
+    One diagnosis in a plant's health trend
+    """
+
+    diagnosis_id: int
+    created_at: datetime
+    severity: str
+    issue_detected: str
+    confidence_score: float
+    severity_rank: Optional[int] = None  # 0 healthy .. 3 high; None if unrecognized
+    change: Optional[str] = None  # "improved", "worsened" or "unchanged" vs the diagnosis before
+    confidence_moving_avg: Optional[float] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class PlantHealthSummary(BaseModel):
+    """
+    Summary of a plant's whole diagnosis history
+    """
+
+    diagnosis_count: int
+    improvements: int
+    regressions: int
+    first_diagnosed_at: datetime
+    last_diagnosed_at: datetime
+    last_issue_at: Optional[datetime] = None
+    days_since_last_issue: Optional[float] = None
+    trend: Optional[str] = None  # "improving", "worsening" or "stable"
+    average_confidence: Optional[float] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class PlantHealthTrendResponse(BaseModel):
+    """
+    Schema for a plant's health trend
+    """
+
+    plant_id: int
+    summary: Optional[PlantHealthSummary] = None  # None if never diagnosed
+    points: List[HealthTrendPoint] = []
@@ -0,0 +1,74 @@
+"""
+Garden export/import schemas
+
+An export is NDJSON: one record per line, each with a ``type``. Plants come
+first, then diagnoses, then activities. ``ref`` is the record's ID in the
+exporting database; later records point at earlier ones with ``plant_ref``
+and ``diagnosis_ref``. Species are embedded by value and matched by name on
+import, since species IDs differ between databases.
+"""
+
+from datetime import datetime
+from typing import Literal, Optional
+from pydantic import BaseModel, Field
+
+from app.models.activity import ActivityType
+from app.schemas.diagnosis_schema import DiagnosisBase
+from app.schemas.plant_species_schema import PlantSpeciesBase
+
+EXPORT_FORMAT_VERSION = 1
+
+
+class GardenExportHeader(BaseModel):
+    """
+    First line of an export
+    """
+    type: Literal["header"] = "header"
+    version: int = EXPORT_FORMAT_VERSION
+    exported_at: datetime
+
+
+class PlantRecord(BaseModel):
+    """
+    One plant with its species
+    """
+    type: Literal["plant"] = "plant"
+    ref: int
+    species: PlantSpeciesBase
+    plant_name: str = Field(..., max_length=100)
+    location: Optional[str] = Field(None, max_length=255)
+    last_watered: Optional[datetime] = None
+    image_url: Optional[str] = None
+    acquired_date: Optional[datetime] = None
+
+
+class DiagnosisRecord(DiagnosisBase):
+    """
+    One diagnosis, optionally linked to an exported plant
+    """
+    type: Literal["diagnosis"] = "diagnosis"
+    ref: int
+    plant_id: Optional[int] = Field(None, exclude=True)  # links go through plant_ref
+    plant_ref: Optional[int] = None
+    created_at: datetime
+
+
+class ActivityRecord(BaseModel):
+    """
+    One activity feed entry
+    """
+    type: Literal["activity"] = "activity"
+    plant_ref: Optional[int] = None
+    diagnosis_ref: Optional[int] = None
+    activity_type: ActivityType
+    title: Optional[str] = Field(None, max_length=255)
+    created_at: datetime
+
+
+class GardenImportResponse(BaseModel):
+    """
+    Number of records imported per type
+    """
+    plants: int = 0
+    diagnoses: int = 0
+    activities: int = 0
@@ -0,0 +1,86 @@
+"""
+Batched mutation schemas
+"""
+
+from typing import Annotated, Any, List, Literal, Optional, Union
+from pydantic import BaseModel, Field
+
+from app.schemas.diagnosis_schema import DiagnosisCreate
+from app.schemas.plant_schema import PlantUpdate
+
+
+class MutationBase(BaseModel):
+    """
+    Base of one queued operation
+    """
+
+    # Generated by the client once per operation; a retried batch with the
+    # same ID replays the recorded outcome instead of applying it again
+    client_id: str = Field(..., min_length=1, max_length=64)
+
+
+class WaterPlantMutation(MutationBase):
+    op: Literal["water_plant"]
+    plant_id: int
+
+
+class UpdatePlantMutation(MutationBase):
+    op: Literal["update_plant"]
+    plant_id: int
+    data: PlantUpdate
+
+
+class DeletePlantMutation(MutationBase):
+    op: Literal["delete_plant"]
+    plant_id: int
+
+
+class CreateDiagnosisMutation(MutationBase):
+    op: Literal["create_diagnosis"]
+    data: DiagnosisCreate
+
+
+class DeleteDiagnosisMutation(MutationBase):
+    op: Literal["delete_diagnosis"]
+    diagnosis_id: int
+
+
+Mutation = Annotated[
+    Union[
+        WaterPlantMutation,
+        UpdatePlantMutation,
+        DeletePlantMutation,
+        CreateDiagnosisMutation,
+        DeleteDiagnosisMutation,
+    ],
+    Field(discriminator="op"),
+]
+
+
+class MutationBatchRequest(BaseModel):
+    """
+    Schema for an ordered batch of queued operations
+    """
+
+    operations: List[Mutation] = Field(..., min_length=1, max_length=100)
+
+
+class MutationResult(BaseModel):
+    """
+    Outcome of one operation of a batch
+    """
+
+    client_id: str
+    op: str
+    status: int  # The status the single-operation endpoint would have answered
+    result: Optional[Any] = None  # PlantResponse or DiagnosisResponse; None for deletes and errors
+    error: Optional[str] = None
+    replayed: bool = False  # Applied by an earlier batch; the recorded outcome is returned
+
+
+class MutationBatchResponse(BaseModel):
+    """
+    Schema for the outcomes of a batch, in request order
+    """
+
+    results: List[MutationResult]
@@ -4,7 +4,7 @@ Plant schemas for request/response validation
 
 
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, Field, ConfigDict
 from app.schemas.plant_species_schema import PlantSpeciesResponse
 
@@ -44,7 +44,44 @@ class PlantResponse(BaseModel):
     plant_name: str = Field(..., max_length=100)
     location: Optional[str] = Field(None, max_length=255)
     last_watered: Optional[datetime] = None
+    next_water_at: Optional[datetime] = None
     acquired_date: Optional[datetime] = None
     image_url: Optional[str] = None
+    # Latest diagnosis, for a health badge without fetching the diagnoses
+    last_diagnosis_id: Optional[int] = None
+    last_severity: Optional[str] = None
+    last_issue: Optional[str] = None
+    last_diagnosed_at: Optional[datetime] = None
     species: Optional[PlantSpeciesResponse] = None
     model_config = ConfigDict(from_attributes=True)
+
+
+class WaterPlantsRequest(BaseModel):
+    """
+    Schema for watering several plants at once
+    """
+    plant_ids: List[int] = Field(..., min_length=1, max_length=200)
+
+
+class WateredPlantResponse(BaseModel):
+    """
+    Schema for one plant of a bulk watering
+    """
+    id: int
+    plant_name: str
+    last_watered: datetime
+    next_water_at: Optional[datetime] = None
+    model_config = ConfigDict(from_attributes=True)
+
+
+class GardenHealthResponse(BaseModel):
+    """
+    Schema for a user's plant counts by watering state
+    """
+    user_id: int
+    plant_count: int = 0
+    on_time: int = 0  # watered within the species' interval
+    overdue: int = 0  # watered, but longer ago than the interval
+    never_watered: int = 0
+    unscheduled: int = 0  # watered, but the species has no interval
+    care_rate: int = 100  # on_time as a percentage of plant_count
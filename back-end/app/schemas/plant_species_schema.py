@@ -52,3 +52,11 @@ class PlantSpeciesResponse(BaseModel):
     humidity_preference: Optional[str] = Field(None, max_length=50)
     temperature_min: Optional[float] = None
     model_config = ConfigDict(from_attributes=True)
+
+class SpeciesSearchResult(BaseModel):
+    """
+    Schema for one species search hit
+    """
+    species: PlantSpeciesResponse
+    plant_count: int
+    score: float
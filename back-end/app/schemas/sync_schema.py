@@ -0,0 +1,37 @@
+"""
+Delta sync schemas
+"""
+
+from typing import List, Optional
+from pydantic import BaseModel
+
+from app.schemas.diagnosis_schema import DiagnosisResponse
+from app.schemas.plant_schema import PlantResponse
+from app.schemas.profile_schema import ProfileResponse
+
+
+class SyncDeletions(BaseModel):
+    """
+    IDs deleted since the watermark
+    """
+
+    plants: List[int] = []
+    diagnoses: List[int] = []
+
+
+class SyncResponse(BaseModel):
+    """
+    Schema for a delta sync
+
+    With ``full`` set the lists hold everything and replace the client's
+    copy; otherwise they hold what changed since the watermark. The
+    profile is sent whenever anything changed (it is small, and its full
+    name comes from the user row); it is null only when nothing did.
+    """
+
+    watermark: str  # Send back as ``since`` on the next sync
+    full: bool
+    plants: List[PlantResponse] = []
+    diagnoses: List[DiagnosisResponse] = []
+    profile: Optional[ProfileResponse] = None
+    deleted: SyncDeletions = SyncDeletions()
@@ -0,0 +1,97 @@
+"""
+Dashboard service containing business logic
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Awaitable, Callable, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.repositories.activity_repository import get_activities_by_user_id
+from app.repositories.dashboard_repository import DashboardRepository
+from app.repositories.diagnosis_repository import DiagnosisRepository
+from app.repositories.plant_repository import PlantRepository
+from app.services.plant_service import PlantService
+from app.utils.etag import make_etag
+
+
+T = TypeVar("T")
+
+ATTENTION_LIMIT = 10
+ACTIVITY_LIMIT = 10
+DIAGNOSIS_LIMIT = 5
+
+
+class DashboardService:
+    """
+    Dashboard service assembling the overview screen
+    """
+
+    def __init__(self, session_factory: async_sessionmaker):
+        """
+        Initialize dashboard service
+
+        Args:
+            session_factory: Factory for read sessions; each section of the
+                dashboard runs on its own session so they can run concurrently
+        """
+        self.session_factory = session_factory
+
+    async def _run(self, query: Callable[[AsyncSession], Awaitable[T]]) -> T:
+        """
+        Run a query on a short-lived session of its own
+        """
+        async with self.session_factory() as session:
+            return await query(session)
+
+    async def get_etag(self, user_id: int, now: datetime) -> str:
+        """
+        ETag for a user's dashboard, computed from an aggregate fingerprint
+
+        Args:
+            user_id: User ID
+            now: Reference time (watering state depends on it)
+
+        Returns:
+            Weak ETag
+        """
+        fingerprint = await self._run(
+            lambda session: DashboardRepository(session).get_fingerprint(user_id, now)
+        )
+        return make_etag(user_id, *fingerprint)
+
+    async def get_dashboard(self, user_id: int, now: datetime) -> dict:
+        """
+        Gather plants needing attention, recent activity, garden stats and
+        latest diagnoses concurrently
+
+        Args:
+            user_id: User ID
+            now: Reference time
+
+        Returns:
+            Dashboard dict
+        """
+        counts, needs_attention, recent_activity, latest_diagnoses = await asyncio.gather(
+            self._run(lambda session: PlantRepository(session).get_garden_health(user_id, now)),
+            self._run(
+                lambda session: PlantRepository(session).get_needing_attention(
+                    user_id, now, limit=ATTENTION_LIMIT
+                )
+            ),
+            self._run(
+                lambda session: get_activities_by_user_id(user_id, session, limit=ACTIVITY_LIMIT)
+            ),
+            self._run(
+                lambda session: DiagnosisRepository(session).get_latest_summaries(
+                    user_id, limit=DIAGNOSIS_LIMIT
+                )
+            ),
+        )
+        return {
+            "stats": PlantService.garden_health(user_id, counts),
+            "needs_attention": needs_attention,
+            "recent_activity": recent_activity,
+            "latest_diagnoses": latest_diagnoses,
+        }
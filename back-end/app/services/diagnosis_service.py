@@ -2,20 +2,28 @@
 Diagnosis service containing business logic
 """
 
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from fastapi import HTTPException, status
 from datetime import datetime, timezone
 
 from app.models.diagnosis import Diagnosis
 from app.models.activity import Activity, ActivityType
+from app.db.unit_of_work import UnitOfWork
+from app.read_models.diagnosis_rows import DiagnosisReadRepository, DiagnosisRow
 from app.repositories.diagnosis_repository import DiagnosisRepository
+from app.repositories.plant_health_repository import PlantHealthRepository
 from app.repositories.plant_repository import PlantRepository
-from app.schemas.diagnosis_schema import DiagnosisCreate, DiagnosisUpdate
+from app.repositories.sync_repository import SyncRepository
+from app.repositories.user_data_version_repository import UserDataVersionRepository
+from app.schemas.diagnosis_schema import DiagnosisCreate, DiagnosisUpdate, PlantHealthTrendResponse
 from app.services.activity_service import get_activity_title
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Diagnosis fields the plant's latest-health snapshot and rollup derive from
+HEALTH_FIELDS = {"severity", "issue_detected", "confidence_score"}
+
 
 class DiagnosisService:
     """
@@ -32,6 +40,26 @@ class DiagnosisService:
         """
         self.diagnosis_repository = diagnosis_repository
         self.plant_repository = plant_repository
+        self.uow = UnitOfWork(diagnosis_repository.session)
+        self.read_repository = DiagnosisReadRepository(diagnosis_repository.session)
+        self.health_repository = PlantHealthRepository(diagnosis_repository.session)
+        self.data_versions = UserDataVersionRepository(diagnosis_repository.session)
+        self.sync_repository = SyncRepository(diagnosis_repository.session)
+
+    async def _plant_health_changed(self, plant_id: int, created: Optional[Diagnosis] = None) -> None:
+        """
+        Bring a plant's health snapshot and rollup up to date after a diagnosis write
+
+        Args:
+            plant_id: Plant ID
+            created: The new diagnosis, when the write created one; it is
+                the latest, so the snapshot is copied from it directly
+        """
+        if created is not None:
+            await self.plant_repository.set_health_snapshot(plant_id, created)
+        else:
+            await self.plant_repository.refresh_health_snapshots([plant_id])
+        await self.health_repository.refresh_rollups([plant_id], datetime.now(timezone.utc))
 
     async def create_diagnosis(self, user_id: int, data: DiagnosisCreate) -> Diagnosis:
         """
@@ -48,49 +76,71 @@ class DiagnosisService:
                 detail="Plant not found or does not belong to you",
             )
 
-        diagnosis = await self.diagnosis_repository.create(
-            user_id=user_id,
-            plant_id=data.plant_id,
-            **data.model_dump(exclude={"plant_id"}, exclude_unset=True)
-        )
+        async with self.uow:
+            diagnosis = await self.diagnosis_repository.create(
+                user_id=user_id,
+                plant_id=data.plant_id,
+                **data.model_dump(exclude={"plant_id"}, exclude_unset=True)
+            )
+            await self._plant_health_changed(data.plant_id, created=diagnosis)
 
-        activity = Activity(
-            user_id=user_id,
-            plant_id=data.plant_id,
-            diagnosis_id=diagnosis.id,
-            activity_type=ActivityType.DIAGNOSIS,
-            title=get_activity_title(ActivityType.DIAGNOSIS),
-            created_at=datetime.now(timezone.utc)
-        )
-        self.diagnosis_repository.session.add(activity)
-        await self.diagnosis_repository.session.commit()
+            activity = Activity(
+                user_id=user_id,
+                plant_id=data.plant_id,
+                diagnosis_id=diagnosis.id,
+                activity_type=ActivityType.DIAGNOSIS,
+                title=get_activity_title(ActivityType.DIAGNOSIS),
+                created_at=datetime.now(timezone.utc)
+            )
+            self.diagnosis_repository.session.add(activity)
+            await self.data_versions.bump(user_id)
 
         logger.info(
             f"Created diagnosis ID {diagnosis.id} for plant {data.plant_id} by user {user_id}"
         )
         return diagnosis
 
+    async def get_diagnosis_row(self, diagnosis_id: int, user_id: int) -> Optional[DiagnosisRow]:
+        """
+        Get a single diagnosis as a read-model row, with plant_name resolved in SQL
+
+        Same access rules as get_diagnosis_by_id, in one query.
+        """
+        found = await self.read_repository.get_by_id(diagnosis_id)
+        if found is None:
+            return None
+        row, plant_owner_id = found
+        if row.plant_id is not None and plant_owner_id != user_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not authorized to access this diagnosis",
+            )
+        return row
+
     async def create_diagnosis_standalone(self, user_id: int, data: DiagnosisCreate) -> Diagnosis:
         """
         Create a standalone diagnosis without a plant_id
         Used for diagnose-only feature (not tied to a specific plant in garden)
         """
-        diagnosis = await self.diagnosis_repository.create(
-            user_id=user_id,
-            plant_id=data.plant_id,  # Will be None for standalone diagnoses
-            **data.model_dump(exclude={"plant_id"}, exclude_unset=True)
-        )
+        async with self.uow:
+            diagnosis = await self.diagnosis_repository.create(
+                user_id=user_id,
+                plant_id=data.plant_id,  # Will be None for standalone diagnoses
+                **data.model_dump(exclude={"plant_id"}, exclude_unset=True)
+            )
+            if data.plant_id is not None:
+                await self._plant_health_changed(data.plant_id, created=diagnosis)
 
-        activity = Activity(
-            user_id=user_id,
-            plant_id=None,
-            diagnosis_id=diagnosis.id,
-            activity_type=ActivityType.DIAGNOSIS,
-            title=get_activity_title(ActivityType.DIAGNOSIS),
-            created_at=datetime.now(timezone.utc)
-        )
-        self.diagnosis_repository.session.add(activity)
-        await self.diagnosis_repository.session.commit()
+            activity = Activity(
+                user_id=user_id,
+                plant_id=None,
+                diagnosis_id=diagnosis.id,
+                activity_type=ActivityType.DIAGNOSIS,
+                title=get_activity_title(ActivityType.DIAGNOSIS),
+                created_at=datetime.now(timezone.utc)
+            )
+            self.diagnosis_repository.session.add(activity)
+            await self.data_versions.bump(user_id)
 
         logger.info(
             f"Created standalone diagnosis ID {diagnosis.id} for user {user_id}"
@@ -131,31 +181,59 @@ class DiagnosisService:
 
     async def get_diagnoses_by_plant(
         self, plant_id: int, user_id: int, skip: int = 0, limit: int = 100
-    ) -> List[Diagnosis]:
+    ) -> List[DiagnosisRow]:
         """
         Get all diagnoses for a specific plant
         Validates that the plant belongs to the user
         """
         # Verify plant belongs to user
-        plant = await self.plant_repository.get_by_id_for_user(plant_id=plant_id, user_id=user_id)
-        if not plant:
+        if not await self.plant_repository.exists_for_user(plant_id=plant_id, user_id=user_id):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Plant not found or does not belong to you",
             )
 
-        return await self.diagnosis_repository.get_by_plant_id(
+        return await self.read_repository.get_by_plant_id(
             plant_id=plant_id, skip=skip, limit=limit
         )
 
+    async def get_health_trend(
+        self, plant_id: int, user_id: int, limit: int = 30
+    ) -> PlantHealthTrendResponse:
+        """
+        Get a plant's health trend: its history rollup and its latest diagnoses
+        with severity changes and moving confidence, all computed in SQL
+        Validates that the plant belongs to the user
+        """
+        if not await self.plant_repository.exists_for_user(plant_id=plant_id, user_id=user_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Plant not found or does not belong to you",
+            )
+
+        rollup = await self.health_repository.get_rollup(plant_id, datetime.now(timezone.utc))
+        points = await self.health_repository.get_trend_points(plant_id, limit=limit)
+        return PlantHealthTrendResponse(
+            plant_id=plant_id,
+            summary=dict(rollup._mapping) if rollup is not None else None,
+            points=[dict(point._mapping) for point in points],
+        )
+
     async def get_diagnoses_by_user(
-        self, user_id: int, skip: int = 0, limit: int = 100
-    ) -> List[Diagnosis]:
+        self,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> List[DiagnosisRow]:
         """
         Get all diagnoses for plants belonging to a user
+        (paginated by offset or by keyset cursor)
+
+        Returns read-model rows with plant_name resolved in SQL; see app.read_models.
         """
-        return await self.diagnosis_repository.get_by_user_id(
-            user_id=user_id, skip=skip, limit=limit
+        return await self.read_repository.get_by_user_id(
+            user_id=user_id, skip=skip, limit=limit, after=after
         )
 
     async def update_diagnosis(
@@ -172,7 +250,11 @@ class DiagnosisService:
             )
 
         update_data = data.model_dump(exclude_unset=True)
-        updated = await self.diagnosis_repository.update(diagnosis_id, **update_data)
+        async with self.uow:
+            updated = await self.diagnosis_repository.update(diagnosis_id, **update_data)
+            if diagnosis.plant_id is not None and HEALTH_FIELDS & update_data.keys():
+                await self._plant_health_changed(diagnosis.plant_id)
+            await self.data_versions.bump(user_id)
 
         logger.info(f"Updated diagnosis ID {diagnosis_id} by user {user_id}")
         return updated
@@ -188,6 +270,11 @@ class DiagnosisService:
                 status_code=status.HTTP_404_NOT_FOUND, detail="Diagnosis not found"
             )
 
-        deleted = await self.diagnosis_repository.delete(diagnosis_id)
+        async with self.uow:
+            await self.sync_repository.tombstone_diagnosis(diagnosis_id, datetime.now(timezone.utc))
+            deleted = await self.diagnosis_repository.delete(diagnosis_id)
+            if diagnosis.plant_id is not None:
+                await self._plant_health_changed(diagnosis.plant_id)
+            await self.data_versions.bump(user_id)
         logger.info(f"Deleted diagnosis ID {diagnosis_id} by user {user_id}")
         return deleted
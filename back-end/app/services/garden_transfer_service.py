@@ -0,0 +1,363 @@
+"""
+Garden export and import services
+"""
+
+from datetime import datetime, timezone
+from typing import AsyncIterable, AsyncIterator, Dict, List, Optional, Set, Type
+
+from fastapi import HTTPException, status
+from pydantic import BaseModel, ValidationError
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core.species_cache import SPECIES_CACHE, species_cache
+from app.db.unit_of_work import UnitOfWork
+from app.repositories.cache_version_repository import CacheVersionRepository
+from app.repositories.activity_repository import add_activities
+from app.repositories.garden_transfer_repository import SPECIES_COLUMNS, GardenTransferRepository
+from app.repositories.plant_health_repository import PlantHealthRepository
+from app.repositories.plant_repository import PlantRepository
+from app.repositories.profile_repository import ProfileRepository
+from app.repositories.user_data_version_repository import UserDataVersionRepository
+from app.schemas.garden_transfer_schema import (
+    ActivityRecord,
+    DiagnosisRecord,
+    GardenExportHeader,
+    PlantRecord,
+)
+from app.schemas.plant_species_schema import PlantSpeciesBase
+from app.services.plant_service import is_watered_on_time, next_watering_at
+from app.utils.ndjson import dump_line, iter_lines
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Records written per multi-row INSERT on import
+IMPORT_BATCH_SIZE = 500
+
+RECORD_TYPES: Dict[str, Type[BaseModel]] = {
+    "header": GardenExportHeader,
+    "plant": PlantRecord,
+    "diagnosis": DiagnosisRecord,
+    "activity": ActivityRecord,
+}
+
+
+class GardenExportService:
+    """
+    Streams a user's garden out as NDJSON
+    """
+
+    def __init__(self, session_factory: async_sessionmaker):
+        """
+        Initialize garden export service
+
+        Args:
+            session_factory: Factory for read sessions; the export outlives the
+                request's own session, so it opens one while streaming
+        """
+        self.session_factory = session_factory
+
+    async def export_lines(self, user_id: int) -> AsyncIterator[bytes]:
+        """
+        Yield the user's garden as NDJSON, one chunk per cursor batch
+
+        Rows are read through server-side cursors, so memory use does not
+        depend on the size of the garden.
+
+        Args:
+            user_id: User ID
+
+        Yields:
+            NDJSON chunks
+        """
+        header = GardenExportHeader(exported_at=datetime.now(timezone.utc))
+        yield dump_line(header.model_dump(mode="json"))
+
+        async with self.session_factory() as session:
+            repository = GardenTransferRepository(session)
+
+            plants = await repository.stream_plants(user_id)
+            async for batch in plants.partitions():
+                yield b"".join(
+                    dump_line(
+                        {
+                            "type": "plant",
+                            "ref": row.id,
+                            "species": {
+                                name: getattr(row, f"species_{name}") for name in SPECIES_COLUMNS
+                            },
+                            "plant_name": row.plant_name,
+                            "location": row.location,
+                            "last_watered": row.last_watered,
+                            "image_url": row.image_url,
+                            "acquired_date": row.acquired_date,
+                        }
+                    )
+                    for row in batch
+                )
+
+            diagnoses = await repository.stream_diagnoses(user_id)
+            async for batch in diagnoses.partitions():
+                yield b"".join(
+                    dump_line(
+                        {"type": "diagnosis", "ref": row.id, "plant_ref": row.plant_id, **_fields(row)}
+                    )
+                    for row in batch
+                )
+
+            activities = await repository.stream_activities(user_id)
+            async for batch in activities.partitions():
+                yield b"".join(
+                    dump_line(
+                        {
+                            "type": "activity",
+                            "plant_ref": row.plant_id,
+                            "diagnosis_ref": row.diagnosis_id,
+                            "activity_type": row.activity_type.value,
+                            "title": row.title,
+                            "created_at": row.created_at,
+                        }
+                    )
+                    for row in batch
+                )
+        logger.info(f"Exported garden of user {user_id}")
+
+
+class GardenImportService:
+    """
+    Reads an NDJSON garden export into a user's account
+    """
+
+    def __init__(
+        self,
+        repository: GardenTransferRepository,
+        profile_repository: ProfileRepository,
+        plant_repository: PlantRepository,
+    ):
+        """
+        Initialize garden import service
+
+        Args:
+            repository: Garden transfer repository
+            profile_repository: Profile repository, for the care counters
+            plant_repository: Plant repository, for the latest-health snapshots
+        """
+        self.repository = repository
+        self.profile_repository = profile_repository
+        self.plant_repository = plant_repository
+        self.health_repository = PlantHealthRepository(repository.session)
+        self.data_versions = UserDataVersionRepository(repository.session)
+        self.uow = UnitOfWork(repository.session)
+
+    async def import_lines(self, user_id: int, chunks: AsyncIterable[bytes]) -> Dict[str, int]:
+        """
+        Import an NDJSON garden export for a user
+
+        The body is parsed line by line and written in multi-row INSERTs of
+        up to IMPORT_BATCH_SIZE records; species are resolved with one
+        lookup per plant batch and created when missing. Everything is
+        imported in one transaction: any bad line rejects the whole import.
+
+        Args:
+            user_id: User ID the records are imported for
+            chunks: Request body chunks
+
+        Returns:
+            Number of plants, diagnoses and activities imported
+        """
+        batch = _ImportBatch(self.repository, user_id)
+        async with self.uow:
+            async for line_number, raw in iter_lines(chunks):
+                record = _parse_record(line_number, raw)
+                if record is None:
+                    continue
+                await batch.add(line_number, record)
+            await batch.flush()
+            if batch.diagnosed_plant_ids:
+                await self.plant_repository.refresh_health_snapshots(batch.diagnosed_plant_ids)
+                await self.health_repository.refresh_rollups(batch.diagnosed_plant_ids, batch.now)
+            await self.profile_repository.increment_stats(
+                user_id, plant_count=batch.counts["plants"], plants_watered_on_time=batch.on_time
+            )
+            await self.data_versions.bump(user_id)
+
+        logger.info(f"Imported garden for user {user_id}: {batch.counts}")
+        return batch.counts
+
+
+def _fields(row) -> dict:
+    """
+    Diagnosis columns other than the IDs, which the export writes as refs
+    """
+    return {key: value for key, value in row._mapping.items() if key not in ("id", "plant_id")}
+
+
+def _bad_line(line_number: int, message: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST, detail=f"Line {line_number}: {message}"
+    )
+
+
+def _parse_record(line_number: int, raw: dict) -> Optional[BaseModel]:
+    """
+    Validate one NDJSON object; returns None for the header line
+    """
+    model = RECORD_TYPES.get(raw.get("type"))
+    if model is None:
+        raise _bad_line(line_number, f"unknown record type {raw.get('type')!r}")
+    try:
+        record = model.model_validate(raw)
+    except ValidationError as exc:
+        raise _bad_line(line_number, exc.errors(include_url=False)[0]["msg"])
+    return None if isinstance(record, GardenExportHeader) else record
+
+
+class _ImportBatch:
+    """
+    Buffers imported records per type and writes them in batches
+
+    Records may only point at records on earlier lines. A pending batch of
+    plants is written before a diagnosis or activity is buffered (and
+    pending diagnoses before an activity), so the IDs they point at exist.
+    """
+
+    def __init__(self, repository: GardenTransferRepository, user_id: int):
+        self.repository = repository
+        self.user_id = user_id
+        self.now = datetime.now(timezone.utc)
+        self.plants: List[PlantRecord] = []
+        self.diagnoses: List[tuple] = []
+        self.activities: List[tuple] = []
+        self.plant_ids: Dict[int, int] = {}
+        self.diagnosis_ids: Dict[int, int] = {}
+        self.diagnosed_plant_ids: Set[int] = set()
+        self.counts = {"plants": 0, "diagnoses": 0, "activities": 0}
+        self.on_time = 0
+
+    async def add(self, line_number: int, record: BaseModel) -> None:
+        if isinstance(record, PlantRecord):
+            self.plants.append(record)
+            if len(self.plants) >= IMPORT_BATCH_SIZE:
+                await self._flush_plants()
+        elif isinstance(record, DiagnosisRecord):
+            await self._flush_plants()
+            if self.activities:
+                await self._flush_activities()
+            self.diagnoses.append((line_number, record))
+            if len(self.diagnoses) >= IMPORT_BATCH_SIZE:
+                await self._flush_diagnoses()
+        else:
+            await self._flush_plants()
+            await self._flush_diagnoses()
+            self.activities.append((line_number, record))
+            if len(self.activities) >= IMPORT_BATCH_SIZE:
+                await self._flush_activities()
+
+    async def flush(self) -> None:
+        await self._flush_plants()
+        await self._flush_diagnoses()
+        await self._flush_activities()
+
+    def _resolve(self, ids: Dict[int, int], ref: Optional[int], line_number: int, kind: str):
+        if ref is None:
+            return None
+        if ref not in ids:
+            raise _bad_line(line_number, f"{kind}_ref {ref} does not match an earlier {kind}")
+        return ids[ref]
+
+    async def _species_ids(self, plants: List[PlantRecord]) -> Dict[str, tuple]:
+        """
+        Map each species common name in the batch to (id, watering_frequency_days)
+
+        Missing species are created once per scientific name (scientific
+        names are unique too); common names sharing one map to the species
+        created for the first of them.
+        """
+        wanted = {plant.species.common_name: plant.species for plant in plants}
+        names = set(wanted) | {s.scientific_name for s in wanted.values() if s.scientific_name}
+        found = await self.repository.find_species(names)
+        by_common = {row.common_name: row for row in found}
+        by_scientific = {row.scientific_name: row for row in found if row.scientific_name}
+
+        resolved = {}
+        missing: Dict[tuple, PlantSpeciesBase] = {}
+        missing_keys: Dict[str, tuple] = {}
+        for name, species in wanted.items():
+            row = by_common.get(name) or by_scientific.get(species.scientific_name)
+            if row is not None:
+                resolved[name] = (row.id, row.watering_frequency_days)
+            else:
+                key = (
+                    ("scientific", species.scientific_name) if species.scientific_name else ("common", name)
+                )
+                missing.setdefault(key, species)
+                missing_keys[name] = key
+        if missing:
+            ids = await self.repository.insert_species([s.model_dump() for s in missing.values()])
+            # As PlantSpeciesService does for its writes
+            await CacheVersionRepository(self.repository.session).bump(SPECIES_CACHE)
+            species_cache.invalidate_on_commit(self.repository.session)
+            created = dict(zip(missing, ids))
+            for name, key in missing_keys.items():
+                resolved[name] = (created[key], missing[key].watering_frequency_days)
+        return resolved
+
+    async def _flush_plants(self) -> None:
+        if not self.plants:
+            return
+        plants, self.plants = self.plants, []
+        species = await self._species_ids(plants)
+        rows = []
+        for plant in plants:
+            species_id, frequency = species[plant.species.common_name]
+            on_time = is_watered_on_time(plant.last_watered, frequency, self.now)
+            self.on_time += on_time
+            rows.append(
+                {
+                    "user_id": self.user_id,
+                    "species_id": species_id,
+                    **plant.model_dump(exclude={"type", "ref", "species"}),
+                    "watered_on_time": on_time,
+                    "next_water_at": next_watering_at(plant.last_watered, frequency, self.now),
+                }
+            )
+        ids = await self.repository.insert_plants(rows)
+        self.plant_ids.update(zip((plant.ref for plant in plants), ids))
+        self.counts["plants"] += len(rows)
+
+    async def _flush_diagnoses(self) -> None:
+        if not self.diagnoses:
+            return
+        diagnoses, self.diagnoses = self.diagnoses, []
+        rows = [
+            {
+                "user_id": self.user_id,
+                "plant_id": self._resolve(self.plant_ids, record.plant_ref, line_number, "plant"),
+                **record.model_dump(exclude={"type", "ref", "plant_ref", "plant_id"}),
+            }
+            for line_number, record in diagnoses
+        ]
+        ids = await self.repository.insert_diagnoses(rows)
+        self.diagnosis_ids.update(zip((record.ref for _, record in diagnoses), ids))
+        self.diagnosed_plant_ids.update(row["plant_id"] for row in rows if row["plant_id"] is not None)
+        self.counts["diagnoses"] += len(rows)
+
+    async def _flush_activities(self) -> None:
+        if not self.activities:
+            return
+        activities, self.activities = self.activities, []
+        rows = [
+            {
+                "user_id": self.user_id,
+                "plant_id": self._resolve(self.plant_ids, record.plant_ref, line_number, "plant"),
+                "diagnosis_id": self._resolve(
+                    self.diagnosis_ids, record.diagnosis_ref, line_number, "diagnosis"
+                ),
+                "activity_type": record.activity_type,
+                "title": record.title,
+                "created_at": record.created_at,
+            }
+            for line_number, record in activities
+        ]
+        await add_activities(rows, self.repository.session)
+        self.counts["activities"] += len(rows)
@@ -0,0 +1,145 @@
+"""
+Batched mutation service for the mobile client's offline queue
+"""
+
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+
+from app.core.logging import get_logger
+from app.repositories.mutation_repository import MutationRepository
+from app.schemas.diagnosis_schema import DiagnosisResponse
+from app.schemas.mutation_schema import (
+    CreateDiagnosisMutation,
+    DeleteDiagnosisMutation,
+    DeletePlantMutation,
+    Mutation,
+    UpdatePlantMutation,
+    WaterPlantMutation,
+)
+from app.schemas.plant_schema import PlantResponse
+from app.services.diagnosis_service import DiagnosisService
+from app.services.plant_service import PlantService
+
+logger = get_logger(__name__)
+
+Outcome = Tuple[int, Optional[dict]]
+
+
+def _database_error(exc: SQLAlchemyError) -> dict:
+    """
+    Status and error reported for an operation the database rejected
+
+    Constraint violations (such as a reference to a missing row) are the
+    operation's fault and answer 409; anything else answers 500.
+    """
+    if isinstance(exc, IntegrityError):
+        return {"status": status.HTTP_409_CONFLICT, "error": "Operation conflicts with existing data"}
+    return {"status": status.HTTP_500_INTERNAL_SERVER_ERROR, "error": "Database error occurred"}
+
+
+class MutationService:
+    """
+    Applies an ordered batch of plant and diagnosis operations in one transaction
+
+    Each operation runs in its own savepoint through the regular services,
+    so a failing operation is rolled back alone and reported with the
+    status its single-operation endpoint would have answered (409 for
+    constraint violations the database raises); the others commit together
+    with the request.
+    """
+
+    def __init__(
+        self,
+        plant_service: PlantService,
+        diagnosis_service: DiagnosisService,
+        repository: MutationRepository,
+    ):
+        """
+        Initialize mutation service
+
+        Args:
+            plant_service: Plant service
+            diagnosis_service: Diagnosis service
+            repository: Mutation repository, for the applied-mutation records
+        """
+        self.plant_service = plant_service
+        self.diagnosis_service = diagnosis_service
+        self.repository = repository
+
+    async def _apply_one(self, user_id: int, mutation: Mutation) -> Outcome:
+        """
+        Apply one operation
+
+        Returns:
+            Status code and JSON-ready result
+
+        Raises:
+            HTTPException: As the single-operation endpoint would
+        """
+        if isinstance(mutation, WaterPlantMutation):
+            plant = await self.plant_service.water_plant(mutation.plant_id, user_id)
+            return status.HTTP_200_OK, PlantResponse.model_validate(plant).model_dump(mode="json")
+        if isinstance(mutation, UpdatePlantMutation):
+            plant = await self.plant_service.update_plant(mutation.plant_id, user_id, mutation.data)
+            return status.HTTP_200_OK, PlantResponse.model_validate(plant).model_dump(mode="json")
+        if isinstance(mutation, DeletePlantMutation):
+            await self.plant_service.delete_plant(mutation.plant_id, user_id)
+            return status.HTTP_204_NO_CONTENT, None
+        if isinstance(mutation, CreateDiagnosisMutation):
+            diagnosis = await self.diagnosis_service.create_diagnosis(user_id, mutation.data)
+            return status.HTTP_201_CREATED, DiagnosisResponse.model_validate(diagnosis).model_dump(mode="json")
+        if isinstance(mutation, DeleteDiagnosisMutation):
+            await self.diagnosis_service.delete_diagnosis(mutation.diagnosis_id, user_id)
+            return status.HTTP_204_NO_CONTENT, None
+        raise ValueError(f"Unsupported mutation {mutation.op}")
+
+    async def apply(self, user_id: int, mutations: List[Mutation]) -> List[dict]:
+        """
+        Apply a batch of operations in order
+
+        Operations whose client ID was already applied (by an earlier batch
+        or earlier in this one) are not applied again; their recorded
+        outcome is returned. Failed operations are not recorded, so the
+        client may retry them.
+
+        Args:
+            user_id: User ID
+            mutations: Operations in the order they were queued
+
+        Returns:
+            One MutationResult dict per operation, in request order
+        """
+        session = self.repository.session
+        applied: Dict[str, Outcome] = await self.repository.get_applied(
+            user_id, (mutation.client_id for mutation in mutations)
+        )
+        results = []
+        for mutation in mutations:
+            result = {"client_id": mutation.client_id, "op": mutation.op}
+            if mutation.client_id in applied:
+                status_code, outcome = applied[mutation.client_id]
+                results.append({**result, "status": status_code, "result": outcome, "replayed": True})
+                continue
+            try:
+                async with session.begin_nested():
+                    status_code, outcome = await self._apply_one(user_id, mutation)
+                    await self.repository.add(
+                        user_id, mutation.client_id, status_code, outcome, datetime.now(timezone.utc)
+                    )
+            except HTTPException as exc:
+                results.append({**result, "status": exc.status_code, "error": exc.detail})
+                continue
+            except SQLAlchemyError as exc:
+                # The savepoint is already rolled back; the rest of the batch goes on
+                logger.warning(f"Mutation {mutation.client_id} of user {user_id} failed: {exc}")
+                results.append({**result, **_database_error(exc)})
+                continue
+            applied[mutation.client_id] = (status_code, outcome)
+            results.append({**result, "status": status_code, "result": outcome})
+
+        failed = sum(1 for result in results if "error" in result)
+        logger.info(f"Applied mutation batch for user {user_id}: {len(results) - failed} ok, {failed} failed")
+        return results
@@ -2,68 +2,217 @@
 Plant service containing business logic
 """
 
-from typing import Optional, List
+from typing import Iterable, Optional, List, Tuple
 from fastapi import HTTPException, status
-from datetime import datetime, timezone
+from sqlalchemy.engine import Row
+from datetime import datetime, timedelta, timezone
 
 from app.models.plant import Plant
 from app.models.activity import Activity, ActivityType
+from app.db.unit_of_work import UnitOfWork
+from app.repositories.activity_repository import add_activities
+from app.read_models.plant_rows import PlantReadRepository, PlantRow
 from app.repositories.plant_repository import PlantRepository
+from app.repositories.profile_repository import ProfileRepository
+from app.repositories.sync_repository import SyncRepository
+from app.repositories.user_data_version_repository import UserDataVersionRepository
 from app.schemas.plant_schema import PlantCreate, PlantUpdate
 from app.services.activity_service import get_activity_title
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+GARDEN_HEALTH_FIELDS = ("plant_count", "on_time", "overdue", "never_watered", "unscheduled")
+
+
+def is_watered_on_time(
+    last_watered: Optional[datetime], watering_frequency_days: Optional[int], now: datetime
+) -> bool:
+    """
+    Whether a plant is still within its species' watering interval
+
+    Args:
+        last_watered: When the plant was last watered
+        watering_frequency_days: Species watering interval
+        now: Reference time
+
+    Returns:
+        True if the plant was watered less than one interval ago
+    """
+    if not last_watered or not watering_frequency_days:
+        return False
+    if last_watered.tzinfo is None:
+        last_watered = last_watered.replace(tzinfo=timezone.utc)
+    return (now - last_watered).days < watering_frequency_days
+
+
+def next_watering_at(
+    last_watered: Optional[datetime], watering_frequency_days: Optional[int], unwatered_due: datetime
+) -> Optional[datetime]:
+    """
+    When a plant is next due for water
+
+    Matches is_watered_on_time: a plant stops being on time exactly when
+    ``now >= next_watering_at(...)``.
+
+    Args:
+        last_watered: When the plant was last watered
+        watering_frequency_days: Species watering interval
+        unwatered_due: Due time for a plant that was never watered
+
+    Returns:
+        Next watering time, or None if the species has no interval
+    """
+    if not watering_frequency_days:
+        return None
+    if not last_watered:
+        return unwatered_due
+    if last_watered.tzinfo is None:
+        last_watered = last_watered.replace(tzinfo=timezone.utc)
+    return last_watered + timedelta(days=watering_frequency_days)
+
+
+def care_rate(plant_count: int, on_time: int) -> int:
+    """
+    Care rate percentage: share of plants currently watered on time
+
+    Args:
+        plant_count: Number of plants
+        on_time: Number of plants within their watering interval
+
+    Returns:
+        Care rate as integer percentage (0-100)
+    """
+    if not plant_count:
+        return 100  # No plants = perfect care rate
+    return int((on_time / plant_count) * 100)
+
+
+def _watering_frequency(plant: Plant) -> Optional[int]:
+    return plant.species.watering_frequency_days if plant.species else None
+
 
 class PlantService:
     """
     Plant service with business logic for plant operations
     """
 
-    def __init__(self, repository: PlantRepository):
+    def __init__(self, repository: PlantRepository, profile_repository: ProfileRepository):
         """
         Initialize plant service
 
         Args:
             repository: Plant repository instance
+            profile_repository: Profile repository, for the care counters
         """
         self.repository = repository
+        self.profile_repository = profile_repository
+        self.uow = UnitOfWork(repository.session)
+        self.read_repository = PlantReadRepository(repository.session)
+        self.data_versions = UserDataVersionRepository(repository.session)
+        self.sync_repository = SyncRepository(repository.session)
 
     async def create_plant(self, user_id: int, data: PlantCreate) -> Plant:
         """
         Create a new plant for a user
+
+        The watering state is computed from the species first, so the plant
+        is written with a single INSERT.
         """
-        plant = await self.repository.create(
-            user_id=user_id,
-            **data.model_dump(exclude_unset=True),
-        )
+        species = await self.repository.get_species_watering_frequency(data.species_id)
+        if species is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Species not found")
+        now = datetime.now(timezone.utc)
+        frequency = species.watering_frequency_days
+        async with self.uow:
+            plant = await self.repository.create(
+                user_id=user_id,
+                watered_on_time=is_watered_on_time(data.last_watered, frequency, now),
+                next_water_at=next_watering_at(data.last_watered, frequency, now),
+                **data.model_dump(exclude_unset=True),
+            )
 
-        # Create activity for plant added
-        activity = Activity(
-            user_id=user_id,
-            plant_id=plant.id,
-            activity_type=ActivityType.PLANT_ADDED,
-            title=get_activity_title(ActivityType.PLANT_ADDED),
-            created_at=datetime.now(timezone.utc)
-        )
-        self.repository.session.add(activity)
-        await self.repository.session.commit()
+            # Create activity for plant added
+            activity = Activity(
+                user_id=user_id,
+                plant_id=plant.id,
+                activity_type=ActivityType.PLANT_ADDED,
+                title=get_activity_title(ActivityType.PLANT_ADDED),
+                created_at=datetime.now(timezone.utc)
+            )
+            self.repository.session.add(activity)
+
+            await self.profile_repository.increment_stats(
+                user_id, plant_count=1, plants_watered_on_time=int(plant.watered_on_time)
+            )
+            await self.data_versions.bump(user_id)
 
         logger.info(f"Created plant '{plant.plant_name}' (ID: {plant.id}) for user {user_id}")
         return plant
 
-    async def get_plant_by_id(self, plant_id: int, user_id: int) -> Optional[Plant]:
+    async def get_plant_by_id(self, plant_id: int, user_id: int) -> Optional[PlantRow]:
         """
         Get a single plant belonging to a user
+
+        Returns a read-model row: one query, where loading the ORM plant
+        would also pull its diagnoses, activities and owner.
+        """
+        return await self.read_repository.get_by_id_for_user(plant_id=plant_id, user_id=user_id)
+
+    async def get_user_plants(
+        self, user_id: int, skip: int = 0, limit: int = 100, after: Optional[Tuple[int]] = None
+    ) -> List[PlantRow]:
+        """
+        List plants for a user (paginated by offset or by keyset cursor)
+
+        Returns read-model rows rather than ORM objects; see app.read_models.
+        """
+        return await self.read_repository.get_all_for_user(
+            user_id=user_id, skip=skip, limit=limit, after=after
+        )
+
+    async def get_due_plants(
+        self,
+        user_id: int,
+        within_hours: int = 24,
+        limit: int = 50,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> List[PlantRow]:
+        """
+        List a user's plants due for water within the next hours, overdue first
+        """
+        before = datetime.now(timezone.utc) + timedelta(hours=within_hours)
+        return await self.read_repository.get_due_for_user(
+            user_id=user_id, before=before, limit=limit, after=after
+        )
+
+    @staticmethod
+    def garden_health(user_id: int, counts) -> dict:
         """
-        return await self.repository.get_by_id_for_user(plant_id=plant_id, user_id=user_id)
+        Build a garden health dict from an aggregate row (or None for no plants)
+        """
+        health = {"user_id": user_id}
+        for field in GARDEN_HEALTH_FIELDS:
+            health[field] = getattr(counts, field) if counts is not None else 0
+        health["care_rate"] = care_rate(health["plant_count"], health["on_time"])
+        return health
+
+    async def get_garden_health(self, user_id: int) -> dict:
+        """
+        Count a user's plants by watering state, computed in the database
+        """
+        counts = await self.repository.get_garden_health(user_id, datetime.now(timezone.utc))
+        return self.garden_health(user_id, counts)
 
-    async def get_user_plants(self, user_id: int, skip: int = 0, limit: int = 100) -> List[Plant]:
+    async def get_garden_health_for_users(self, user_ids: Iterable[int]) -> List[dict]:
         """
-        List plants for a user (paginated)
+        Garden health for many users at once (admin reports, digest emails)
         """
-        return await self.repository.get_all_for_user(user_id=user_id, skip=skip, limit=limit)
+        user_ids = list(dict.fromkeys(user_ids))
+        counts = await self.repository.get_garden_health_for_users(
+            user_ids, datetime.now(timezone.utc)
+        )
+        return [self.garden_health(user_id, counts.get(user_id)) for user_id in user_ids]
 
     async def update_plant(self, plant_id: int, user_id: int, data: PlantUpdate) -> Plant:
         """
@@ -74,7 +223,27 @@ class PlantService:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Plant not found")
 
         update_data = data.model_dump(exclude_unset=True)
-        updated = await self.repository.update(plant_id, user_id=user_id, **update_data)
+        species_id = update_data.get("species_id")
+        if species_id is not None and not await self.repository.species_exists(species_id):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Species not found")
+        was_on_time = plant.watered_on_time
+        async with self.uow:
+            updated = await self.repository.update(plant_id, user_id=user_id, **update_data)
+            if "last_watered" in update_data or "species_id" in update_data:
+                now = datetime.now(timezone.utc)
+                frequency = _watering_frequency(updated)
+                updated.watered_on_time = is_watered_on_time(updated.last_watered, frequency, now)
+                # A never-watered plant keeps its original due time
+                updated.next_water_at = next_watering_at(
+                    updated.last_watered, frequency, updated.next_water_at or now
+                )
+                await self.profile_repository.increment_stats(
+                    user_id,
+                    plants_watered_on_time=int(updated.watered_on_time) - int(was_on_time),
+                )
+            if "plant_name" in update_data:
+                await self.repository.touch_diagnoses(plant_id, datetime.now(timezone.utc))
+            await self.data_versions.bump(user_id)
 
         logger.info(f"Updated plant ID {plant_id} for user {user_id}")
         return updated
@@ -83,9 +252,15 @@ class PlantService:
         """
         Delete a plant (must belong to user)
         """
-        deleted = await self.repository.delete(plant_id=plant_id, user_id=user_id)
-        if not deleted:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Plant not found")
+        async with self.uow:
+            await self.sync_repository.tombstone_plant(plant_id, user_id, datetime.now(timezone.utc))
+            deleted = await self.repository.delete(plant_id=plant_id, user_id=user_id)
+            if not deleted:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Plant not found")
+            await self.profile_repository.increment_stats(
+                user_id, plant_count=-1, plants_watered_on_time=-int(deleted.watered_on_time)
+            )
+            await self.data_versions.bump(user_id)
         logger.info(f"Deleted plant ID {plant_id} for user {user_id}")
         return True
 
@@ -105,21 +280,77 @@ class PlantService:
         if not plant:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Plant not found")
         
-        # Update last_watered to now
         now = datetime.now(timezone.utc)
-        update_data = PlantUpdate(last_watered=now.isoformat())
-        updated_plant = await self.repository.update(plant_id, user_id=user_id, last_watered=now)
-        
-        # Create activity log with plant name
-        activity = Activity(
-            user_id=user_id,
-            plant_id=plant.id,
-            activity_type=ActivityType.WATERED,
-            title=get_activity_title(ActivityType.WATERED, plant_name=plant.plant_name),
-            created_at=now
-        )
-        self.repository.session.add(activity)
-        await self.repository.session.commit()
+        async with self.uow:
+            # Update last_watered to now and schedule the next watering
+            plant.last_watered = now
+            plant.next_water_at = next_watering_at(now, _watering_frequency(plant), now)
+
+            # Create activity log with plant name
+            activity = Activity(
+                user_id=user_id,
+                plant_id=plant.id,
+                activity_type=ActivityType.WATERED,
+                title=get_activity_title(ActivityType.WATERED, plant_name=plant.plant_name),
+                created_at=now
+            )
+            self.repository.session.add(activity)
+
+            # Watering starts a new interval, so the plant is on time again
+            was_on_time = plant.watered_on_time
+            plant.watered_on_time = is_watered_on_time(now, _watering_frequency(plant), now)
+            await self.profile_repository.increment_stats(
+                user_id, plants_watered_on_time=int(plant.watered_on_time) - int(was_on_time)
+            )
+            await self.data_versions.bump(user_id)
         
         logger.info(f"Watered plant '{plant.plant_name}' (ID: {plant_id}) for user {user_id}")
-        return updated_plant
+        return plant
+
+    async def water_plants(self, plant_ids: List[int], user_id: int) -> List[Row]:
+        """
+        Water several plants in one transaction
+
+        Ownership is checked in one query, all plants are updated with one
+        UPDATE ... RETURNING and their activities are added with one
+        multi-row INSERT. Nothing is watered if any plant is missing.
+
+        Args:
+            plant_ids: Plant IDs
+            user_id: User ID
+
+        Returns:
+            Watered plants, in request order
+        """
+        plant_ids = list(dict.fromkeys(plant_ids))
+        now = datetime.now(timezone.utc)
+        async with self.uow:
+            owned = await self.repository.get_watering_state(user_id, plant_ids)
+            if len(owned) != len(plant_ids):
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Plant not found")
+            was_on_time = sum(row.watered_on_time for row in owned)
+
+            updated = await self.repository.mark_watered(user_id, plant_ids, now)
+            by_id = {plant.id: plant for plant in updated}
+            watered = [by_id[plant_id] for plant_id in plant_ids]
+            await add_activities(
+                [
+                    {
+                        "user_id": user_id,
+                        "plant_id": plant.id,
+                        "activity_type": ActivityType.WATERED,
+                        "title": get_activity_title(ActivityType.WATERED, plant_name=plant.plant_name),
+                        "created_at": now,
+                    }
+                    for plant in watered
+                ],
+                self.repository.session,
+            )
+            await self.profile_repository.increment_stats(
+                user_id,
+                plants_watered_on_time=sum(plant.watered_on_time for plant in watered) - was_on_time,
+            )
+            await self.data_versions.bump(user_id)
+
+        logger.info(f"Watered {len(watered)} plants for user {user_id}")
+        return watered
@@ -1,19 +1,91 @@
 """
 PlantSpecies service containing business logic
 """
-from typing import Optional, List
+import asyncio
+from datetime import datetime, timezone
+from typing import Dict, Optional, List, Tuple
 from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.models.plant_species import PlantSpecies
+from app.core.species_cache import SPECIES_CACHE, SpeciesCache, species_cache
+from app.read_models.plant_rows import SpeciesRow
+from app.repositories.cache_version_repository import CacheVersionRepository
+from app.repositories.plant_repository import PlantRepository
 from app.repositories.plant_species_repository import PlantSpeciesRepository
+from app.repositories.sync_repository import SyncRepository
+from app.repositories.user_data_version_repository import UserDataVersionRepository
 from app.schemas.plant_species_schema import PlantSpeciesCreate, PlantSpeciesUpdate
+from app.utils.species_search import rank, species_search_index
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+
+async def sync_species_cache(session: AsyncSession) -> bool:
+    """
+    Reload the species cache if its version moved (or it is not loaded)
+
+    The version is read before the catalog: a write committed in between
+    leaves the cache with newer data under an older version, which only
+    causes one extra reload, never a missed one.
+
+    Args:
+        session: Database session to read with
+
+    Returns:
+        True if the cache was reloaded
+    """
+    version = await CacheVersionRepository(session).get(SPECIES_CACHE)
+    if species_cache.loaded and species_cache.version == version:
+        return False
+    species_cache.load(await PlantSpeciesRepository(session).get_all_rows(), version)
+    species_search_index.invalidate()
+    logger.info(f"Loaded {len(species_cache.all())} species into the cache (version {version})")
+    return True
+
+
+async def poll_species_cache(session_factory: async_sessionmaker, interval_seconds: float) -> None:
+    """
+    Keep the species cache in step with writes made by other workers
+
+    Runs until cancelled; started from the application lifespan.
+
+    Args:
+        session_factory: Session factory for the primary database
+        interval_seconds: Seconds between version checks
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            async with session_factory() as session:
+                await sync_species_cache(session)
+        except Exception:
+            logger.exception("Species cache refresh failed; serving the cached catalog")
+
+
 class PlantSpeciesService:
-    def __init__(self, repository: PlantSpeciesRepository):
+    def __init__(self, repository: PlantSpeciesRepository, plant_repository: PlantRepository):
         self.repository = repository
+        self.plant_repository = plant_repository
+        self.cache_versions = CacheVersionRepository(repository.session)
+        self.data_versions = UserDataVersionRepository(repository.session)
+        self.sync_repository = SyncRepository(repository.session)
+
+    async def _cache(self) -> SpeciesCache:
+        """
+        The species cache, loaded through this session if needed (read-through)
+        """
+        if not species_cache.loaded:
+            await sync_species_cache(self.repository.session)
+        return species_cache
+
+    async def _species_changed(self) -> None:
+        """
+        Record a species write: bump the shared version, drop this worker's copy
+        """
+        await self.cache_versions.bump(SPECIES_CACHE)
+        species_cache.invalidate_on_commit(self.repository.session)
 
     async def create(self, data: PlantSpeciesCreate) -> PlantSpecies:
         # enforce unique common_name
@@ -22,39 +94,108 @@ class PlantSpeciesService:
             raise HTTPException(status_code=400, detail="Species common_name already exists")
 
         obj = await self.repository.create(**data.model_dump(exclude_unset=True))
+        await self._species_changed()
         logger.info(f"Created species '{obj.common_name}' (ID: {obj.id})")
         return obj
 
-    async def get_by_id(self, species_id: int) -> Optional[PlantSpecies]:
-        return await self.repository.get_by_id(species_id)
+    async def get_by_id(self, species_id: int) -> Optional[SpeciesRow]:
+        """Get species by ID, from the species cache"""
+        return (await self._cache()).get(species_id)
 
-    async def get_species_by_name(self, scientific_name: str) -> Optional[PlantSpecies]:
-        """Get species by scientific name (for AI identification)"""
-        return await self.repository.get_by_scientific_name(scientific_name)
+    async def get_species_by_name(self, scientific_name: str) -> Optional[SpeciesRow]:
+        """Get species by scientific name (for AI identification), from the species cache"""
+        return (await self._cache()).get_by_scientific_name(scientific_name)
     
-    async def get_species_by_common_name(self, common_name: str) -> Optional[PlantSpecies]:
-        """Get species by common name (for AI identification fallback)"""
-        return await self.repository.get_by_common_name(common_name)
+    async def get_species_by_common_name(self, common_name: str) -> Optional[SpeciesRow]:
+        """Get species by common name (for AI identification fallback), from the species cache"""
+        return (await self._cache()).get_by_common_name(common_name)
 
     async def create_species(self, data: PlantSpeciesCreate) -> PlantSpecies:
         """Create species without enforcing unique constraint (for AI auto-creation)"""
         obj = await self.repository.create(**data.model_dump(exclude_unset=True))
+        await self._species_changed()
         logger.info(f"Auto-created species '{obj.scientific_name}' from AI identification")
         return obj
 
-    async def list(self, skip: int = 0, limit: int = 100) -> List[PlantSpecies]:
-        return await self.repository.get_all(skip, limit)
+    async def list(
+        self, skip: int = 0, limit: int = 100, after: Optional[Tuple[str, int]] = None
+    ) -> List[SpeciesRow]:
+        """List species by (common_name, id), from the species cache"""
+        return (await self._cache()).page(skip, limit, after=after)
+
+    async def search(self, query: str, limit: int = 20) -> List[Dict]:
+        """
+        Typo-tolerant search over common and scientific names
+
+        Prefix and substring matches rank above merely similar names, and
+        species with more plants rank higher. PostgreSQL searches with
+        pg_trgm; other databases use the in-process trigram index.
+
+        Args:
+            query: Search text
+            limit: Maximum number of results
+
+        Returns:
+            Dicts with the species, its plant count and its score, best first
+        """
+        if self.repository.session.get_bind().dialect.name == "postgresql":
+            rows = await self.repository.search_trigram(query, limit)
+            return [
+                {"species": species, "plant_count": plant_count, "score": round(score, 4)}
+                for species, plant_count, score in rows
+            ]
+
+        cache = await self._cache()
+        if not species_search_index.is_fresh():
+            species_search_index.build(
+                (record.id, record.common_name, record.scientific_name) for record in cache.all()
+            )
+        scores = species_search_index.match(query)
+        counts = await self.repository.count_plants(scores)
+        ranked = rank(scores, counts, limit)
+        results = []
+        for species_id, score in ranked:
+            species = cache.get(species_id)
+            if species is not None:
+                results.append(
+                    {"species": species, "plant_count": counts.get(species_id, 0), "score": round(score, 4)}
+                )
+        return results
 
     async def update(self, species_id: int, data: PlantSpeciesUpdate) -> PlantSpecies:
-        updated = await self.repository.update(species_id, **data.model_dump(exclude_unset=True))
+        update_data = data.model_dump(exclude_unset=True)
+        frequency_changed = False
+        if "watering_frequency_days" in update_data:
+            current = await self.repository.get_by_id(species_id)
+            frequency_changed = (
+                current is not None
+                and current.watering_frequency_days != update_data["watering_frequency_days"]
+            )
+        updated = await self.repository.update(species_id, **update_data)
         if not updated:
             raise HTTPException(status_code=404, detail="Species not found")
+        await self._species_changed()
+        await self.data_versions.bump_species_owners(species_id)
+        if frequency_changed:
+            # Every plant of this species gets a new watering schedule
+            await self.plant_repository.reschedule_species(
+                species_id, updated.watering_frequency_days, datetime.now(timezone.utc)
+            )
+        else:
+            # Plant rows embed their species, so mark them changed for delta
+            # sync (rescheduling does that itself)
+            await self.plant_repository.touch_species_plants(species_id, datetime.now(timezone.utc))
         logger.info(f"Updated species ID {species_id}")
         return updated
 
     async def delete(self, species_id: int) -> bool:
+        # The species' plants are deleted with it; bump their owners and
+        # record the deletions while the plants still name them
+        await self.data_versions.bump_species_owners(species_id)
+        await self.sync_repository.tombstone_species_plants(species_id, datetime.now(timezone.utc))
         ok = await self.repository.delete(species_id)
         if not ok:
             raise HTTPException(status_code=404, detail="Species not found")
+        await self._species_changed()
         logger.info(f"Deleted species ID {species_id}")
         return True
@@ -3,14 +3,15 @@ Profile service containing business logic
 """
 
 from typing import Optional
-from datetime import datetime, timezone
 from fastapi import HTTPException, status
 
 from app.models.profile import Profile
 from app.repositories.profile_repository import ProfileRepository
 from app.repositories.user_repository import UserRepository
 from app.repositories.plant_repository import PlantRepository
+from app.repositories.user_data_version_repository import UserDataVersionRepository
 from app.schemas.profile_schema import ProfileCreate, ProfileUpdate
+from app.services.plant_service import care_rate
 from app.core.logging import get_logger
 
 
@@ -39,51 +40,49 @@ class ProfileService:
         self.repository = repository
         self.user_repository = user_repository
         self.plant_repository = plant_repository
+        self.data_versions = UserDataVersionRepository(repository.session)
 
-    async def _calculate_care_rate(self, user_id: int) -> int:
+    def _to_response(self, profile: Profile, full_name: Optional[str]) -> dict:
         """
-        Calculate care rate percentage based on plants watered on time
+        Convert a profile to a response dict with computed fields
+        """
+        plant_count = profile.plant_count or 0
+        return {
+            "id": profile.id,
+            "user_id": profile.user_id,
+            "full_name": full_name,
+            "tagline": profile.tagline,
+            "age": profile.age,
+            "experience_level": profile.experience_level,
+            "experience_start_date": profile.experience_start_date,
+            "living_situation": profile.living_situation,
+            "city": profile.city,
+            "country": profile.country,
+            "plant_count": plant_count,
+            "care_rate": care_rate(plant_count, profile.plants_watered_on_time),
+            "created_at": profile.created_at,
+            "updated_at": profile.updated_at,
+        }
+
+    async def find_profile_by_user_id(self, user_id: int) -> Optional[dict]:
+        """
+        Get profile by user ID with computed fields, or None if the user has none
+
+        The plant count and care counters are kept up to date by PlantService
+        (and corrected by the reconciliation job), so this is a single SELECT.
 
         Args:
             user_id: User ID
 
         Returns:
-            Care rate as integer percentage (0-100)
+            Profile dict with computed fields (care_rate, full_name) or None
         """
-        # Get all plants for the user
-        plants = await self.plant_repository.get_all_for_user(
-            user_id=user_id, skip=0, limit=1000
-        )
-
-        if not plants:
-            return 100  # No plants = perfect care rate
-
-        plants_on_time = 0
-        now = datetime.now(timezone.utc)
-
-        for plant in plants:
-            # Skip if plant has never been watered
-            if not plant.last_watered:
-                continue
-
-            # Calculate days since last watered
-            last_watered = plant.last_watered
-            if last_watered.tzinfo is None:
-                last_watered = last_watered.replace(tzinfo=timezone.utc)
+        row = await self.repository.get_with_full_name(user_id)
+        if not row:
+            return None
 
-            days_since_watered = (now - last_watered).days
-
-            # Check if plant was watered on time
-            if (
-                plant.species
-                and plant.species.watering_frequency_days
-                and days_since_watered < plant.species.watering_frequency_days
-            ):
-                plants_on_time += 1
-
-        # Calculate percentage
-        care_rate = int((plants_on_time / len(plants)) * 100)
-        return care_rate
+        profile, full_name = row
+        return self._to_response(profile, full_name)
 
     async def get_profile_by_user_id(self, user_id: int) -> dict:
         """
@@ -98,44 +97,13 @@ class ProfileService:
         Raises:
             HTTPException: If profile not found
         """
-        profile = await self.repository.get_by_user_id(user_id)
-        if not profile:
+        profile = await self.find_profile_by_user_id(user_id)
+        if profile is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Profile not found for user ID {user_id}",
             )
-
-        # Get user to fetch full_name
-        user = await self.user_repository.get_by_id(user_id)
-
-        # Auto-update plant_count from actual plant count
-        actual_plant_count = await self.plant_repository.count_plants_for_user(user_id)
-        if profile.plant_count != actual_plant_count:
-            await self.repository.update(profile.id, plant_count=actual_plant_count)
-            profile.plant_count = actual_plant_count
-
-        # Calculate care rate
-        care_rate = await self._calculate_care_rate(user_id)
-
-        # Convert to dict and add computed fields
-        profile_dict = {
-            "id": profile.id,
-            "user_id": profile.user_id,
-            "full_name": user.full_name if user else None,
-            "tagline": profile.tagline,
-            "age": profile.age,
-            "experience_level": profile.experience_level,
-            "experience_start_date": profile.experience_start_date,
-            "living_situation": profile.living_situation,
-            "city": profile.city,
-            "country": profile.country,
-            "plant_count": profile.plant_count,
-            "care_rate": care_rate,
-            "created_at": profile.created_at,
-            "updated_at": profile.updated_at,
-        }
-
-        return profile_dict
+        return profile
 
     async def create_profile(self, user_id: int, profile_data: ProfileUpdate) -> dict:
         """
@@ -166,19 +134,23 @@ class ProfileService:
                 detail=f"Profile already exists for user ID {user_id}",
             )
 
-        # Auto-calculate plant_count
-        actual_plant_count = await self.plant_repository.count_plants_for_user(user_id)
+        # Seed the care counters; PlantService keeps them current from here on
+        plant_count, plants_watered_on_time = await self.plant_repository.get_care_counts(user_id)
 
         # Create profile
         profile_dict = profile_data.model_dump(exclude_unset=True)
         profile = await self.repository.create(
-            user_id=user_id, plant_count=actual_plant_count, **profile_dict
+            user_id=user_id,
+            plant_count=plant_count,
+            plants_watered_on_time=plants_watered_on_time,
+            **profile_dict,
         )
+        await self.data_versions.bump(user_id)
 
         logger.info(f"Created profile for user ID: {user_id}")
 
         # Return with computed fields
-        return await self.get_profile_by_user_id(user_id)
+        return self._to_response(profile, user.full_name)
 
     async def update_profile_by_user_id(
         self, user_id: int, profile_data: ProfileUpdate
@@ -197,22 +169,19 @@ class ProfileService:
             HTTPException: If profile not found
         """
         # Get existing profile
-        profile = await self.repository.get_by_user_id(user_id)
-        if not profile:
+        row = await self.repository.get_with_full_name(user_id)
+        if not row:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Profile not found for user ID {user_id}",
             )
+        profile, full_name = row
 
-        # Auto-calculate plant_count
-        actual_plant_count = await self.plant_repository.count_plants_for_user(user_id)
-
-        # Update profile with auto-calculated plant_count
         update_data = profile_data.model_dump(exclude_unset=True)
-        update_data["plant_count"] = actual_plant_count
         updated_profile = await self.repository.update(profile.id, **update_data)
+        await self.data_versions.bump(user_id)
 
         logger.info(f"Updated profile for user ID: {user_id}")
 
         # Return with computed fields
-        return await self.get_profile_by_user_id(user_id)
+        return self._to_response(updated_profile, full_name)
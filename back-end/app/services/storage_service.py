@@ -19,6 +19,10 @@ class StorageService:
     Service for managing file uploads to Supabase Storage
     """
 
+    # Bucket names
+    PLANT_IMAGES_BUCKET = "plant-images"
+    DIAGNOSIS_IMAGES_BUCKET = "diagnosis-images"
+
     def __init__(self):
         """Initialize Supabase client"""
         if not settings.SUPABASE_URL or not settings.SUPABASE_KEY:
@@ -30,10 +34,6 @@ class StorageService:
             settings.SUPABASE_URL, 
             settings.SUPABASE_KEY
         )
-        
-        # Bucket names
-        self.PLANT_IMAGES_BUCKET = "plant-images"
-        self.DIAGNOSIS_IMAGES_BUCKET = "diagnosis-images"
 
 
     async def upload_plant_image(
@@ -170,8 +170,15 @@ class StorageService:
         Returns:
             True if deleted successfully
         """
+        if not self.client:
+            return False
+
         try:
-            response = self.client.storage.from_(bucket_name).remove([file_path])
+            # Run the sync removal in a thread pool like the uploads
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(
+                None, self.client.storage.from_(bucket_name).remove, [file_path]
+            )
             logger.info(f"Image deleted: {file_path}")
             return True
         except Exception as e:
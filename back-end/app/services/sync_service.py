@@ -0,0 +1,103 @@
+"""
+Delta sync service for the mobile client
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.sync_tombstone import SYNC_DIAGNOSIS, SYNC_PLANT
+from app.read_models.diagnosis_rows import DiagnosisReadRepository
+from app.read_models.plant_rows import PlantReadRepository
+from app.repositories.sync_repository import SyncRepository
+from app.repositories.user_data_version_repository import UserDataVersionRepository
+from app.services.profile_service import ProfileService
+from app.utils.pagination import decode_cursor, encode_cursor
+
+
+class SyncService:
+    """
+    Sends a user's plants, diagnoses and profile changed since a watermark
+
+    A watermark is an opaque token of (time, user data version). The
+    version, which every write to the user's data bumps, answers "nothing
+    changed" with one primary-key lookup; otherwise rows whose updated_at
+    is at or after the time are sent, plus tombstones for deletions.
+    """
+
+    def __init__(self, session: AsyncSession, profile_service: ProfileService):
+        """
+        Initialize sync service
+
+        Args:
+            session: Database session (the primary: a lagging replica could
+                let rows slip under a watermark)
+            profile_service: Profile service, for the profile response
+        """
+        self.profile_service = profile_service
+        self.plant_rows = PlantReadRepository(session)
+        self.diagnosis_rows = DiagnosisReadRepository(session)
+        self.sync_repository = SyncRepository(session)
+        self.data_versions = UserDataVersionRepository(session)
+
+    async def get_changes(self, user_id: int, watermark: Optional[str] = None) -> dict:
+        """
+        Get what changed for a user since a watermark
+
+        Without a watermark, or with one older than the tombstone retention,
+        everything is sent as a full sync.
+
+        Args:
+            user_id: User ID
+            watermark: Watermark of the client's previous sync
+
+        Returns:
+            Dict in the SyncResponse shape, with read-model rows
+
+        Raises:
+            HTTPException: If the watermark is malformed
+        """
+        now = datetime.now(timezone.utc)
+        version = await self.data_versions.get(user_id)
+        since: Optional[datetime] = None
+        if watermark:
+            since, synced_version = decode_cursor(watermark, datetime, int)
+            if since.tzinfo is None:
+                # Watermarks are always issued in UTC; a naive time was not issued here
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid pagination cursor"
+                )
+            if synced_version == version:
+                # No write since; keep the old time, a transaction may still be committing
+                return {
+                    "watermark": watermark,
+                    "full": False,
+                    "plants": [],
+                    "diagnoses": [],
+                    "profile": None,
+                    "deleted": {"plants": [], "diagnoses": []},
+                }
+            if since < now - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS):
+                since = None
+
+        next_watermark = encode_cursor(
+            now - timedelta(seconds=settings.SYNC_WATERMARK_OVERLAP_SECONDS), version
+        )
+        plants = await self.plant_rows.get_changed_for_user(user_id, since)
+        diagnoses = await self.diagnosis_rows.get_changed_for_user(user_id, since)
+        deleted = {"plants": [], "diagnoses": []}
+        if since is not None:
+            keys = {SYNC_PLANT: "plants", SYNC_DIAGNOSIS: "diagnoses"}
+            for entity, entity_id in await self.sync_repository.get_tombstones(user_id, since):
+                deleted[keys[entity]].append(entity_id)
+        return {
+            "watermark": next_watermark,
+            "full": since is None,
+            "plants": plants,
+            "diagnoses": diagnoses,
+            "profile": await self.profile_service.find_profile_by_user_id(user_id),
+            "deleted": deleted,
+        }
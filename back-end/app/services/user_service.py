@@ -2,18 +2,79 @@
 User service containing business logic
 """
 
-from typing import Optional, List
+from datetime import datetime
+from typing import Optional, List, Tuple
 from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import async_sessionmaker
 
+from app.core.config import settings
+from app.models.activity import Activity, ActivityArchive
+from app.models.diagnosis import Diagnosis
+from app.models.plant import Plant
 from app.models.user import User
+from app.repositories.account_deletion_repository import AccountDeletionRepository
+from app.repositories.user_data_version_repository import UserDataVersionRepository
 from app.repositories.user_repository import UserRepository
 from app.schemas.user_schema import UserCreate, UserUpdate
 from app.core.security import get_password_hash, verify_password, create_access_token
+from app.core.principal_cache import Principal, principal_cache
 from app.core.logging import get_logger
+from app.services.storage_service import StorageService
 
 
 logger = get_logger(__name__)
 
+# What background deletion removes, in order, with the bucket holding each
+# table's images. Children go first so each batch stays small.
+PURGE_STEPS = (
+    (Diagnosis, StorageService.DIAGNOSIS_IMAGES_BUCKET),
+    (Plant, StorageService.PLANT_IMAGES_BUCKET),
+    (Activity, None),
+    (ActivityArchive, None),
+)
+
+
+async def purge_account(
+    session_factory: async_sessionmaker, user_id: int, batch_size: Optional[int] = None
+) -> int:
+    """
+    Delete a user's data in bounded batches, then the user
+
+    Each batch is its own short transaction, so a large account never holds
+    locks for long; an interrupted purge is resumed by
+    ``python -m app.jobs.purge_accounts``. Plant and diagnosis images are
+    queued in storage_cleanup rather than removed inline.
+
+    Args:
+        session_factory: Factory for the sessions the batches run in
+        user_id: User ID
+        batch_size: Rows per batch (defaults to ACCOUNT_DELETION_BATCH_SIZE)
+
+    Returns:
+        Number of deleted rows, not counting the user
+    """
+    batch_size = batch_size or settings.ACCOUNT_DELETION_BATCH_SIZE
+    removed = 0
+    for model, image_bucket in PURGE_STEPS:
+        while True:
+            async with session_factory() as session:
+                deleted = await AccountDeletionRepository(session).delete_owned_batch(
+                    model, user_id, batch_size, image_bucket
+                )
+                if deleted:
+                    await UserDataVersionRepository(session).bump(user_id)
+                await session.commit()
+            removed += deleted
+            if deleted < batch_size:
+                break
+
+    async with session_factory() as session:
+        await AccountDeletionRepository(session).delete_user(user_id)
+        await session.commit()
+    principal_cache.invalidate(user_id)
+    logger.info(f"Purged user with ID: {user_id} ({removed} rows)")
+    return removed
+
 
 class UserService:
     """
@@ -28,6 +89,7 @@ class UserService:
             repository: User repository instance
         """
         self.repository = repository
+        self.data_versions = UserDataVersionRepository(repository.session)
 
     async def create_user(self, user_data: UserCreate) -> User:
         """
@@ -81,6 +143,28 @@ class UserService:
         """
         return await self.repository.get_by_id(user_id)
 
+    async def get_principal(self, user_id: int) -> Optional[Principal]:
+        """
+        Get the authenticated principal for a user, served from cache when possible
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            Principal or None if the user does not exist
+        """
+        principal = principal_cache.get(user_id)
+        if principal is not None:
+            return principal
+
+        row = await self.repository.get_principal_fields(user_id)
+        if row is None:
+            return None
+
+        principal = Principal.from_user(row)
+        principal_cache.set(principal)
+        return principal
+
     async def get_user_by_email(self, email: str) -> Optional[User]:
         """
         Get user by email
@@ -105,18 +189,21 @@ class UserService:
         """
         return await self.repository.get_by_username(username)
 
-    async def get_all_users(self, skip: int = 0, limit: int = 100) -> List[User]:
+    async def get_all_users(
+        self, skip: int = 0, limit: int = 100, after: Optional[Tuple[int]] = None
+    ) -> List[User]:
         """
         Get all users with pagination
 
         Args:
             skip: Number of records to skip
             limit: Maximum number of records
+            after: Keyset cursor ``(id,)`` of the last user of the previous page
 
         Returns:
             List of users
         """
-        return await self.repository.get_all(skip=skip, limit=limit)
+        return await self.repository.get_all(skip=skip, limit=limit, after=after)
 
     async def update_user(self, user_id: int, user_data: UserUpdate) -> User:
         """
@@ -157,13 +244,16 @@ class UserService:
                     detail="Username already taken",
                 )
 
-        # Hash password if being updated
+        # Hash password if being updated and revoke tokens issued before the change
         if "password" in update_data:
             update_data["hashed_password"] = get_password_hash(
                 update_data.pop("password")
             )
+            update_data["token_version"] = (user.token_version or 0) + 1
 
         updated_user = await self.repository.update(user_id, **update_data)
+        await self.data_versions.bump(user_id)
+        principal_cache.invalidate_on_commit(user_id, self.repository.session)
         logger.info(f"Updated user: {updated_user.username} (ID: {user_id})")
 
         return updated_user
@@ -186,10 +276,37 @@ class UserService:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
             )
+        principal_cache.invalidate_on_commit(user_id, self.repository.session)
 
         logger.info(f"Deleted user with ID: {user_id}")
         return True
 
+    async def request_user_deletion(self, user_id: int) -> bool:
+        """
+        Deactivate a user and queue them for background deletion
+
+        The user can no longer sign in or use existing tokens; their data is
+        removed afterwards by purge_account.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            True if queued
+
+        Raises:
+            HTTPException: If user not found
+        """
+        marked = await self.repository.mark_for_deletion(user_id, datetime.utcnow())
+        if not marked:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+            )
+        principal_cache.invalidate_on_commit(user_id, self.repository.session)
+
+        logger.info(f"Queued user with ID {user_id} for deletion")
+        return True
+
     async def get_user_by_id_with_plants(self, user_id: int) -> Optional[User]:
         return await self.repository.get_by_id_with_plants(user_id)
 
@@ -241,7 +358,9 @@ class UserService:
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-        access_token = create_access_token(data={"sub": str(user.id)})
+        access_token = create_access_token(
+            data={"sub": str(user.id), "ver": user.token_version or 0}
+        )
         logger.info(f"User logged in: {user.username} (ID: {user.id})")
 
         return access_token
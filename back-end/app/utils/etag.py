@@ -0,0 +1,51 @@
+"""
+ETag helpers for conditional GET requests
+"""
+
+import hashlib
+import json
+from typing import Any, Optional
+
+
+def make_etag(*parts: Any, weak: bool = True) -> str:
+    """
+    Build an ETag from values that identify a response's content
+
+    Args:
+        *parts: JSON-serializable values (datetimes are stringified)
+        weak: Build a weak ETag; pass False only when equal parts mean a
+            byte-identical response
+
+    Returns:
+        ETag, e.g. ``W/"3f2a..."`` (weak) or ``"3f2a..."`` (strong)
+    """
+    raw = json.dumps(parts, default=str, separators=(",", ":")).encode()
+    tag = f'"{hashlib.sha1(raw).hexdigest()}"'
+    return f"W/{tag}" if weak else tag
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag
+
+    Uses the weak comparison RFC 9110 prescribes for If-None-Match, so weak
+    and strong tags with the same value match.
+
+    Args:
+        if_none_match: Value of the If-None-Match request header
+        etag: Current ETag
+
+    Returns:
+        True if the client's cached copy is current
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    def opaque(tag: str) -> str:
+        tag = tag.strip()
+        return tag[2:] if tag.startswith("W/") else tag
+
+    current = opaque(etag)
+    return any(opaque(tag) == current for tag in if_none_match.split(","))
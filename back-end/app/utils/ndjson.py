@@ -0,0 +1,63 @@
+"""
+Newline-delimited JSON (NDJSON) helpers for streaming request and response bodies
+"""
+
+from typing import Any, AsyncIterable, AsyncIterator, Tuple
+
+import orjson
+from fastapi import HTTPException, status
+
+from app.utils.serialization import ORJSON_OPTIONS
+
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def dump_line(record: Any) -> bytes:
+    """
+    Serialize one record as an NDJSON line (with its trailing newline)
+    """
+    return orjson.dumps(record, option=ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE)
+
+
+async def iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[Tuple[int, dict]]:
+    """
+    Parse an NDJSON byte stream one line at a time
+
+    Only the current, incomplete line is buffered, so memory does not grow
+    with the size of the body. Blank lines are skipped.
+
+    Args:
+        chunks: Body chunks, e.g. ``request.stream()``
+
+    Yields:
+        Tuples of (line_number, parsed object)
+
+    Raises:
+        HTTPException: If a line is not a JSON object
+    """
+    buffer = b""
+    line_number = 0
+
+    def parse(raw: bytes) -> dict:
+        try:
+            value = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            value = None
+        if not isinstance(value, dict):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Line {line_number}: expected a JSON object",
+            )
+        return value
+
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for raw in lines:
+            line_number += 1
+            if raw.strip():
+                yield line_number, parse(raw)
+    if buffer.strip():
+        line_number += 1
+        yield line_number, parse(buffer)
@@ -0,0 +1,91 @@
+"""
+Keyset (cursor) pagination utilities
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Callable, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, Response, status
+
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Encode the sort key of the last row of a page into an opaque cursor
+
+    Args:
+        *values: Sort key values, e.g. (created_at, id)
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *types: type) -> Tuple:
+    """
+    Decode a cursor produced by encode_cursor
+
+    Args:
+        cursor: Cursor string from the client
+        *types: Expected type of each sort key value (datetime, int, str, ...)
+
+    Returns:
+        Tuple of sort key values
+
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded))
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError("cursor arity mismatch")
+        return tuple(
+            datetime.fromisoformat(value) if type_ is datetime else type_(value)
+            for value, type_ in zip(values, types)
+        )
+    except (ValueError, TypeError, binascii.Error):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        )
+
+
+def next_cursor(
+    rows: Sequence[Any], limit: int, key: Callable[[Any], Tuple]
+) -> Optional[str]:
+    """
+    Build the cursor for the page after ``rows``
+
+    Args:
+        rows: Rows of the current page
+        limit: Page size that was requested
+        key: Function returning the sort key of a row
+
+    Returns:
+        Cursor string, or None when this was the last page
+    """
+    if limit <= 0 or len(rows) < limit:
+        return None
+    return encode_cursor(*key(rows[-1]))
+
+
+def set_next_cursor(
+    response: Response, rows: Sequence[Any], limit: int, key: Callable[[Any], Tuple]
+) -> None:
+    """
+    Expose the next-page cursor in the X-Next-Cursor response header
+
+    The body stays a plain list, so clients that page with skip/limit keep working.
+    """
+    cursor = next_cursor(rows, limit, key)
+    if cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = cursor
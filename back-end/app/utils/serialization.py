@@ -0,0 +1,59 @@
+"""
+JSON serialization helpers
+
+The app's default response class is ORJSONResponse. For list endpoints that
+return ORM objects, json_response goes one step further: a cached
+TypeAdapter for the response model validates the objects (from_attributes)
+and dumps them to JSON bytes in a single pydantic-core pass, skipping
+FastAPI's validate -> jsonable data -> dumps round trip.
+"""
+
+from functools import lru_cache
+from typing import Any, Mapping, Optional
+
+import orjson
+from fastapi import Response
+from pydantic import TypeAdapter
+
+# Match Pydantic's datetime format: UTC is written with a "Z" suffix
+ORJSON_OPTIONS = orjson.OPT_UTC_Z
+
+
+@lru_cache(maxsize=None)
+def type_adapter(type_: Any) -> TypeAdapter:
+    """
+    Get the (cached) TypeAdapter for a response type, e.g. ``List[PlantResponse]``
+    """
+    return TypeAdapter(type_)
+
+
+def dump_json(type_: Any, value: Any) -> bytes:
+    """
+    Validate ``value`` (ORM objects allowed) as ``type_`` and dump it to JSON bytes
+    """
+    adapter = type_adapter(type_)
+    return adapter.dump_json(adapter.validate_python(value, from_attributes=True))
+
+
+def json_response(
+    type_: Any, value: Any, status_code: int = 200, headers: Optional[Mapping[str, str]] = None
+) -> Response:
+    """
+    Build a JSON response for ``value`` serialized as ``type_``
+
+    Keep ``response_model`` on the route for the OpenAPI schema; FastAPI
+    does not re-validate a returned Response.
+    """
+    return Response(
+        content=dump_json(type_, value),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
+
+
+def dumps(value: Any) -> bytes:
+    """
+    Serialize plain data (dicts, lists, datetimes, dataclasses) with orjson
+    """
+    return orjson.dumps(value, option=ORJSON_OPTIONS)
@@ -0,0 +1,171 @@
+"""
+Species search scoring and in-process trigram index
+
+On PostgreSQL the species search runs in the database against pg_trgm GIN
+indexes. Other databases (SQLite in tests and local development) search an
+in-process index built with the same trigram rules as pg_trgm, so both paths
+rank results alike.
+"""
+
+import math
+import re
+import time
+from collections import defaultdict
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from app.core.config import settings
+
+# Score = name similarity + match bonus + popularity, used by both search paths
+PREFIX_BONUS = 0.5
+SUBSTRING_BONUS = 0.25
+POPULARITY_WEIGHT = 0.05
+# Minimum similarity for a name that neither starts with nor contains the query
+SIMILARITY_THRESHOLD = 0.3
+
+_WORD = re.compile(r"[^\W_]+")
+
+
+def trigrams(text: str) -> FrozenSet[str]:
+    """
+    Trigrams of a string, following pg_trgm
+
+    Each alphanumeric word is lowercased and padded with two spaces in front
+    and one behind, so ``trigrams("Fern")`` is ``{"  f", " fe", "fer", "ern", "rn "}``.
+    """
+    grams: Set[str] = set()
+    for word in _WORD.findall(text.lower()):
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+def similarity(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    """
+    Share of trigrams two strings have in common (pg_trgm ``similarity``)
+    """
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def popularity(plant_count: int) -> float:
+    """
+    Score bonus for species many plants belong to, growing logarithmically
+    """
+    return POPULARITY_WEIGHT * math.log(1 + plant_count)
+
+
+class _Entry:
+    __slots__ = ("names", "grams", "word_grams")
+
+    def __init__(self, names: Tuple[str, ...]):
+        self.names = tuple(name.lower() for name in names)
+        self.grams = tuple(trigrams(name) for name in names)
+        self.word_grams = tuple(trigrams(word) for name in names for word in _WORD.findall(name))
+
+
+class SpeciesSearchIndex:
+    """
+    Process-local trigram index over species names
+
+    Rebuilt from the database when older than ``ttl_seconds`` or after
+    invalidate(); species writes in this process invalidate it immediately,
+    the TTL bounds staleness for writes made by other workers.
+    """
+
+    def __init__(self, ttl_seconds: int):
+        self._ttl_seconds = ttl_seconds
+        self._built_at: Optional[float] = None
+        self._entries: Dict[int, _Entry] = {}
+        self._postings: Dict[str, Set[int]] = {}
+
+    def is_fresh(self) -> bool:
+        """
+        Whether the index can be searched without a rebuild
+        """
+        return self._built_at is not None and time.monotonic() - self._built_at < self._ttl_seconds
+
+    def build(self, rows: Iterable[Tuple[int, str, Optional[str]]]) -> None:
+        """
+        Replace the index contents
+
+        Args:
+            rows: ``(id, common_name, scientific_name)`` of every species
+        """
+        entries: Dict[int, _Entry] = {}
+        postings: Dict[str, Set[int]] = defaultdict(set)
+        for species_id, common_name, scientific_name in rows:
+            entry = _Entry(tuple(name for name in (common_name, scientific_name) if name))
+            entries[species_id] = entry
+            for grams in entry.grams:
+                for gram in grams:
+                    postings[gram].add(species_id)
+        self._entries = entries
+        self._postings = dict(postings)
+        self._built_at = time.monotonic()
+
+    def invalidate(self) -> None:
+        """
+        Force a rebuild before the next search
+        """
+        self._built_at = None
+
+    def match(self, query: str) -> Dict[int, float]:
+        """
+        Score every species matching a query, before popularity
+
+        A name matches when it starts with or contains the query, or when the
+        query is similar to the whole name or one of its words (a stand-in
+        for pg_trgm ``word_similarity``, so "monstra" finds "Monstera deliciosa").
+
+        Args:
+            query: Search text
+
+        Returns:
+            Mapping of species ID to match score
+        """
+        text = query.strip().lower()
+        query_grams = trigrams(text)
+        candidates: Set[int] = set()
+        for gram in query_grams:
+            candidates.update(self._postings.get(gram, ()))
+        if not query_grams:
+            candidates.update(self._entries)
+
+        scores: Dict[int, float] = {}
+        for species_id in candidates:
+            entry = self._entries[species_id]
+            best = max(
+                (similarity(query_grams, grams) for grams in entry.grams + entry.word_grams),
+                default=0.0,
+            )
+            if any(name.startswith(text) for name in entry.names):
+                scores[species_id] = best + PREFIX_BONUS
+            elif any(text in name for name in entry.names):
+                scores[species_id] = best + SUBSTRING_BONUS
+            elif best >= SIMILARITY_THRESHOLD:
+                scores[species_id] = best
+        return scores
+
+
+def rank(scores: Dict[int, float], plant_counts: Dict[int, int], limit: int) -> List[Tuple[int, float]]:
+    """
+    Add popularity to match scores and keep the best results
+
+    Args:
+        scores: Match score per species ID
+        plant_counts: Number of plants per species ID (missing means none)
+        limit: Maximum number of results
+
+    Returns:
+        ``(species_id, score)`` pairs, best first
+    """
+    ranked = [
+        (species_id, score + popularity(plant_counts.get(species_id, 0)))
+        for species_id, score in scores.items()
+    ]
+    ranked.sort(key=lambda item: (-item[1], item[0]))
+    return ranked[:limit]
+
+
+species_search_index = SpeciesSearchIndex(settings.SPECIES_SEARCH_INDEX_TTL_SECONDS)
@@ -0,0 +1 @@
+"""Performance micro-benchmarks (run manually, not part of the test suite)"""
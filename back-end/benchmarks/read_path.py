@@ -0,0 +1,142 @@
+"""
+Micro-benchmark: ORM + Pydantic list path vs. the read-model path
+
+Loads N plants (with species) for one user both ways and reports the best
+latency over a few repeats and the peak memory allocated during one run:
+
+- orm:  select(Plant) with joinedload(species) -> PlantResponse validation
+        (from_attributes) -> JSON, as the plant list endpoint used to do.
+        Includes the selectin load of Plant.owner that every ORM plant load
+        triggers; Plant.diagnoses/activities are lazy="raise" and never load.
+- rows: PlantReadRepository (Core columns -> __slots__ rows) -> JSON
+
+Runs against a throwaway in-memory SQLite database by default:
+    python -m benchmarks.read_path
+    python -m benchmarks.read_path --rows 1000 10000 --repeat 5
+"""
+
+import argparse
+import asyncio
+import os
+import time
+import tracemalloc
+from typing import Awaitable, Callable, List
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite://")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from pydantic import TypeAdapter  # noqa: E402
+from sqlalchemy import insert, select  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine  # noqa: E402
+from sqlalchemy.orm import joinedload  # noqa: E402
+
+import app.db.base  # noqa: E402,F401  (registers every model with the mapper)
+from app.db.database import Base  # noqa: E402
+from app.models.plant import Plant  # noqa: E402
+from app.models.plant_species import PlantSpecies  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.read_models.plant_rows import PlantReadRepository  # noqa: E402
+from app.schemas.plant_schema import PlantResponse  # noqa: E402
+from app.utils.serialization import dumps  # noqa: E402
+
+USER_ID = 1
+SPECIES_COUNT = 50
+INSERT_BATCH = 5000
+
+plant_list_adapter = TypeAdapter(List[PlantResponse])
+
+
+async def seed(session_factory: async_sessionmaker, rows: int) -> None:
+    async with session_factory() as session:
+        await session.execute(
+            insert(User).values(
+                id=USER_ID, email="bench@example.com", username="bench", hashed_password="x"
+            )
+        )
+        await session.execute(
+            insert(PlantSpecies),
+            [
+                {"id": i, "common_name": f"Species {i}", "watering_frequency_days": 7}
+                for i in range(1, SPECIES_COUNT + 1)
+            ],
+        )
+        for start in range(0, rows, INSERT_BATCH):
+            await session.execute(
+                insert(Plant),
+                [
+                    {
+                        "user_id": USER_ID,
+                        "species_id": i % SPECIES_COUNT + 1,
+                        "plant_name": f"Plant {i}",
+                        "location": "Living room",
+                    }
+                    for i in range(start, min(start + INSERT_BATCH, rows))
+                ],
+            )
+        await session.commit()
+
+
+async def orm_path(session: AsyncSession, rows: int) -> bytes:
+    result = await session.execute(
+        select(Plant)
+        .options(joinedload(Plant.species))
+        .where(Plant.user_id == USER_ID)
+        .order_by(Plant.id.desc())
+        .limit(rows)
+    )
+    plants = result.scalars().all()
+    return plant_list_adapter.dump_json(
+        plant_list_adapter.validate_python(plants, from_attributes=True)
+    )
+
+
+async def rows_path(session: AsyncSession, rows: int) -> bytes:
+    plants = await PlantReadRepository(session).get_all_for_user(USER_ID, limit=rows)
+    return dumps(plants)
+
+
+async def measure(
+    session_factory: async_sessionmaker,
+    path: Callable[[AsyncSession, int], Awaitable[bytes]],
+    rows: int,
+    repeat: int,
+) -> dict:
+    """
+    Best-of-``repeat`` latency, then one traced run for peak allocations
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        async with session_factory() as session:
+            started = time.perf_counter()
+            await path(session, rows)
+            best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    async with session_factory() as session:
+        await path(session, rows)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"ms": best * 1000, "peak_mb": peak / 2**20}
+
+
+async def run(row_counts: List[int], repeat: int) -> None:
+    print(f"{'rows':>8} {'path':>5} {'best ms':>10} {'peak MiB':>9}")
+    for rows in row_counts:
+        engine = create_async_engine("sqlite+aiosqlite://")
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        await seed(session_factory, rows)
+
+        for name, path in (("orm", orm_path), ("rows", rows_path)):
+            stats = await measure(session_factory, path, rows, repeat)
+            print(f"{rows:>8} {name:>5} {stats['ms']:>10.1f} {stats['peak_mb']:>9.1f}")
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(run(args.rows, args.repeat))
@@ -0,0 +1,6 @@
+#!/bin/bash
+# Quick script to apply database migrations in Docker (Mac)
+
+echo "🗄️  Applying database migrations..."
+docker-compose exec backend python -m app.db.migrate
+echo "✅ Done!"
@@ -0,0 +1,98 @@
+"""
+Alembic migration environment
+
+Uses the application's settings and model metadata, and runs migrations
+over the async engine. When a connection is passed in through
+``config.attributes["connection"]`` (see app/db/migrate.py) it is reused
+instead of opening a new one.
+"""
+
+import asyncio
+from logging.config import fileConfig
+
+from sqlalchemy import pool
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from alembic import context
+
+from app.core.config import settings
+from app.db.base import Base
+
+
+config = context.config
+
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    """
+    Leave dialect-specific indexes (``Index(...).ddl_if(dialect=...)``) out of
+    autogenerate comparisons against other dialects
+    """
+    ddl_if = getattr(object, "_ddl_if", None)
+    if type_ == "index" and not reflected and ddl_if is not None and ddl_if.dialect:
+        return context.get_context().dialect.name in (
+            (ddl_if.dialect,) if isinstance(ddl_if.dialect, str) else ddl_if.dialect
+        )
+    return True
+
+
+def run_migrations_offline() -> None:
+    """
+    Run migrations in 'offline' mode, emitting SQL to stdout
+    """
+    context.configure(
+        url=settings.DATABASE_URL,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def do_run_migrations(connection: Connection) -> None:
+    """
+    Run migrations on a synchronous connection
+    """
+    context.configure(
+        connection=connection, target_metadata=target_metadata, include_object=include_object
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_async_migrations() -> None:
+    """
+    Create a short-lived async engine and run migrations through it
+    """
+    connectable = create_async_engine(settings.DATABASE_URL, poolclass=pool.NullPool)
+
+    async with connectable.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+
+    await connectable.dispose()
+
+
+def run_migrations_online() -> None:
+    """
+    Run migrations in 'online' mode
+    """
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        do_run_migrations(connection)
+    else:
+        asyncio.run(run_async_migrations())
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
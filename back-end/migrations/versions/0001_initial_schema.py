@@ -0,0 +1,224 @@
+"""initial schema
+
+Captures the tables previously created by Base.metadata.create_all at
+startup, plus the composite indexes used by keyset pagination.
+
+Databases that were already created by create_all are adopted in place:
+existing tables are left alone and only the missing column and indexes
+are added.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Offline (``alembic upgrade --sql``) there is no database to inspect; the
+# script is generated for an empty one.
+
+
+def _existing_tables() -> set:
+    if context.is_offline_mode():
+        return set()
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+
+def _existing_indexes(table: str) -> set:
+    if context.is_offline_mode():
+        return set()
+    return {index["name"] for index in sa.inspect(op.get_bind()).get_indexes(table)}
+
+
+def _existing_columns(table: str) -> set:
+    if context.is_offline_mode():
+        return set()
+    return {column["name"] for column in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def upgrade() -> None:
+    tables = _existing_tables()
+
+    if "plant_species" not in tables:
+        op.create_table(
+            "plant_species",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("common_name", sa.String(length=100), nullable=False),
+            sa.Column("scientific_name", sa.String(length=150), nullable=True),
+            sa.Column("watering_frequency_days", sa.Integer(), nullable=True),
+            sa.Column("sunlight_hours_needed", sa.Float(), nullable=True),
+            sa.Column("sunlight_type", sa.String(length=50), nullable=True),
+            sa.Column("humidity_preference", sa.String(length=50), nullable=True),
+            sa.Column("temperature_min", sa.Float(), nullable=True),
+            sa.Column("care_difficulty", sa.String(length=50), nullable=True),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("scientific_name"),
+        )
+        op.create_index("ix_plant_species_common_name", "plant_species", ["common_name"], unique=True)
+        op.create_index("ix_plant_species_id", "plant_species", ["id"], unique=False)
+
+    if "users" not in tables:
+        op.create_table(
+            "users",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("email", sa.String(), nullable=False),
+            sa.Column("username", sa.String(), nullable=False),
+            sa.Column("hashed_password", sa.String(), nullable=False),
+            sa.Column("full_name", sa.String(), nullable=True),
+            sa.Column("is_active", sa.Boolean(), nullable=True),
+            sa.Column("is_superuser", sa.Boolean(), nullable=True),
+            sa.Column("token_version", sa.Integer(), server_default="0", nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=True),
+            sa.Column("updated_at", sa.DateTime(), nullable=True),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        op.create_index("ix_users_email", "users", ["email"], unique=True)
+        op.create_index("ix_users_id", "users", ["id"], unique=False)
+        op.create_index("ix_users_username", "users", ["username"], unique=True)
+    elif "token_version" not in _existing_columns("users"):
+        op.add_column(
+            "users",
+            sa.Column("token_version", sa.Integer(), server_default="0", nullable=False),
+        )
+
+    if "plants" not in tables:
+        op.create_table(
+            "plants",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("user_id", sa.Integer(), nullable=False),
+            sa.Column("species_id", sa.Integer(), nullable=False),
+            sa.Column("plant_name", sa.String(length=100), nullable=False),
+            sa.Column("location", sa.String(length=255), nullable=True),
+            sa.Column("last_watered", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("image_url", sa.String(length=500), nullable=True),
+            sa.Column("acquired_date", sa.DateTime(timezone=True), nullable=True),
+            sa.ForeignKeyConstraint(["species_id"], ["plant_species.id"], ondelete="RESTRICT"),
+            sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        op.create_index("ix_plants_id", "plants", ["id"], unique=False)
+        op.create_index("ix_plants_species_id", "plants", ["species_id"], unique=False)
+        op.create_index("ix_plants_user_id", "plants", ["user_id"], unique=False)
+
+    if "profiles" not in tables:
+        op.create_table(
+            "profiles",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("user_id", sa.Integer(), nullable=False),
+            sa.Column("tagline", sa.String(length=255), nullable=True),
+            sa.Column("age", sa.Integer(), nullable=True),
+            sa.Column("living_situation", sa.String(length=255), nullable=True),
+            sa.Column("experience_level", sa.String(length=100), nullable=True),
+            sa.Column("experience_start_date", sa.Date(), nullable=True),
+            sa.Column("city", sa.String(length=100), nullable=True),
+            sa.Column("country", sa.String(length=100), nullable=True),
+            sa.Column("plant_count", sa.Integer(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=True),
+            sa.Column("updated_at", sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        op.create_index("ix_profiles_id", "profiles", ["id"], unique=False)
+        op.create_index("ix_profiles_user_id", "profiles", ["user_id"], unique=True)
+
+    if "diagnoses" not in tables:
+        op.create_table(
+            "diagnoses",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("user_id", sa.Integer(), nullable=False),
+            sa.Column("plant_id", sa.Integer(), nullable=True),
+            sa.Column("plant_common_name", sa.String(length=255), nullable=True),
+            sa.Column("issue_detected", sa.String(length=255), nullable=False),
+            sa.Column("confidence_score", sa.Float(), nullable=False),
+            sa.Column("severity", sa.String(length=50), nullable=False),
+            sa.Column("recommendation", sa.Text(), nullable=True),
+            sa.Column("image_url", sa.String(length=500), nullable=True),
+            sa.Column("recovery_watering", sa.String(length=255), nullable=True),
+            sa.Column("recovery_sunlight", sa.String(length=255), nullable=True),
+            sa.Column("recovery_air_circulation", sa.String(length=255), nullable=True),
+            sa.Column("recovery_temperature", sa.String(length=255), nullable=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+            sa.ForeignKeyConstraint(["plant_id"], ["plants.id"], ondelete="CASCADE"),
+            sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        op.create_index("ix_diagnoses_id", "diagnoses", ["id"], unique=False)
+        op.create_index("ix_diagnoses_plant_id", "diagnoses", ["plant_id"], unique=False)
+        op.create_index("ix_diagnoses_user_id", "diagnoses", ["user_id"], unique=False)
+
+    if "activities" not in tables:
+        op.create_table(
+            "activities",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("user_id", sa.Integer(), nullable=False),
+            sa.Column("plant_id", sa.Integer(), nullable=True),
+            sa.Column("diagnosis_id", sa.Integer(), nullable=True),
+            sa.Column(
+                "activity_type",
+                sa.Enum("PLANT_ADDED", "DIAGNOSIS", "WATERED", name="activitytype"),
+                nullable=False,
+            ),
+            sa.Column("title", sa.String(length=255), nullable=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+            sa.ForeignKeyConstraint(["diagnosis_id"], ["diagnoses.id"]),
+            sa.ForeignKeyConstraint(["plant_id"], ["plants.id"]),
+            sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        op.create_index("ix_activities_id", "activities", ["id"], unique=False)
+
+    # Composite indexes backing keyset pagination; missing from create_all databases
+    if "ix_plants_user_id_id" not in _existing_indexes("plants"):
+        op.create_index("ix_plants_user_id_id", "plants", ["user_id", "id"], unique=False)
+    if "ix_diagnoses_user_id_created_at" not in _existing_indexes("diagnoses"):
+        op.create_index(
+            "ix_diagnoses_user_id_created_at",
+            "diagnoses",
+            ["user_id", "created_at", "id"],
+            unique=False,
+        )
+    if "ix_activities_user_id_created_at" not in _existing_indexes("activities"):
+        op.create_index(
+            "ix_activities_user_id_created_at",
+            "activities",
+            ["user_id", "created_at", "id"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_activities_user_id_created_at", table_name="activities")
+    op.drop_index("ix_activities_id", table_name="activities")
+    op.drop_table("activities")
+    sa.Enum(name="activitytype").drop(op.get_bind(), checkfirst=True)
+    op.drop_index("ix_diagnoses_user_id_created_at", table_name="diagnoses")
+    op.drop_index("ix_diagnoses_user_id", table_name="diagnoses")
+    op.drop_index("ix_diagnoses_plant_id", table_name="diagnoses")
+    op.drop_index("ix_diagnoses_id", table_name="diagnoses")
+    op.drop_table("diagnoses")
+    op.drop_index("ix_profiles_user_id", table_name="profiles")
+    op.drop_index("ix_profiles_id", table_name="profiles")
+    op.drop_table("profiles")
+    op.drop_index("ix_plants_user_id_id", table_name="plants")
+    op.drop_index("ix_plants_user_id", table_name="plants")
+    op.drop_index("ix_plants_species_id", table_name="plants")
+    op.drop_index("ix_plants_id", table_name="plants")
+    op.drop_table("plants")
+    op.drop_index("ix_users_username", table_name="users")
+    op.drop_index("ix_users_id", table_name="users")
+    op.drop_index("ix_users_email", table_name="users")
+    op.drop_table("users")
+    op.drop_index("ix_plant_species_id", table_name="plant_species")
+    op.drop_index("ix_plant_species_common_name", table_name="plant_species")
+    op.drop_table("plant_species")
@@ -0,0 +1,41 @@
+"""profile care stats counters
+
+Adds the per-plant "watered on time" flag and the profile counter that
+together let a profile read its care rate without scanning plants. Run
+``python -m app.jobs.reconcile_profile_stats`` once after upgrading to fill
+them in for existing data.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "plants",
+        sa.Column("watered_on_time", sa.Boolean(), server_default=sa.false(), nullable=False),
+    )
+    op.add_column(
+        "profiles",
+        sa.Column("plants_watered_on_time", sa.Integer(), server_default="0", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("profiles") as batch_op:
+        batch_op.drop_column("plants_watered_on_time")
+    with op.batch_alter_table("plants") as batch_op:
+        batch_op.drop_column("watered_on_time")
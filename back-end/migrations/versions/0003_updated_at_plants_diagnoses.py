@@ -0,0 +1,33 @@
+"""updated_at on plants and diagnoses
+
+Lets the dashboard fingerprint detect edits to plants and diagnoses
+without reading the rows themselves. Existing rows start out NULL.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("plants", sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True))
+    op.add_column("diagnoses", sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("diagnoses") as batch_op:
+        batch_op.drop_column("updated_at")
+    with op.batch_alter_table("plants") as batch_op:
+        batch_op.drop_column("updated_at")
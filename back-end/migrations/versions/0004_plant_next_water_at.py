@@ -0,0 +1,66 @@
+"""plant watering schedule
+
+Persists when each plant is next due for water, indexed per user for the
+due-soon list and globally for the reminder job's keyset scan. Existing
+plants are scheduled from their last watering; never-watered plants become
+due immediately.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.sql_functions import add_days
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("plants", sa.Column("next_water_at", sa.DateTime(timezone=True), nullable=True))
+    op.create_index("ix_plants_user_id_next_water_at", "plants", ["user_id", "next_water_at"])
+    op.create_index("ix_plants_next_water_at_id", "plants", ["next_water_at", "id"])
+
+    plants = sa.table(
+        "plants",
+        sa.column("species_id", sa.Integer),
+        sa.column("last_watered", sa.DateTime(timezone=True)),
+        sa.column("next_water_at", sa.DateTime(timezone=True)),
+    )
+    species = sa.table(
+        "plant_species",
+        sa.column("id", sa.Integer),
+        sa.column("watering_frequency_days", sa.Integer),
+    )
+    frequency = (
+        sa.select(species.c.watering_frequency_days)
+        .where(species.c.id == plants.c.species_id)
+        .scalar_subquery()
+    )
+    op.execute(
+        plants.update()
+        .where(frequency > 0)
+        .values(
+            next_water_at=sa.case(
+                # Evaluated by the database, so offline scripts do not embed the generation time
+                (plants.c.last_watered.is_(None), sa.func.now()),
+                else_=add_days(plants.c.last_watered, frequency),
+            )
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_plants_next_water_at_id", table_name="plants")
+    op.drop_index("ix_plants_user_id_next_water_at", table_name="plants")
+    with op.batch_alter_table("plants") as batch_op:
+        batch_op.drop_column("next_water_at")
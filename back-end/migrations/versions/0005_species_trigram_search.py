@@ -0,0 +1,48 @@
+"""species trigram search
+
+Enables pg_trgm and adds GIN trigram indexes on the species names for the
+typo-tolerant species search. PostgreSQL only; other databases search with
+the in-process n-gram index instead.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_plant_species_common_name_trgm",
+        "plant_species",
+        ["common_name"],
+        postgresql_using="gin",
+        postgresql_ops={"common_name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_plant_species_scientific_name_trgm",
+        "plant_species",
+        ["scientific_name"],
+        postgresql_using="gin",
+        postgresql_ops={"scientific_name": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.drop_index("ix_plant_species_scientific_name_trgm", table_name="plant_species")
+    op.drop_index("ix_plant_species_common_name_trgm", table_name="plant_species")
@@ -0,0 +1,147 @@
+"""partition activities by month
+
+Adds the activities_archive table and, on PostgreSQL, rebuilds activities
+as a table range-partitioned by created_at with one partition per month
+(from the oldest activity through three months ahead) and a default
+partition. The primary key becomes (id, created_at) and ids keep coming
+from the existing sequence. Existing rows are copied over, which rewrites
+the table: run it in a quiet period on large databases.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.db.partitions import ACTIVITY_DEFAULT_PARTITION
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 3
+ACTIVITY_TYPES = ("PLANT_ADDED", "DIAGNOSIS", "WATERED")
+COLUMNS = "id, user_id, plant_id, diagnosis_id, activity_type, title, created_at"
+
+
+def upgrade() -> None:
+    is_postgresql = op.get_bind().dialect.name == "postgresql"
+    activity_type = (
+        postgresql.ENUM(*ACTIVITY_TYPES, name="activitytype", create_type=False)
+        if is_postgresql
+        else sa.Enum(*ACTIVITY_TYPES, name="activitytype")
+    )
+    op.create_table(
+        "activities_archive",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("plant_id", sa.Integer(), nullable=True),
+        sa.Column("diagnosis_id", sa.Integer(), nullable=True),
+        sa.Column("activity_type", activity_type, nullable=False),
+        sa.Column("title", sa.String(length=255), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_activities_archive_user_id_created_at",
+        "activities_archive",
+        ["user_id", "created_at"],
+    )
+    if not is_postgresql:
+        return
+
+    # Move the plain table aside, keeping its id sequence for the new one
+    op.drop_index("ix_activities_user_id_created_at", table_name="activities")
+    op.drop_index("ix_activities_id", table_name="activities")
+    op.execute("ALTER TABLE activities RENAME TO activities_unpartitioned")
+    op.execute("ALTER INDEX activities_pkey RENAME TO activities_unpartitioned_pkey")
+    op.execute("ALTER SEQUENCE activities_id_seq OWNED BY NONE")
+
+    op.execute(
+        """
+        CREATE TABLE activities (
+            id INTEGER NOT NULL DEFAULT nextval('activities_id_seq'),
+            user_id INTEGER NOT NULL REFERENCES users (id),
+            plant_id INTEGER REFERENCES plants (id),
+            diagnosis_id INTEGER REFERENCES diagnoses (id),
+            activity_type activitytype NOT NULL,
+            title VARCHAR(255),
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+            CONSTRAINT activities_pkey PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+        """
+    )
+    op.execute("ALTER SEQUENCE activities_id_seq OWNED BY activities.id")
+    op.execute(f"CREATE TABLE {ACTIVITY_DEFAULT_PARTITION} PARTITION OF activities DEFAULT")
+
+    # Create the monthly partitions covering the existing rows before copying
+    # them: PostgreSQL refuses a range overlapping rows already in the default
+    # partition. Done in PL/pgSQL so offline (``alembic upgrade --sql``)
+    # scripts cover the data of the database they run against too. Names and
+    # bounds match app.db.partitions.
+    op.execute(
+        f"""
+        DO $$
+        DECLARE
+            partition_start timestamp := date_trunc(
+                'month', coalesce((SELECT min(created_at) FROM activities_unpartitioned), now()) AT TIME ZONE 'UTC'
+            );
+            last_month timestamp := date_trunc('month', now() AT TIME ZONE 'UTC') + interval '{MONTHS_AHEAD} months';
+        BEGIN
+            WHILE partition_start <= last_month LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF activities FOR VALUES FROM (%L) TO (%L)',
+                    'activities_p' || to_char(partition_start, 'YYYY_MM'),
+                    partition_start AT TIME ZONE 'UTC',
+                    (partition_start + interval '1 month') AT TIME ZONE 'UTC'
+                );
+                partition_start := partition_start + interval '1 month';
+            END LOOP;
+        END $$
+        """
+    )
+
+    op.execute(f"INSERT INTO activities ({COLUMNS}) SELECT {COLUMNS} FROM activities_unpartitioned")
+    op.execute("DROP TABLE activities_unpartitioned")
+    op.create_index("ix_activities_id", "activities", ["id"])
+    op.create_index("ix_activities_user_id_created_at", "activities", ["user_id", "created_at", "id"])
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_index("ix_activities_user_id_created_at", table_name="activities")
+        op.drop_index("ix_activities_id", table_name="activities")
+        op.execute("ALTER TABLE activities RENAME TO activities_partitioned")
+        op.execute("ALTER INDEX activities_pkey RENAME TO activities_partitioned_pkey")
+        op.execute("ALTER SEQUENCE activities_id_seq OWNED BY NONE")
+        op.execute(
+            """
+            CREATE TABLE activities (
+                id INTEGER NOT NULL DEFAULT nextval('activities_id_seq'),
+                user_id INTEGER NOT NULL REFERENCES users (id),
+                plant_id INTEGER REFERENCES plants (id),
+                diagnosis_id INTEGER REFERENCES diagnoses (id),
+                activity_type activitytype NOT NULL,
+                title VARCHAR(255),
+                created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+                CONSTRAINT activities_pkey PRIMARY KEY (id)
+            )
+            """
+        )
+        op.execute("ALTER SEQUENCE activities_id_seq OWNED BY activities.id")
+        op.execute(f"INSERT INTO activities ({COLUMNS}) SELECT {COLUMNS} FROM activities_partitioned")
+        # Dropping the partitioned parent drops its partitions too
+        op.execute("DROP TABLE activities_partitioned")
+        op.create_index("ix_activities_id", "activities", ["id"])
+        op.create_index("ix_activities_user_id_created_at", "activities", ["user_id", "created_at", "id"])
+
+    op.drop_index("ix_activities_archive_user_id_created_at", table_name="activities_archive")
+    op.drop_table("activities_archive")
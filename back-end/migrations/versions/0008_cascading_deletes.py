@@ -0,0 +1,67 @@
+"""cascading deletes
+
+Makes the activities foreign keys ON DELETE CASCADE like every other child
+table, so deleting a user, plant or diagnosis is a single statement the
+database fans out. Adds users.deletion_requested_at and the storage_cleanup
+queue used by background account deletion.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0008"
+down_revision: Union[str, None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ACTIVITY_FOREIGN_KEYS = (
+    ("user_id", "users"),
+    ("plant_id", "plants"),
+    ("diagnosis_id", "diagnoses"),
+)
+# SQLite foreign keys are unnamed; batch mode names them by this convention
+SQLITE_NAMING = {"fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s"}
+
+
+def _set_activity_ondelete(ondelete: Union[str, None]) -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        for column, referred in ACTIVITY_FOREIGN_KEYS:
+            name = f"activities_{column}_fkey"
+            op.drop_constraint(name, "activities", type_="foreignkey")
+            op.create_foreign_key(name, "activities", referred, [column], ["id"], ondelete=ondelete)
+        return
+
+    with op.batch_alter_table("activities", naming_convention=SQLITE_NAMING) as batch_op:
+        for column, referred in ACTIVITY_FOREIGN_KEYS:
+            name = f"fk_activities_{column}_{referred}"
+            batch_op.drop_constraint(name, type_="foreignkey")
+            batch_op.create_foreign_key(name, referred, [column], ["id"], ondelete=ondelete)
+
+
+def upgrade() -> None:
+    _set_activity_ondelete("CASCADE")
+    op.add_column("users", sa.Column("deletion_requested_at", sa.DateTime(), nullable=True))
+    op.create_table(
+        "storage_cleanup",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("bucket", sa.String(length=100), nullable=False),
+        sa.Column("image_url", sa.Text(), nullable=False),
+        sa.Column("attempts", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("storage_cleanup")
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.drop_column("deletion_requested_at")
+    _set_activity_ondelete(None)
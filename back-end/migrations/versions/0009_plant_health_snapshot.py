@@ -0,0 +1,76 @@
+"""plant health snapshot
+
+Copies each plant's latest diagnosis (id, severity, issue, time) onto the
+plant, so a garden list can show health badges without fetching
+diagnoses. Existing plants are backfilled from their diagnoses.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0009"
+down_revision: Union[str, None] = "0008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("plants", sa.Column("last_diagnosis_id", sa.Integer(), nullable=True))
+    op.add_column("plants", sa.Column("last_severity", sa.String(length=50), nullable=True))
+    op.add_column("plants", sa.Column("last_issue", sa.String(length=255), nullable=True))
+    op.add_column("plants", sa.Column("last_diagnosed_at", sa.DateTime(timezone=True), nullable=True))
+
+    plants = sa.table(
+        "plants",
+        sa.column("id", sa.Integer),
+        sa.column("last_diagnosis_id", sa.Integer),
+        sa.column("last_severity", sa.String),
+        sa.column("last_issue", sa.String),
+        sa.column("last_diagnosed_at", sa.DateTime(timezone=True)),
+    )
+    diagnoses = sa.table(
+        "diagnoses",
+        sa.column("id", sa.Integer),
+        sa.column("plant_id", sa.Integer),
+        sa.column("severity", sa.String),
+        sa.column("issue_detected", sa.String),
+        sa.column("created_at", sa.DateTime(timezone=True)),
+    )
+    op.execute(
+        plants.update().values(
+            last_diagnosis_id=sa.select(diagnoses.c.id)
+            .where(diagnoses.c.plant_id == plants.c.id)
+            .order_by(diagnoses.c.created_at.desc(), diagnoses.c.id.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+    )
+
+    def latest(column):
+        return sa.select(column).where(diagnoses.c.id == plants.c.last_diagnosis_id).scalar_subquery()
+
+    op.execute(
+        plants.update()
+        .where(plants.c.last_diagnosis_id.is_not(None))
+        .values(
+            last_severity=latest(diagnoses.c.severity),
+            last_issue=latest(diagnoses.c.issue_detected),
+            last_diagnosed_at=latest(diagnoses.c.created_at),
+        )
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("plants") as batch_op:
+        batch_op.drop_column("last_diagnosed_at")
+        batch_op.drop_column("last_issue")
+        batch_op.drop_column("last_severity")
+        batch_op.drop_column("last_diagnosis_id")
@@ -0,0 +1,51 @@
+"""plant health rollups
+
+Adds the per-plant diagnosis history summary behind the health trend
+endpoint, and replaces the diagnoses plant_id index with one on
+(plant_id, created_at, id) that also serves the trend's window functions.
+Rollups are filled for existing plants on their next diagnosis write; run
+``python -m app.jobs.refresh_health_rollups`` to fill them all at once.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0010"
+down_revision: Union[str, None] = "0009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_diagnoses_plant_id_created_at", "diagnoses", ["plant_id", "created_at", "id"])
+    op.drop_index("ix_diagnoses_plant_id", table_name="diagnoses")
+    op.create_table(
+        "plant_health_rollups",
+        sa.Column("plant_id", sa.Integer(), nullable=False),
+        sa.Column("diagnosis_count", sa.Integer(), nullable=False),
+        sa.Column("improvements", sa.Integer(), nullable=False),
+        sa.Column("regressions", sa.Integer(), nullable=False),
+        sa.Column("first_diagnosed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_diagnosed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_issue_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("latest_severity_rank", sa.Integer(), nullable=True),
+        sa.Column("previous_severity_rank", sa.Integer(), nullable=True),
+        sa.Column("average_confidence", sa.Float(), nullable=True),
+        sa.Column("refreshed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["plant_id"], ["plants.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("plant_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("plant_health_rollups")
+    op.create_index("ix_diagnoses_plant_id", "diagnoses", ["plant_id"])
+    op.drop_index("ix_diagnoses_plant_id_created_at", table_name="diagnoses")
@@ -0,0 +1,60 @@
+"""delta sync
+
+Adds the (user_id, updated_at) indexes and the tombstone table behind the
+delta sync endpoint. Rows written before updated_at was always set get a
+timestamp, so every row is visible to a delta.
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0012"
+down_revision: Union[str, None] = "0011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    plants = sa.table("plants", sa.column("updated_at", sa.DateTime(timezone=True)))
+    diagnoses = sa.table(
+        "diagnoses",
+        sa.column("created_at", sa.DateTime(timezone=True)),
+        sa.column("updated_at", sa.DateTime(timezone=True)),
+    )
+    op.execute(plants.update().where(plants.c.updated_at.is_(None)).values(updated_at=sa.func.now()))
+    op.execute(
+        diagnoses.update()
+        .where(diagnoses.c.updated_at.is_(None))
+        .values(updated_at=diagnoses.c.created_at)
+    )
+
+    op.create_index("ix_plants_user_id_updated_at", "plants", ["user_id", "updated_at"])
+    op.create_index("ix_diagnoses_user_id_updated_at", "diagnoses", ["user_id", "updated_at"])
+    op.create_table(
+        "sync_tombstones",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("entity", sa.String(length=20), nullable=False),
+        sa.Column("entity_id", sa.Integer(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_sync_tombstones_user_id_deleted_at", "sync_tombstones", ["user_id", "deleted_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_sync_tombstones_user_id_deleted_at", table_name="sync_tombstones")
+    op.drop_table("sync_tombstones")
+    op.drop_index("ix_diagnoses_user_id_updated_at", table_name="diagnoses")
+    op.drop_index("ix_plants_user_id_updated_at", table_name="plants")
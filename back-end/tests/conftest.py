@@ -3,26 +3,76 @@ Pytest configuration and fixtures
 """
 
 import asyncio
-from typing import AsyncGenerator, Generator
+from contextlib import contextmanager
+from typing import AsyncGenerator, Callable, Generator
 import pytest
 from httpx import AsyncClient, ASGITransport
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
 
 from app.main import app
-from app.db.database import Base, get_session
+from app.db.database import (
+    Base,
+    enable_sqlite_foreign_keys,
+    get_read_session_factory,
+    get_session,
+    get_session_factory,
+)
 from app.core.config import settings
+from app.core.principal_cache import principal_cache
+from app.core.species_cache import species_cache
+from app.db.query_stats import reset_endpoint_query_metrics, track_queries
+from app.db.routing import replica_router
+from app.utils.species_search import species_search_index
 
 
 # Test database URL (using SQLite for testing)
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
 
+def enable_sqlite_savepoints(engine: AsyncEngine) -> None:
+    """
+    Let SQLAlchemy, not the sqlite3 driver, begin the test engine's transactions
+
+    The driver only issues BEGIN before a data-changing statement, so a
+    SAVEPOINT (``session.begin_nested()``) can open the transaction itself
+    and commit it when released. With the driver's transaction handling off
+    and an explicit BEGIN, savepoints nest inside the session's transaction
+    as they do on PostgreSQL.
+
+    The in-memory database is one connection shared by every session,
+    including the concurrent ones of the dashboard; a session that begins
+    while the connection is already in a transaction joins it.
+    """
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_driver_transactions(dbapi_connection, _connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _begin(connection):
+        pool_connection = connection.connection
+        # Another session's BEGIN may still be on its way to the driver thread
+        if pool_connection.driver_connection.in_transaction or pool_connection.info.get("beginning"):
+            return
+        pool_connection.info["beginning"] = True
+        try:
+            cursor = pool_connection.cursor()
+            cursor.execute("BEGIN")
+            cursor.close()
+        finally:
+            pool_connection.info["beginning"] = False
+
+
+
 # Create test engine
 test_engine = create_async_engine(
     TEST_DATABASE_URL,
     echo=False,
     future=True,
 )
+enable_sqlite_foreign_keys(test_engine)
+enable_sqlite_savepoints(test_engine)
 
 # Create test session factory
 TestSessionLocal = async_sessionmaker(
@@ -69,9 +119,22 @@ async def client(test_db: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     """
 
     async def override_get_session() -> AsyncGenerator[AsyncSession, None]:
-        yield test_db
+        # Mirror get_session: one commit after the endpoint returns
+        try:
+            yield test_db
+            await test_db.commit()
+        except Exception:
+            await test_db.rollback()
+            raise
 
     app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_read_session_factory] = lambda: TestSessionLocal
+    app.dependency_overrides[get_session_factory] = lambda: TestSessionLocal
+    principal_cache.clear()
+    replica_router.clear()
+    reset_endpoint_query_metrics()
+    species_search_index.invalidate()
+    species_cache.invalidate()
 
     async with AsyncClient(
         transport=ASGITransport(app=app), base_url="http://test"
@@ -79,3 +142,29 @@ async def client(test_db: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield ac
 
     app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def query_budget() -> Callable:
+    """
+    Fail the test if a block runs more SQL statements than declared
+
+    Usage::
+
+        with query_budget(3):
+            await client.get("/api/v1/plants", headers=headers)
+    """
+
+    @contextmanager
+    def budget(max_queries: int):
+        with track_queries() as stats:
+            yield stats
+        if stats.count > max_queries:
+            statements = "\n".join(
+                f"  {count}x {statement[:200]}" for statement, count in stats.fingerprints.most_common()
+            )
+            pytest.fail(
+                f"Ran {stats.count} SQL statements, budget is {max_queries}:\n{statements}"
+            )
+
+    return budget
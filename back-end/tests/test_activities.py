@@ -0,0 +1,64 @@
+"""
+Tests for the activity feed and its archival
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.partitions import add_months, month_start
+from app.jobs.archive_activities import maintain_activities
+from app.models.activity import Activity, ActivityArchive, ActivityType
+from tests.test_users import create_and_login_user
+
+
+@pytest.mark.asyncio
+async def test_activity_feed_spans_months_and_archives_old_events(
+    client: AsyncClient, test_db: AsyncSession, query_budget
+):
+    """
+    Test that the feed pages across month windows and the job archives expired activities
+    """
+    token = await create_and_login_user(client)
+    me = await client.get("/api/v1/users/me", headers={"Authorization": f"Bearer {token}"})
+    user_id = me.json()["id"]
+    this_month = month_start(datetime.now(timezone.utc))
+    await test_db.execute(
+        insert(Activity),
+        [
+            {"user_id": user_id, "activity_type": ActivityType.WATERED, "title": title, "created_at": created_at}
+            for title, created_at in [
+                ("recent", this_month),
+                ("last season", add_months(this_month, -5)),
+                ("last year", add_months(this_month, -11)),
+                ("expired", add_months(this_month, -30)),
+            ]
+        ],
+    )
+    await test_db.commit()
+
+    titles, cursor = [], None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        response = await client.get(f"/api/v1/activities/user/{user_id}", params=params)
+        titles += [activity["title"] for activity in response.json()]
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+    assert titles == ["recent", "last season", "last year", "expired"]
+
+    assert await maintain_activities(test_db, retention_months=12) == 1
+
+    response = await client.get(f"/api/v1/activities/user/{user_id}")
+    assert [activity["title"] for activity in response.json()] == ["recent", "last season", "last year"]
+    archived = await test_db.execute(select(func.count()).select_from(ActivityArchive))
+    assert archived.scalar_one() == 1
+
+    # Nothing older than "recent" is left: one probe ends the feed without reading the empty windows
+    await maintain_activities(test_db, retention_months=0)
+    with query_budget(3):
+        response = await client.get(f"/api/v1/activities/user/{user_id}")
+    assert [activity["title"] for activity in response.json()] == ["recent"]
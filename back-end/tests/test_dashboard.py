@@ -0,0 +1,56 @@
+"""
+Tests for the dashboard endpoint
+"""
+
+import pytest
+from httpx import AsyncClient
+
+from tests.test_plants import create_plant, create_species
+from tests.test_users import create_and_login_user
+
+
+@pytest.mark.asyncio
+async def test_dashboard(client: AsyncClient):
+    """
+    Test the combined overview payload
+    """
+    token = await create_and_login_user(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    species_id = await create_species(client, headers, "Golden Pothos", watering_frequency_days=7)
+    thirsty = await create_plant(client, headers, species_id, "Thirsty")
+    watered = await create_plant(client, headers, species_id, "Watered")
+    await client.post(f"/api/v1/plants/{watered['id']}/water", headers=headers)
+
+    response = await client.get("/api/v1/dashboard", headers=headers)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["stats"]["plant_count"] == 2
+    assert data["stats"]["on_time"] == 1
+    assert [p["id"] for p in data["needs_attention"]] == [thirsty["id"]]
+    assert data["needs_attention"][0]["species_name"] == "Golden Pothos"
+    assert data["recent_activity"][0]["activity_type"] == "watered"
+    assert data["latest_diagnoses"] == []
+
+
+@pytest.mark.asyncio
+async def test_dashboard_conditional_get(client: AsyncClient):
+    """
+    Test that an unchanged dashboard answers 304 and a change invalidates it
+    """
+    token = await create_and_login_user(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    species_id = await create_species(client, headers, "Golden Pothos", watering_frequency_days=7)
+    plant = await create_plant(client, headers, species_id, "Sunny")
+
+    first = await client.get("/api/v1/dashboard", headers=headers)
+    etag = first.headers["ETag"]
+
+    unchanged = await client.get("/api/v1/dashboard", headers={**headers, "If-None-Match": etag})
+    assert unchanged.status_code == 304
+
+    await client.put(f"/api/v1/plants/{plant['id']}", headers=headers, json={"plant_name": "Renamed"})
+
+    changed = await client.get("/api/v1/dashboard", headers={**headers, "If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
@@ -0,0 +1,102 @@
+"""
+Tests for diagnosis endpoints
+"""
+
+import pytest
+from httpx import AsyncClient
+
+from tests.test_plants import create_plant, create_species
+from tests.test_users import create_and_login_user
+
+
+@pytest.mark.asyncio
+async def test_diagnosis_plant_name(client: AsyncClient):
+    """
+    Test that list, detail and per-plant views resolve plant_name the same way
+    """
+    token = await create_and_login_user(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    species_id = await create_species(client, headers, "Golden Pothos", watering_frequency_days=7)
+    plant = await create_plant(client, headers, species_id, "Potty")
+    diagnosis = {"issue_detected": "Aphids", "confidence_score": 0.8, "severity": "Low Severity"}
+    linked = await client.post(
+        "/api/v1/diagnoses/", headers=headers, json={"plant_id": plant["id"], **diagnosis}
+    )
+
+    listed = await client.get("/api/v1/diagnoses/", headers=headers)
+    assert [d["plant_name"] for d in listed.json()] == ["Potty"]
+
+    detail = await client.get(f"/api/v1/diagnoses/{linked.json()['id']}", headers=headers)
+    assert detail.json() == listed.json()[0]
+
+    by_plant = await client.get(f"/api/v1/diagnoses/plant/{plant['id']}", headers=headers)
+    assert by_plant.json() == listed.json()
+
+
+@pytest.mark.asyncio
+async def test_plant_health_snapshot_follows_latest_diagnosis(client: AsyncClient):
+    """
+    Test that the garden list carries the latest diagnosis through create, update and delete
+    """
+    token = await create_and_login_user(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    species_id = await create_species(client, headers, "Golden Pothos", watering_frequency_days=7)
+    plant = await create_plant(client, headers, species_id, "Potty")
+    assert plant["last_diagnosis_id"] is None
+
+    async def health():
+        listed = (await client.get("/api/v1/plants", headers=headers)).json()
+        return listed[0]["last_diagnosis_id"], listed[0]["last_severity"], listed[0]["last_issue"]
+
+    ids = []
+    for issue, severity in [("Aphids", "Low Severity"), ("Root rot", "High Severity")]:
+        response = await client.post(
+            "/api/v1/diagnoses/",
+            headers=headers,
+            json={"plant_id": plant["id"], "issue_detected": issue, "confidence_score": 0.8, "severity": severity},
+        )
+        ids.append(response.json()["id"])
+    assert await health() == (ids[1], "High Severity", "Root rot")
+
+    await client.put(f"/api/v1/diagnoses/{ids[1]}", headers=headers, json={"severity": "Medium Severity"})
+    assert await health() == (ids[1], "Medium Severity", "Root rot")
+
+    await client.delete(f"/api/v1/diagnoses/{ids[1]}", headers=headers)
+    assert await health() == (ids[0], "Low Severity", "Aphids")
+
+    await client.delete(f"/api/v1/diagnoses/{ids[0]}", headers=headers)
+    assert await health() == (None, None, None)
+
+
+@pytest.mark.asyncio
+async def test_plant_health_trend(client: AsyncClient):
+    """
+    Test severity changes, moving confidence and the history summary of the trend endpoint
+    """
+    token = await create_and_login_user(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    species_id = await create_species(client, headers, "Golden Pothos", watering_frequency_days=7)
+    plant = await create_plant(client, headers, species_id, "Potty")
+
+    empty = await client.get(f"/api/v1/diagnoses/plant/{plant['id']}/trend", headers=headers)
+    assert empty.json() == {"plant_id": plant["id"], "summary": None, "points": []}
+
+    for severity, confidence in [("High Severity", 0.6), ("Low Severity", 0.8), ("Medium Severity", 0.7), ("Healthy", 0.9)]:
+        await client.post(
+            "/api/v1/diagnoses/",
+            headers=headers,
+            json={"plant_id": plant["id"], "issue_detected": "Root rot", "confidence_score": confidence, "severity": severity},
+        )
+
+    response = await client.get(f"/api/v1/diagnoses/plant/{plant['id']}/trend?limit=3", headers=headers)
+
+    assert response.status_code == 200
+    trend = response.json()
+    assert [p["severity_rank"] for p in trend["points"]] == [1, 2, 0]
+    assert [p["change"] for p in trend["points"]] == ["improved", "worsened", "improved"]
+    assert trend["points"][-1]["confidence_moving_avg"] == pytest.approx(0.8)
+    summary = trend["summary"]
+    assert (summary["diagnosis_count"], summary["improvements"], summary["regressions"]) == (4, 2, 1)
+    assert summary["trend"] == "improving"
+    assert summary["average_confidence"] == pytest.approx(0.75)
+    assert 0 <= summary["days_since_last_issue"] < 1
@@ -0,0 +1,86 @@
+"""
+Tests for garden export and import endpoints
+"""
+
+import json
+
+import pytest
+from httpx import AsyncClient
+
+from tests.test_plants import create_plant, create_species
+from tests.test_users import create_and_login_user
+
+
+@pytest.mark.asyncio
+async def test_export_and_import_garden(client: AsyncClient):
+    """
+    Test moving a garden from one account to another as NDJSON
+    """
+    token = await create_and_login_user(client, "gardener")
+    headers = {"Authorization": f"Bearer {token}"}
+    species_id = await create_species(client, headers, "Golden Pothos", watering_frequency_days=7)
+    plant = await create_plant(client, headers, species_id, "Potty")
+    await client.post(f"/api/v1/plants/{plant['id']}/water", headers=headers)
+    await client.post(
+        "/api/v1/diagnoses/",
+        headers=headers,
+        json={
+            "plant_id": plant["id"],
+            "issue_detected": "Aphids",
+            "confidence_score": 0.8,
+            "severity": "Low Severity",
+        },
+    )
+
+    export = await client.get("/api/v1/garden/export", headers=headers)
+    assert export.status_code == 200
+    assert export.headers["content-type"] == "application/x-ndjson"
+    records = [json.loads(line) for line in export.text.splitlines()]
+    assert [r["type"] for r in records] == ["header", "plant", "diagnosis"] + ["activity"] * 3
+
+    other_token = await create_and_login_user(client, "newgardener")
+    other_headers = {"Authorization": f"Bearer {other_token}"}
+    imported = await client.post(
+        "/api/v1/garden/import", headers=other_headers, content=export.content
+    )
+    assert imported.status_code == 200
+    assert imported.json() == {"plants": 1, "diagnoses": 1, "activities": 3}
+
+    plants = (await client.get("/api/v1/plants", headers=other_headers)).json()
+    assert [(p["plant_name"], p["species_id"]) for p in plants] == [("Potty", species_id)]
+    assert plants[0]["next_water_at"] is not None
+    diagnoses = (await client.get("/api/v1/diagnoses/", headers=other_headers)).json()
+    assert diagnoses[0]["plant_id"] == plants[0]["id"]
+
+    # A species the import creates is served right away, though the catalog is cached
+    assert (await client.get(f"/api/v1/spieces/{species_id}", headers=headers)).status_code == 200
+    new_plant = {**records[1], "species": {**records[1]["species"], "common_name": "Snake Plant"}}
+    new_plant["species"]["scientific_name"] = "Dracaena trifasciata"
+    lines = [json.dumps(records[0]), json.dumps(new_plant)]
+    await client.post("/api/v1/garden/import", headers=other_headers, content="\n".join(lines).encode())
+    plants = (await client.get("/api/v1/plants", headers=other_headers)).json()
+    (new_species_id,) = {p["species_id"] for p in plants} - {species_id}
+    created = await client.get(f"/api/v1/spieces/{new_species_id}", headers=headers)
+    assert created.status_code == 200
+    assert created.json()["common_name"] == "Snake Plant"
+
+    # Two new common names for one new scientific name create a single species
+    fig = {**new_plant["species"], "scientific_name": "Ficus lyrata"}
+    lines = [json.dumps(records[0])] + [
+        json.dumps({**new_plant, "ref": ref, "species": {**fig, "common_name": name}})
+        for ref, name in [(1, "Fiddle-leaf Fig"), (2, "Banjo Fig")]
+    ]
+    imported = await client.post("/api/v1/garden/import", headers=other_headers, content="\n".join(lines).encode())
+    assert imported.status_code == 200
+    plants = (await client.get("/api/v1/plants", headers=other_headers)).json()
+    figs = [p["species_id"] for p in plants if p["species"]["scientific_name"] == "Ficus lyrata"]
+    assert len(figs) == 2 and len(set(figs)) == 1
+
+    bad = await client.post(
+        "/api/v1/garden/import",
+        headers=other_headers,
+        content=b'{"type": "activity", "plant_ref": 42, "activity_type": "watered", '
+        b'"created_at": "2026-01-01T00:00:00"}\n',
+    )
+    assert bad.status_code == 400
+    assert bad.json()["detail"].startswith("Line 1:")
@@ -4,6 +4,14 @@ Tests for health check endpoint
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.principal_cache import principal_cache
+from app.db.metrics import InstrumentedAsyncQueuePool
+from app.models.user import User
+from tests.test_users import create_and_login_user
 
 
 @pytest.mark.asyncio
@@ -18,3 +26,30 @@ async def test_health_check(client: AsyncClient):
     assert data["status"] == "healthy"
     assert "version" in data
     assert "environment" in data
+
+
+@pytest.mark.asyncio
+async def test_pool_metrics(client: AsyncClient, test_db: AsyncSession):
+    """
+    Test that the primary pool's gauges are exposed to superusers only
+    """
+    assert (await client.get("/metrics")).status_code == 403
+    token = await create_and_login_user(client, "admin")
+    headers = {"Authorization": f"Bearer {token}"}
+    assert (await client.get("/metrics", headers=headers)).status_code == 403
+
+    await test_db.execute(update(User).where(User.username == "admin").values(is_superuser=True))
+    await test_db.commit()
+    principal_cache.clear()
+    response = await client.get("/metrics", headers=headers)
+
+    assert response.status_code == 200
+    primary = response.json()["db_pool"]["primary"]
+    assert {"checkouts", "wait_seconds_avg", "timeouts"} <= primary.keys()
+    # A SQLite DATABASE_URL gets the dialect's default pool, without sizing gauges
+    if primary["pool_class"] == InstrumentedAsyncQueuePool.__name__:
+        assert primary["size"] == settings.DB_POOL_SIZE
+        assert {"checked_out", "overflow"} <= primary.keys()
+
+    compile_cache = response.json()["sql_compile_cache"]["primary"]
+    assert {"hits", "misses", "hit_rate", "uncacheable", "capacity"} <= compile_cache.keys()
@@ -0,0 +1,364 @@
+"""
+Tests for plant endpoints
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import update
+
+from app.core.species_cache import SPECIES_CACHE
+from app.db.query_stats import get_endpoint_query_metrics
+from app.models.plant_species import PlantSpecies
+from app.repositories.cache_version_repository import CacheVersionRepository
+from app.services.plant_species_service import sync_species_cache
+from tests.test_users import create_and_login_user
+
+
+async def create_species(client: AsyncClient, headers: dict, common_name: str, **kwargs) -> int:
+    """
+    Helper function to create a plant species
+
+    Returns:
+        Species ID
+    """
+    response = await client.post(
+        "/api/v1/spieces/",
+        headers=headers,
+        json={"common_name": common_name, **kwargs},
+    )
+    return response.json()["id"]
+
+
+async def create_plant(client: AsyncClient, headers: dict, species_id: int, name: str, **kwargs) -> dict:
+    """
+    Helper function to create a plant
+
+    Returns:
+        Created plant
+    """
+    response = await client.post(
+        "/api/v1/plants",
+        headers=headers,
+        json={"species_id": species_id, "plant_name": name, **kwargs},
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
+@pytest.mark.asyncio
+async def test_list_plants_cursor_pagination(client: AsyncClient):
+    """
+    Test paging through plants with the X-Next-Cursor header
+    """
+    token = await create_and_login_user(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    species_id = await create_species(client, headers, "Golden Pothos", watering_frequency_days=7)
+    for name in ["One", "Two", "Three"]:
+        await create_plant(client, headers, species_id, name)
+
+    first = await client.get("/api/v1/plants?limit=2", headers=headers)
+    assert first.status_code == 200
+    assert [p["plant_name"] for p in first.json()] == ["Three", "Two"]
+    cursor = first.headers["X-Next-Cursor"]
+
+    second = await client.get(f"/api/v1/plants?limit=2&cursor={cursor}", headers=headers)
+    assert [p["plant_name"] for p in second.json()] == ["One"]
+    assert "X-Next-Cursor" not in second.headers
+
+
+@pytest.mark.asyncio
+async def test_list_plants_invalid_cursor(client: AsyncClient):
+    """
+    Test that a malformed cursor is rejected
+    """
+    token = await create_and_login_user(client)
+
+    response = await client.get(
+        "/api/v1/plants?cursor=not-a-cursor",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_water_plant_records_activity(client: AsyncClient):
+    """
+    Test that watering updates the plant and logs an activity in the same transaction
+    """
+    token = await create_and_login_user(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    species_id = await create_species(client, headers, "Golden Pothos", watering_frequency_days=7)
+    plant = await create_plant(client, headers, species_id, "Sunny")
+
+    response = await client.post(f"/api/v1/plants/{plant['id']}/water", headers=headers)
+
+    assert response.status_code == 200
+    assert response.json()["last_watered"] is not None
+    assert response.json()["species"]["common_name"] == "Golden Pothos"
+    activities = await client.get(
+        f"/api/v1/activities/user/{plant['user_id']}", headers=headers
+    )
+    assert [a["activity_type"] for a in activities.json()] == ["watered", "plant_added"]
+
+
+@pytest.mark.asyncio
+async def test_garden_health_counts(client: AsyncClient):
+    """
+    Test counting plants by watering state
+    """
+    token = await create_and_login_user(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    weekly = await create_species(client, headers, "Golden Pothos", watering_frequency_days=7)
+    unscheduled = await create_species(client, headers, "Air Plant")
+    now = datetime.now(timezone.utc)
+
+    await create_plant(client, headers, weekly, "Fresh", last_watered=now.isoformat())
+    await create_plant(
+        client, headers, weekly, "Dry", last_watered=(now - timedelta(days=8)).isoformat()
+    )
+    await create_plant(client, headers, weekly, "New")
+    await create_plant(client, headers, unscheduled, "Airy", last_watered=now.isoformat())
+
+    response = await client.get("/api/v1/plants/health", headers=headers)
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "user_id": response.json()["user_id"],
+        "plant_count": 4,
+        "on_time": 1,
+        "overdue": 1,
+        "never_watered": 1,
+        "unscheduled": 1,
+        "care_rate": 25,
+    }
+
+    forbidden = await client.get("/api/v1/plants/health/users?user_id=1", headers=headers)
+    assert forbidden.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_due_plants_follow_watering_schedule(client: AsyncClient):
+    """
+    Test listing plants due for water and rescheduling on a species change
+    """
+    token = await create_and_login_user(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    weekly = await create_species(client, headers, "Golden Pothos", watering_frequency_days=7)
+    unscheduled = await create_species(client, headers, "Air Plant")
+    now = datetime.now(timezone.utc)
+
+    await create_plant(client, headers, weekly, "Fresh", last_watered=now.isoformat())
+    await create_plant(
+        client, headers, weekly, "Soon", last_watered=(now - timedelta(days=6, hours=12)).isoformat()
+    )
+    await create_plant(
+        client, headers, weekly, "Dry", last_watered=(now - timedelta(days=9)).isoformat()
+    )
+    await create_plant(client, headers, unscheduled, "Airy", last_watered=now.isoformat())
+
+    first = await client.get("/api/v1/plants/due?limit=1", headers=headers)
+    assert first.status_code == 200
+    assert [p["plant_name"] for p in first.json()] == ["Dry"]
+    cursor = first.headers["X-Next-Cursor"]
+    second = await client.get(f"/api/v1/plants/due?limit=1&cursor={cursor}", headers=headers)
+    assert [p["plant_name"] for p in second.json()] == ["Soon"]
+
+    # Halving the interval makes the freshly watered plant due in 3 days too
+    await client.put(f"/api/v1/spieces/{weekly}", headers=headers, json={"watering_frequency_days": 3})
+    due = await client.get("/api/v1/plants/due?within_hours=96", headers=headers)
+    assert [p["plant_name"] for p in due.json()] == ["Dry", "Soon", "Fresh"]
+
+
+@pytest.mark.asyncio
+async def test_water_plants_in_bulk(client: AsyncClient):
+    """
+    Test watering several plants in one request
+    """
+    token = await create_and_login_user(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    species_id = await create_species(client, headers, "Golden Pothos", watering_frequency_days=7)
+    first = await create_plant(client, headers, species_id, "First")
+    second = await create_plant(client, headers, species_id, "Second")
+
+    missing = await client.post(
+        "/api/v1/plants/water", headers=headers, json={"plant_ids": [first["id"], 999]}
+    )
+    assert missing.status_code == 404
+
+    response = await client.post(
+        "/api/v1/plants/water", headers=headers, json={"plant_ids": [second["id"], first["id"]]}
+    )
+    assert response.status_code == 200
+    assert [p["plant_name"] for p in response.json()] == ["Second", "First"]
+    assert all(p["next_water_at"] for p in response.json())
+
+    health = await client.get("/api/v1/plants/health", headers=headers)
+    assert health.json()["on_time"] == 2
+    activities = await client.get(f"/api/v1/activities/user/{first['user_id']}", headers=headers)
+    assert [a["title"] for a in activities.json()][:2] == ["Watered First", "Watered Second"]
+
+
+@pytest.mark.asyncio
+async def test_plant_list_rows_match_plant_response(client: AsyncClient):
+    """
+    Test that the read-model list serializes plants exactly like PlantResponse
+    """
+    token = await create_and_login_user(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    species_id = await create_species(client, headers, "Golden Pothos", watering_frequency_days=7)
+    plant = await create_plant(
+        client, headers, species_id, "Potty", last_watered=datetime.now(timezone.utc).isoformat()
+    )
+
+    listed = await client.get("/api/v1/plants", headers=headers)
+    detail = await client.get(f"/api/v1/plants/{plant['id']}", headers=headers)
+
+    assert listed.json() == [detail.json()]
+
+
+@pytest.mark.asyncio
+async def test_plant_reads_stay_within_query_budget(client: AsyncClient, query_budget):
+    """
+    Test that plant reads do not grow with the number of plants (no N+1)
+    """
+    token = await create_and_login_user(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    species_id = await create_species(client, headers, "Golden Pothos", watering_frequency_days=7)
+    plant = await create_plant(client, headers, species_id, "First")
+    for name in ["Second", "Third", "Fourth", "Fifth", "Sixth"]:
+        await create_plant(client, headers, species_id, name)
+
+    # The user's data version (for the ETag), then the plants
+    with query_budget(2):
+        listing = await client.get("/api/v1/plants", headers=headers)
+    assert listing.status_code == 200
+    assert len(listing.json()) == 6
+    assert listing.headers["Server-Timing"].startswith("db;dur=")
+
+    with query_budget(2):
+        detail = await client.get(f"/api/v1/plants/{plant['id']}", headers=headers)
+    assert detail.status_code == 200
+
+    metrics = get_endpoint_query_metrics()
+    assert metrics["GET /api/v1/plants/{plant_id}"]["queries_max"] == 2
+
+
+@pytest.mark.asyncio
+async def test_plant_reads_answer_conditional_get(client: AsyncClient, query_budget):
+    """
+    Test that user-scoped reads send strong ETags and answer 304 until the user writes
+    """
+    token = await create_and_login_user(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    species_id = await create_species(client, headers, "Golden Pothos", watering_frequency_days=7)
+    plant = await create_plant(client, headers, species_id, "Potty")
+
+    listing = await client.get("/api/v1/plants", headers=headers)
+    etag = listing.headers["ETag"]
+    assert not etag.startswith("W/")
+    assert listing.headers["Cache-Control"] == "private, no-cache"
+
+    with query_budget(1):
+        cached = await client.get("/api/v1/plants", headers={**headers, "If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == etag
+    assert cached.content == b""
+
+    # Another URL of the same user never matches this tag
+    detail = await client.get(
+        f"/api/v1/plants/{plant['id']}", headers={**headers, "If-None-Match": etag}
+    )
+    assert detail.status_code == 200
+
+    await client.post(f"/api/v1/plants/{plant['id']}/water", headers=headers)
+    changed = await client.get("/api/v1/plants", headers={**headers, "If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert changed.json()[0]["last_watered"] is not None
+
+    # Species edits change the embedded species, so they move the owner's tag too
+    etag = changed.headers["ETag"]
+    await client.put(f"/api/v1/spieces/{species_id}", headers=headers, json={"common_name": "Devil's Ivy"})
+    renamed = await client.get("/api/v1/plants", headers={**headers, "If-None-Match": etag})
+    assert renamed.status_code == 200
+    assert renamed.json()[0]["species"]["common_name"] == "Devil's Ivy"
+
+    # Deleting the species takes its plants along
+    etag = renamed.headers["ETag"]
+    await client.delete(f"/api/v1/spieces/{species_id}", headers=headers)
+    emptied = await client.get("/api/v1/plants", headers={**headers, "If-None-Match": etag})
+    assert emptied.status_code == 200
+    assert emptied.json() == []
+
+
+@pytest.mark.asyncio
+async def test_species_search_tolerates_typos(client: AsyncClient):
+    """
+    Test species search by prefix, substring and misspelling, ranked by popularity
+    """
+    token = await create_and_login_user(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    monstera = await create_species(
+        client, headers, "Swiss Cheese Plant", scientific_name="Monstera deliciosa"
+    )
+    await create_species(client, headers, "Golden Pothos", scientific_name="Epipremnum aureum")
+    adansonii = await create_species(
+        client, headers, "Swiss Cheese Vine", scientific_name="Monstera adansonii"
+    )
+    await create_plant(client, headers, adansonii, "Vine")
+
+    prefix = await client.get("/api/v1/spieces/search?q=swiss", headers=headers)
+    assert prefix.status_code == 200
+    # Both are prefix matches; the one with a plant ranks first
+    assert [hit["species"]["id"] for hit in prefix.json()] == [adansonii, monstera]
+    assert prefix.json()[0]["plant_count"] == 1
+
+    substring = await client.get("/api/v1/spieces/search?q=pothos", headers=headers)
+    assert [hit["species"]["common_name"] for hit in substring.json()] == ["Golden Pothos"]
+
+    typo = await client.get("/api/v1/spieces/search?q=monstra deliciosa", headers=headers)
+    assert typo.json()[0]["species"]["id"] == monstera
+
+    await create_species(client, headers, "Fiddle Leaf Fig")
+    added = await client.get("/api/v1/spieces/search?q=fidle", headers=headers)
+    assert [hit["species"]["common_name"] for hit in added.json()] == ["Fiddle Leaf Fig"]
+
+
+@pytest.mark.asyncio
+async def test_species_reads_served_from_cache(client: AsyncClient, test_db, query_budget):
+    """
+    Test species reads skip the database and pick up local and remote writes
+    """
+    token = await create_and_login_user(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    species_id = await create_species(client, headers, "Golden Pothos", watering_frequency_days=7)
+    await client.get(f"/api/v1/spieces/{species_id}", headers=headers)
+
+    with query_budget(0):
+        detail = await client.get(f"/api/v1/spieces/{species_id}", headers=headers)
+        listing = await client.get("/api/v1/spieces/", headers=headers)
+    assert detail.json()["common_name"] == "Golden Pothos"
+    assert [s["id"] for s in listing.json()] == [species_id]
+
+    # A write in this worker is visible to the next read
+    await client.put(
+        f"/api/v1/spieces/{species_id}", headers=headers, json={"common_name": "Devil's Ivy"}
+    )
+    detail = await client.get(f"/api/v1/spieces/{species_id}", headers=headers)
+    assert detail.json()["common_name"] == "Devil's Ivy"
+
+    # A write by another worker is picked up once the version poll runs
+    await test_db.execute(
+        update(PlantSpecies).where(PlantSpecies.id == species_id).values(common_name="Pothos")
+    )
+    await CacheVersionRepository(test_db).bump(SPECIES_CACHE)
+    await test_db.commit()
+    assert (await client.get(f"/api/v1/spieces/{species_id}", headers=headers)).json()[
+        "common_name"
+    ] == "Devil's Ivy"
+    assert await sync_species_cache(test_db)
+    detail = await client.get(f"/api/v1/spieces/{species_id}", headers=headers)
+    assert detail.json()["common_name"] == "Pothos"
@@ -0,0 +1,82 @@
+"""
+Tests for profile endpoints
+"""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.jobs.reconcile_profile_stats import reconcile_profile_stats
+from app.models.plant import Plant
+from app.models.profile import Profile
+from tests.test_plants import create_plant, create_species
+from tests.test_users import create_and_login_user
+
+
+async def create_profile(client: AsyncClient, headers: dict) -> dict:
+    """
+    Helper function to create the current user's profile
+
+    Returns:
+        Created profile
+    """
+    me = await client.get("/api/v1/users/me", headers=headers)
+    response = await client.post(
+        f"/api/v1/profiles/user/{me.json()['id']}", headers=headers, json={"tagline": "Green"}
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
+@pytest.mark.asyncio
+async def test_profile_stats_follow_plant_changes(client: AsyncClient):
+    """
+    Test that plant count and care rate are updated as plants change
+    """
+    token = await create_and_login_user(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    profile = await create_profile(client, headers)
+    assert (profile["plant_count"], profile["care_rate"]) == (0, 100)
+    url = f"/api/v1/profiles/user/{profile['user_id']}"
+
+    species_id = await create_species(client, headers, "Golden Pothos", watering_frequency_days=7)
+    watered = await create_plant(client, headers, species_id, "Watered")
+    await create_plant(client, headers, species_id, "Thirsty")
+    await client.post(f"/api/v1/plants/{watered['id']}/water", headers=headers)
+
+    response = await client.get(url, headers=headers)
+    assert (response.json()["plant_count"], response.json()["care_rate"]) == (2, 50)
+
+    await client.delete(f"/api/v1/plants/{watered['id']}", headers=headers)
+
+    response = await client.get(url, headers=headers)
+    assert (response.json()["plant_count"], response.json()["care_rate"]) == (1, 0)
+
+
+@pytest.mark.asyncio
+async def test_reconcile_profile_stats_fixes_drift(client: AsyncClient, test_db: AsyncSession):
+    """
+    Test that the reconciliation job clears stale flags and corrects counters
+    """
+    token = await create_and_login_user(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    profile = await create_profile(client, headers)
+    species_id = await create_species(client, headers, "Golden Pothos", watering_frequency_days=7)
+    plant = await create_plant(client, headers, species_id, "Never watered")
+
+    # Simulate drift: flag set without a watering, counter off by a few
+    await test_db.execute(
+        update(Plant).where(Plant.id == plant["id"]).values(watered_on_time=True)
+    )
+    await test_db.execute(
+        update(Profile).where(Profile.id == profile["id"]).values(plant_count=5)
+    )
+    await test_db.commit()
+
+    stats = await reconcile_profile_stats(test_db)
+    await test_db.commit()
+
+    assert stats == {"plants_updated": 1, "profiles_corrected": 1}
+    response = await client.get(f"/api/v1/profiles/user/{profile['user_id']}", headers=headers)
+    assert (response.json()["plant_count"], response.json()["care_rate"]) == (1, 0)
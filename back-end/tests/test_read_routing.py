@@ -0,0 +1,43 @@
+"""
+Tests for read-replica session routing
+"""
+
+from starlette.requests import Request
+
+from app.db.routing import ReplicaRouter
+
+
+def make_request(method: str = "GET", token: str = "abc", headers: dict = None) -> Request:
+    """
+    Helper function to build a bare request
+    """
+    raw_headers = [(b"authorization", f"Bearer {token}".encode())]
+    for name, value in (headers or {}).items():
+        raw_headers.append((name.lower().encode(), value.encode()))
+    return Request(
+        {"type": "http", "method": method, "headers": raw_headers, "client": ("127.0.0.1", 1)}
+    )
+
+
+def test_reads_use_replica_until_client_writes():
+    """
+    Test that a client is pinned to the primary after writing
+    """
+    router = ReplicaRouter(sticky_seconds=30)
+
+    assert router.use_primary(make_request()) is False
+
+    router.mark_write(make_request("POST"))
+
+    assert router.use_primary(make_request()) is True
+    assert router.use_primary(make_request(token="other")) is False
+
+
+def test_writes_and_explicit_requests_use_primary():
+    """
+    Test that writes and X-Read-Consistency: primary bypass the replica
+    """
+    router = ReplicaRouter(sticky_seconds=30)
+
+    assert router.use_primary(make_request("PUT")) is True
+    assert router.use_primary(make_request(headers={"X-Read-Consistency": "primary"})) is True
@@ -0,0 +1,156 @@
+"""
+Tests for the delta sync endpoint
+"""
+
+from datetime import datetime
+
+import pytest
+from httpx import AsyncClient
+
+from app.core.config import settings
+from app.utils.pagination import encode_cursor
+from tests.test_plants import create_plant, create_species
+from tests.test_users import create_and_login_user
+
+
+@pytest.mark.asyncio
+async def test_sync_sends_changes_since_watermark(client: AsyncClient, monkeypatch):
+    """
+    Test a full sync, an unchanged refresh, and a delta with updates and deletions
+    """
+    # Without the overlap, the delta holds exactly the rows written after the watermark
+    monkeypatch.setattr(settings, "SYNC_WATERMARK_OVERLAP_SECONDS", 0)
+    token = await create_and_login_user(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    species_id = await create_species(client, headers, "Golden Pothos", watering_frequency_days=7)
+    kept = await create_plant(client, headers, species_id, "Kept")
+    removed = await create_plant(client, headers, species_id, "Removed")
+    diagnosis = {"issue_detected": "Aphids", "confidence_score": 0.8, "severity": "Low Severity"}
+    for plant in (kept, removed):
+        await client.post("/api/v1/diagnoses/", headers=headers, json={"plant_id": plant["id"], **diagnosis})
+
+    full = await client.get("/api/v1/sync", headers=headers)
+    assert full.status_code == 200
+    assert full.json()["full"] is True
+    assert [p["plant_name"] for p in full.json()["plants"]] == ["Kept", "Removed"]
+    assert len(full.json()["diagnoses"]) == 2
+    watermark = full.json()["watermark"]
+
+    unchanged = await client.get("/api/v1/sync", headers=headers, params={"since": watermark})
+    assert unchanged.json() == {
+        "watermark": watermark,
+        "full": False,
+        "plants": [],
+        "diagnoses": [],
+        "profile": None,
+        "deleted": {"plants": [], "diagnoses": []},
+    }
+
+    await client.put(f"/api/v1/plants/{kept['id']}", headers=headers, json={"plant_name": "Renamed"})
+    await client.delete(f"/api/v1/plants/{removed['id']}", headers=headers)
+
+    delta = await client.get("/api/v1/sync", headers=headers, params={"since": watermark})
+    body = delta.json()
+    assert body["full"] is False
+    assert body["watermark"] != watermark
+    assert [p["plant_name"] for p in body["plants"]] == ["Renamed"]
+    # The rename changes the diagnosis' plant_name; the removed plant's diagnosis went with it
+    assert [d["plant_name"] for d in body["diagnoses"]] == ["Renamed"]
+    assert body["deleted"]["plants"] == [removed["id"]]
+    assert len(body["deleted"]["diagnoses"]) == 1
+
+    # Deleting a species takes its plants and their diagnoses along
+    watermark = body["watermark"]
+    await client.delete(f"/api/v1/spieces/{species_id}", headers=headers)
+    body = (await client.get("/api/v1/sync", headers=headers, params={"since": watermark})).json()
+    assert body["plants"] == []
+    assert body["deleted"]["plants"] == [kept["id"]]
+    assert body["deleted"]["diagnoses"] == [d["id"] for d in full.json()["diagnoses"] if d["plant_id"] == kept["id"]]
+
+    bad = await client.get("/api/v1/sync", headers=headers, params={"since": "not-a-watermark"})
+    assert bad.status_code == 400
+    naive = encode_cursor(datetime(2026, 1, 1), 1)
+    assert (await client.get("/api/v1/sync", headers=headers, params={"since": naive})).status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_mutation_batch_applies_each_operation_once(client: AsyncClient):
+    """
+    Test a batch with a failing operation, then the same batch resent
+    """
+    token = await create_and_login_user(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    species_id = await create_species(client, headers, "Golden Pothos", watering_frequency_days=7)
+    kept = await create_plant(client, headers, species_id, "Kept")
+    removed = await create_plant(client, headers, species_id, "Removed")
+    batch = {
+        "operations": [
+            {"op": "water_plant", "client_id": "op-1", "plant_id": kept["id"]},
+            # Fails inside the service's unit of work: only its savepoint is rolled back
+            {"op": "delete_plant", "client_id": "op-2", "plant_id": 999},
+            {
+                "op": "create_diagnosis",
+                "client_id": "op-3",
+                "data": {
+                    "plant_id": kept["id"],
+                    "issue_detected": "Aphids",
+                    "confidence_score": 0.8,
+                    "severity": "Low Severity",
+                },
+            },
+            {"op": "update_plant", "client_id": "op-4", "plant_id": kept["id"], "data": {"location": "Porch"}},
+            {"op": "delete_plant", "client_id": "op-5", "plant_id": removed["id"]},
+        ]
+    }
+
+    response = await client.post("/api/v1/sync/mutations", headers=headers, json=batch)
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["status"] for r in results] == [200, 404, 201, 200, 204]
+    assert results[1]["error"] == "Plant not found"
+    assert results[3]["result"]["location"] == "Porch"
+    assert not any(r["replayed"] for r in results)
+
+    # Resending (e.g. after a lost response) applies nothing twice
+    retried = (await client.post("/api/v1/sync/mutations", headers=headers, json=batch)).json()["results"]
+    assert [r["replayed"] for r in retried] == [True, False, True, True, True]
+    assert retried[0]["result"] == results[0]["result"]
+    assert retried[1]["status"] == 404
+
+    plants = (await client.get("/api/v1/plants", headers=headers)).json()
+    assert [(p["plant_name"], p["location"]) for p in plants] == [("Kept", "Porch")]
+    diagnoses = (await client.get("/api/v1/diagnoses/", headers=headers)).json()
+    assert len(diagnoses) == 1
+    activities = (await client.get(f"/api/v1/activities/user/{kept['user_id']}")).json()
+    assert [a["title"] for a in activities].count("Watered Kept") == 1
+
+
+@pytest.mark.asyncio
+async def test_mutation_batch_reports_database_errors_per_operation(client: AsyncClient):
+    """
+    Test that operations the database rejects fail alone instead of failing the batch
+    """
+    token = await create_and_login_user(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    species_id = await create_species(client, headers, "Golden Pothos", watering_frequency_days=7)
+    plant = await create_plant(client, headers, species_id, "A")
+    batch = {
+        "operations": [
+            {"op": "water_plant", "client_id": "op-1", "plant_id": plant["id"]},
+            {"op": "update_plant", "client_id": "op-2", "plant_id": plant["id"], "data": {"species_id": 9999}},
+            # Violates NOT NULL on flush
+            {"op": "update_plant", "client_id": "op-3", "plant_id": plant["id"], "data": {"plant_name": None}},
+            {"op": "update_plant", "client_id": "op-4", "plant_id": plant["id"], "data": {"location": "Porch"}},
+        ]
+    }
+
+    response = await client.post("/api/v1/sync/mutations", headers=headers, json=batch)
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["status"] for r in results] == [200, 404, 409, 200]
+    assert results[1]["error"] == "Species not found"
+
+    plants = (await client.get("/api/v1/plants", headers=headers)).json()
+    assert [(p["plant_name"], p["species_id"], p["location"]) for p in plants] == [("A", species_id, "Porch")]
+    activities = (await client.get(f"/api/v1/activities/user/{plant['user_id']}")).json()
+    assert [a["title"] for a in activities].count("Watered A") == 1
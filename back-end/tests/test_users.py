@@ -4,6 +4,13 @@ Tests for user endpoints
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.principal_cache import Principal, principal_cache
+from app.models.activity import Activity
+from app.models.storage_cleanup import StorageCleanup
+from app.models.user import User
 
 
 async def create_and_login_user(client: AsyncClient, username: str = "testuser") -> str:
@@ -120,3 +127,91 @@ async def test_update_other_user_forbidden(client: AsyncClient):
     )
 
     assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_password_change_revokes_existing_tokens(client: AsyncClient):
+    """
+    Test that tokens issued before a password change are rejected
+    """
+    token = await create_and_login_user(client)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    me_response = await client.get("/api/v1/users/me", headers=headers)
+    user_id = me_response.json()["id"]
+
+    response = await client.put(
+        f"/api/v1/users/{user_id}",
+        headers=headers,
+        json={"password": "NewPassword123"},
+    )
+    assert response.status_code == 200
+
+    response = await client.get("/api/v1/plants", headers=headers)
+    assert response.status_code == 401
+
+    login = await client.post(
+        "/api/v1/auth/login",
+        json={"username": "testuser", "password": "NewPassword123"},
+    )
+    new_token = login.json()["access_token"]
+    response = await client.get(
+        "/api/v1/plants", headers={"Authorization": f"Bearer {new_token}"}
+    )
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_principal_invalidation_outlasts_the_commit(test_db: AsyncSession):
+    """
+    Test that a principal re-cached while a user change was uncommitted is dropped on commit
+    """
+    principal = Principal(id=42, is_active=True, is_superuser=True, token_version=0)
+    principal_cache.set(principal)
+    principal_cache.invalidate_on_commit(principal.id, test_db)
+    assert principal_cache.get(principal.id) is None
+
+    # A concurrent request reads the still-unchanged row and caches it again
+    principal_cache.set(principal)
+    await test_db.commit()
+    assert principal_cache.get(principal.id) is None
+
+
+@pytest.mark.asyncio
+async def test_delete_user_cascades_in_background(client: AsyncClient, test_db: AsyncSession):
+    """
+    Test that background deletion revokes access, removes owned rows and queues images
+    """
+    admin_token = await create_and_login_user(client, "admin")
+    admin = await client.get("/api/v1/users/me", headers={"Authorization": f"Bearer {admin_token}"})
+    await test_db.execute(update(User).where(User.id == admin.json()["id"]).values(is_superuser=True))
+    await test_db.commit()
+    principal_cache.invalidate(admin.json()["id"])
+    admin_headers = {"Authorization": f"Bearer {admin_token}"}
+
+    token = await create_and_login_user(client, "gardener")
+    headers = {"Authorization": f"Bearer {token}"}
+    user_id = (await client.get("/api/v1/users/me", headers=headers)).json()["id"]
+    species = await client.post("/api/v1/spieces/", headers=headers, json={"common_name": "Golden Pothos"})
+    plant = await client.post(
+        "/api/v1/plants",
+        headers=headers,
+        json={
+            "species_id": species.json()["id"],
+            "plant_name": "Sunny",
+            "image_url": "https://example.supabase.co/storage/v1/object/public/plant-images/1/plant.jpg",
+        },
+    )
+    await client.post(f"/api/v1/plants/{plant.json()['id']}/water", headers=headers)
+
+    response = await client.delete(f"/api/v1/users/{user_id}?background=true", headers=admin_headers)
+
+    assert response.status_code == 202
+    assert (await client.get("/api/v1/plants", headers=headers)).status_code == 401
+    assert (await test_db.execute(select(User).where(User.id == user_id))).first() is None
+    activities = await test_db.execute(select(func.count()).select_from(Activity).where(Activity.user_id == user_id))
+    assert activities.scalar_one() == 0
+    queued = (await test_db.execute(select(StorageCleanup))).scalars().all()
+    assert [(item.bucket, item.image_url) for item in queued] == [
+        ("plant-images", plant.json()["image_url"])
+    ]